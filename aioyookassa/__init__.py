@@ -1,5 +1,5 @@
-from .core import YooKassa
+from .core import YooKassa, YooKassaPool
 
 __version__ = "2.2.4"
 
-__all__ = ["__version__", "YooKassa"]
+__all__ = ["__version__", "YooKassa", "YooKassaPool"]
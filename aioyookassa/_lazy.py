@@ -0,0 +1,38 @@
+"""
+Lazy exports of packages (PEP 562).
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_module(
+    name: str, exports: Mapping[str, Tuple[str, str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create module ``__getattr__`` and ``__dir__`` for lazily imported names.
+
+    An exported name is imported from its submodule on first access and
+    stored in the module, so later lookups do not call ``__getattr__``.
+
+    :param name: Name of the package, i.e. its ``__name__``
+    :param exports: Submodule (relative to the package) and attribute of
+        every exported name
+    :return: ``__getattr__`` and ``__dir__`` functions of the package
+    """
+    namespace = vars(sys.modules[name])
+
+    def __getattr__(attr: str) -> Any:
+        try:
+            module_name, attribute = exports[attr]
+        except KeyError:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}") from None
+        value = getattr(importlib.import_module(module_name, name), attribute)
+        namespace[attr] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
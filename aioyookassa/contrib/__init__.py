@@ -2,6 +2,7 @@
 Contrib module with optional utilities.
 """
 
+from aioyookassa.contrib.sync_client import SyncYooKassa
 from aioyookassa.contrib.webhook_server import WebhookServer
 
-__all__ = ["WebhookServer"]
+__all__ = ["SyncYooKassa", "WebhookServer"]
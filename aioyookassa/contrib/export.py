@@ -0,0 +1,355 @@
+"""
+Streaming export of list endpoints to NDJSON, CSV and Parquet.
+
+Pages of ``get_payments``, ``get_refunds``, ``get_receipts``, ``get_deals``
+(or any other cursor-paginated list method) are written as they arrive, so
+memory use does not depend on the export size. With a checkpoint file an
+interrupted export resumes from the last written cursor.
+"""
+
+import abc
+import csv
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from aioyookassa.core.pagination import ListMethod, iter_pages
+from aioyookassa.types.compact import CompactModel
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+
+def flatten(data: Dict[str, Any], prefix: str = "", sep: str = ".") -> Dict[str, Any]:
+    """
+    Flatten nested dictionaries into dotted column names.
+
+    Lists are kept as JSON strings.
+
+    Example:
+        >>> flatten({"amount": {"value": "10.00", "currency": "RUB"}})
+        {'amount.value': '10.00', 'amount.currency': 'RUB'}
+
+    :param data: Nested dictionary
+    :param prefix: Prefix of the column names
+    :param sep: Separator of the name parts
+    :return: Flat dictionary
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in data.items():
+        name = f"{prefix}{sep}{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name, sep))
+        elif isinstance(value, list):
+            flat[name] = json.dumps(value, ensure_ascii=False)
+        else:
+            flat[name] = value
+    return flat
+
+
+def _to_dict(item: Any) -> Dict[str, Any]:
+    """
+    Convert API object to JSON-compatible dict with API field names.
+
+    :param item: Pydantic model, compact object or dict
+    :return: Dictionary
+    """
+    if isinstance(item, BaseModel):
+        return item.model_dump(mode="json", by_alias=True, exclude_none=True)
+    if isinstance(item, CompactModel):
+        return item.to_dict()
+    return dict(item)
+
+
+class _Writer(abc.ABC):
+    """
+    Base writer of exported rows.
+    """
+
+    def __init__(self, path: str, columns: Optional[List[str]]):
+        self.path = path
+        self.columns = columns
+
+    def open(self, offset: int) -> None:
+        """
+        Open output, dropping data written after the checkpoint.
+
+        :param offset: Output position of the checkpoint
+        """
+
+    @abc.abstractmethod
+    def write(self, items: List[Dict[str, Any]]) -> bool:
+        """
+        Write rows.
+
+        :param items: Rows as nested dicts
+        :return: True if the rows are persisted and may be checkpointed
+        """
+
+    def flush(self) -> None:
+        """Persist buffered rows."""
+
+    def tell(self) -> int:
+        """Get output position to store in the checkpoint."""
+        return 0
+
+    def close(self) -> None:
+        """Close output."""
+
+
+class _FileWriter(_Writer):
+    """
+    Writer appending text lines to a single file.
+    """
+
+    def open(self, offset: int) -> None:
+        mode = "r+" if offset and os.path.exists(self.path) else "w"
+        self._file = open(self.path, mode, encoding="utf-8", newline="")
+        if mode == "r+":
+            # Rows written after the last checkpoint are written again
+            self._file.seek(offset)
+            self._file.truncate()
+        self._init(fresh=mode == "w")
+
+    def _init(self, fresh: bool) -> None:
+        """Prepare writing after opening the file."""
+
+    def write(self, items: List[Dict[str, Any]]) -> bool:
+        self._write(items)
+        self.flush()
+        return True
+
+    @abc.abstractmethod
+    def _write(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Write rows to the file.
+
+        :param items: Rows as nested dicts
+        """
+
+    def flush(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _NDJSONWriter(_FileWriter):
+    """
+    Writer of newline-delimited JSON, one nested object per line.
+    """
+
+    def _write(self, items: List[Dict[str, Any]]) -> None:
+        for item in items:
+            self._file.write(json.dumps(item, ensure_ascii=False))
+            self._file.write("\n")
+
+
+class _CSVWriter(_FileWriter):
+    """
+    Writer of CSV with flattened columns.
+    """
+
+    columns: List[str]
+
+    def _init(self, fresh: bool) -> None:
+        self._csv: Optional["csv.DictWriter[str]"] = None
+        if not fresh:
+            self._csv = self._make_writer()
+
+    def _make_writer(self) -> "csv.DictWriter[str]":
+        return csv.DictWriter(
+            self._file, fieldnames=self.columns, extrasaction="ignore"
+        )
+
+    def _write(self, items: List[Dict[str, Any]]) -> None:
+        rows = [flatten(item) for item in items]
+        if self._csv is None:
+            self._csv = self._make_writer()
+            self._csv.writeheader()
+        self._csv.writerows(rows)
+
+
+class _ParquetWriter(_Writer):
+    """
+    Writer of a Parquet dataset: a directory of part files.
+
+    Rows are buffered up to ``batch_size`` and written as one part file, so
+    an interrupted export resumes with the next part. All columns are stored
+    as nullable strings to keep the schema of every part identical.
+    """
+
+    columns: List[str]
+
+    def __init__(self, path: str, columns: List[str], batch_size: int):
+        super().__init__(path, columns)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:  # pragma: no cover - depends on environment
+            raise ImportError(
+                "Parquet export requires pyarrow: pip install pyarrow"
+            ) from e
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.batch_size = batch_size
+        self._rows: List[Dict[str, Any]] = []
+        self._part = 0
+
+    def open(self, offset: int) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        self._part = offset
+
+    def write(self, items: List[Dict[str, Any]]) -> bool:
+        self._rows.extend(flatten(item) for item in items)
+        if len(self._rows) < self.batch_size:
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        schema = self._pa.schema([(name, self._pa.string()) for name in self.columns])
+        table = self._pa.Table.from_pylist(
+            [
+                {
+                    name: None if row.get(name) is None else str(row[name])
+                    for name in self.columns
+                }
+                for row in self._rows
+            ],
+            schema=schema,
+        )
+        part_path = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+        self._pq.write_table(table, part_path)
+        self._part += 1
+        self._rows = []
+
+    def tell(self) -> int:
+        return self._part
+
+
+def _read_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    if path is None or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        checkpoint: Dict[str, Any] = json.load(file)
+        return checkpoint
+
+
+def _write_checkpoint(path: Optional[str], checkpoint: Dict[str, Any]) -> None:
+    if path is None:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(checkpoint, file)
+    os.replace(tmp_path, path)
+
+
+async def export(
+    method: ListMethod,
+    path: str,
+    file_format: Optional[str] = None,
+    params: Optional[dict] = None,
+    checkpoint: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> int:
+    """
+    Stream all items of a list endpoint to a file.
+
+    NDJSON rows keep the nested API objects. CSV and Parquet rows are
+    flattened to dotted columns (``amount.value``, ``metadata.order_id``)
+    and need ``columns``: objects of one list differ in their fields, so no
+    page shows all of them. Keys missing from ``columns`` are skipped.
+
+    With ``checkpoint`` the cursor of the next page and the output position
+    are saved after every persisted page. Running the export again with the
+    same checkpoint continues from there; rows written after the last
+    checkpoint are discarded and fetched again, so none are duplicated.
+
+    Example:
+        >>> from aioyookassa.contrib.export import export
+        >>> await export(
+        ...     client.payments.get_payments,
+        ...     "payments.csv",
+        ...     params={"limit": 100},
+        ...     checkpoint="payments.checkpoint",
+        ...     columns=["id", "status", "amount.value", "metadata.order_id"],
+        ... )
+
+    :param method: List method, e.g. ``client.refunds.get_refunds``
+    :param path: Output file (a directory for Parquet)
+    :param file_format: ``"ndjson"``, ``"csv"`` or ``"parquet"``. Detected from the
+        path extension if None.
+    :param params: Filter parameters of the list method
+    :param checkpoint: Checkpoint file for resumable exports
+    :param columns: Columns of CSV and Parquet output. Required for them
+        unless the export resumes from a checkpoint.
+    :param batch_size: Rows per Parquet part file
+    :param kwargs: Other arguments of the list method (timeout, deadline, priority)
+    :return: Total number of exported rows
+    :raises ValueError: If the format is unknown or columns of CSV and
+        Parquet output are missing
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lstrip(".").lower()
+        file_format = {"jsonl": "ndjson", "json": "ndjson"}.get(extension, extension)
+    if file_format not in FORMATS:
+        raise ValueError(
+            f"Unknown export format: {file_format!r}, expected one of {FORMATS}"
+        )
+
+    state = _read_checkpoint(checkpoint)
+    if state.get("done"):
+        return int(state["rows"])
+    column_list = list(columns) if columns is not None else state.get("columns")
+    writer: _Writer
+    if file_format == "ndjson":
+        writer = _NDJSONWriter(path, column_list)
+    elif column_list is None:
+        raise ValueError(f"columns are required for {file_format} export")
+    elif file_format == "csv":
+        writer = _CSVWriter(path, column_list)
+    else:
+        writer = _ParquetWriter(path, column_list, batch_size)
+
+    rows = int(state.get("rows", 0))
+    cursor = state.get("cursor")
+    writer.open(state.get("offset", 0))
+    try:
+        async for items, next_cursor in iter_pages(method, params, cursor, **kwargs):
+            rows += len(items)
+            if writer.write([_to_dict(item) for item in items]):
+                _write_checkpoint(
+                    checkpoint,
+                    {
+                        "cursor": next_cursor,
+                        "offset": writer.tell(),
+                        "rows": rows,
+                        "columns": writer.columns,
+                        "done": next_cursor is None,
+                    },
+                )
+        writer.flush()
+        offset = writer.tell()
+    finally:
+        writer.close()
+    _write_checkpoint(
+        checkpoint,
+        {
+            "cursor": None,
+            "offset": offset,
+            "rows": rows,
+            "columns": writer.columns,
+            "done": True,
+        },
+    )
+    return rows
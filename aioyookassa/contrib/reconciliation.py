@@ -0,0 +1,282 @@
+"""
+Reconciliation of local records with YooKassa payments and refunds.
+
+Remote objects are streamed (e.g. by :func:`iter_items` or
+:func:`scan_time_slices`) and joined with the expected records by a hash
+join. Expected records are kept in memory up to ``max_memory_records``;
+larger sets are partitioned to disk by key hash and joined partition by
+partition, so memory use stays bounded for millions of rows.
+"""
+
+import json
+import os
+import tempfile
+import zlib
+from decimal import Decimal, InvalidOperation
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from aioyookassa.types.enum import StrEnum
+
+
+class MismatchType(StrEnum):
+    """
+    Type of a reconciliation mismatch.
+    """
+
+    MISSING = "missing"  # Expected record has no YooKassa object
+    UNEXPECTED = "unexpected"  # YooKassa object has no expected record
+    AMOUNT_DIFFERS = "amount_differs"
+    STATUS_DIFFERS = "status_differs"
+
+
+class Mismatch:
+    """
+    Difference between an expected record and a YooKassa object.
+    """
+
+    __slots__ = ("type", "key", "expected", "actual")
+
+    def __init__(
+        self,
+        type: MismatchType,
+        key: str,
+        expected: Optional[Dict[str, Any]],
+        actual: Optional[Dict[str, Any]],
+    ):
+        """
+        Initialize mismatch.
+
+        :param type: Mismatch type
+        :param key: Join key
+        :param expected: Expected record or None for unexpected objects
+        :param actual: YooKassa object summary (id, status, amount, currency)
+            or None for missing objects
+        """
+        self.type = type
+        self.key = key
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self) -> str:
+        return f"Mismatch(type={self.type!s}, key={self.key!r})"
+
+
+def _get_path(data: Any, path: str) -> Any:
+    """
+    Get value by dotted path from a model or a mapping.
+
+    :param data: Pydantic model or mapping
+    :param path: Dotted path, e.g. ``metadata.order_id``
+    :return: Value or None if it is absent
+    """
+    for name in path.split("."):
+        if data is None:
+            return None
+        if isinstance(data, Mapping):
+            data = data.get(name)
+        else:
+            data = getattr(data, name, None)
+    return data
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+def _summarize(obj: Any) -> Dict[str, Any]:
+    """
+    Get the compared fields of a YooKassa object.
+
+    :param obj: Payment, Refund or a mapping in API notation
+    :return: id, status, amount and currency
+    """
+    status = _get_path(obj, "status")
+    currency = _get_path(obj, "amount.currency")
+    return {
+        "id": _get_path(obj, "id"),
+        # Enums of models are stored by value
+        "status": None if status is None else str(status),
+        "amount": str(_get_path(obj, "amount.value")),
+        "currency": None if currency is None else str(currency),
+    }
+
+
+def _compare(
+    key: str, expected: Dict[str, Any], actual: Dict[str, Any]
+) -> Iterator[Mismatch]:
+    """
+    Compare amount and status of matched records.
+
+    :param key: Join key
+    :param expected: Expected record
+    :param actual: YooKassa object summary
+    :return: Iterator of mismatches
+    """
+    if "amount" in expected and _to_decimal(expected["amount"]) != _to_decimal(
+        actual["amount"]
+    ):
+        yield Mismatch(MismatchType.AMOUNT_DIFFERS, key, expected, actual)
+    if expected.get("status") is not None and str(expected["status"]) != str(
+        actual["status"]
+    ):
+        yield Mismatch(MismatchType.STATUS_DIFFERS, key, expected, actual)
+
+
+def _dumps(key: str, record: Dict[str, Any]) -> str:
+    return json.dumps([key, record], ensure_ascii=False, default=str) + "\n"
+
+
+class _Partitions:
+    """
+    Files of records partitioned by key hash.
+    """
+
+    def __init__(self, directory: str, name: str, count: int):
+        self._paths = [
+            os.path.join(directory, f"{name}-{index}.jsonl") for index in range(count)
+        ]
+        self._files: List[IO[str]] = [
+            open(path, "w", encoding="utf-8") for path in self._paths
+        ]
+
+    def write(self, key: str, record: Dict[str, Any]) -> None:
+        index = zlib.crc32(key.encode()) % len(self._files)
+        self._files[index].write(_dumps(key, record))
+
+    def close(self) -> None:
+        for file in self._files:
+            file.close()
+
+    def read(self, index: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with open(self._paths[index], encoding="utf-8") as file:
+            for line in file:
+                key, record = json.loads(line)
+                yield key, record
+
+
+async def reconcile(
+    remote: AsyncIterable[Any],
+    expected: AsyncIterable[Mapping[str, Any]],
+    key: str = "id",
+    expected_key: str = "id",
+    max_memory_records: int = 100000,
+    partitions: int = 64,
+    spill_dir: Optional[str] = None,
+) -> AsyncIterator[Mismatch]:
+    """
+    Compare expected records with YooKassa objects.
+
+    Expected records are mappings with the join key, the expected ``amount``
+    and optionally ``status``; fields that are absent are not compared.
+    YooKassa objects are joined by ``key``: ``id`` or a dotted path such as
+    ``metadata.order_id``. Every object with the key of a record is compared
+    with it, e.g. each payment of an order paid in several attempts.
+
+    Example:
+        >>> payments = iter_items(client.payments.get_payments, {"limit": 100})
+        >>> async for mismatch in reconcile(
+        ...     payments, load_orders(), key="metadata.order_id", expected_key="order_id"
+        ... ):
+        ...     report(mismatch)
+
+    :param remote: Async iterable of Payment or Refund objects
+    :param expected: Async iterable of expected records
+    :param key: Dotted path of the join key in YooKassa objects
+    :param expected_key: Join key field of expected records
+    :param max_memory_records: Expected records joined in memory. Larger
+        sets are spilled to disk.
+    :param partitions: Number of disk partitions when spilling
+    :param spill_dir: Directory of temporary partition files. Defaults to
+        the system temporary directory.
+    :return: Async iterator of mismatches. Objects without the join key are
+        skipped.
+    """
+    build: Dict[str, Dict[str, Any]] = {}
+    records = expected.__aiter__()
+    async for record in records:
+        build[str(record[expected_key])] = dict(record)
+        if len(build) > max_memory_records:
+            break
+    else:
+        async for mismatch in _join(build, _summaries(remote, key)):
+            yield mismatch
+        return
+
+    with tempfile.TemporaryDirectory(prefix="aioyookassa-", dir=spill_dir) as tmp:
+        expected_parts = _Partitions(tmp, "expected", partitions)
+        for record_key, record in build.items():
+            expected_parts.write(record_key, record)
+        build.clear()
+        async for record in records:
+            expected_parts.write(str(record[expected_key]), dict(record))
+        expected_parts.close()
+
+        remote_parts = _Partitions(tmp, "remote", partitions)
+        async for record_key, summary in _summaries(remote, key):
+            remote_parts.write(record_key, summary)
+        remote_parts.close()
+
+        for index in range(partitions):
+            build = dict(expected_parts.read(index))
+            async for mismatch in _join(build, _iterate(remote_parts.read(index))):
+                yield mismatch
+
+
+async def _summaries(
+    remote: AsyncIterable[Any], key: str
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """Get join keys and summaries of YooKassa objects."""
+    async for obj in remote:
+        value = _get_path(obj, key)
+        if value is not None:
+            yield str(value), _summarize(obj)
+
+
+async def _iterate(
+    items: Iterator[Tuple[str, Dict[str, Any]]]
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    for item in items:
+        yield item
+
+
+async def _join(
+    build: Dict[str, Dict[str, Any]],
+    probe: AsyncIterable[Tuple[str, Dict[str, Any]]],
+) -> AsyncIterator[Mismatch]:
+    """
+    Probe the in-memory build side with YooKassa objects.
+
+    :param build: Expected records by key
+    :param probe: Keys and summaries of YooKassa objects
+    :return: Async iterator of mismatches
+    """
+    # Records stay in the build side: several objects may share their key
+    matched: Set[str] = set()
+    async for record_key, actual in probe:
+        record = build.get(record_key)
+        if record is None:
+            yield Mismatch(MismatchType.UNEXPECTED, record_key, None, actual)
+            continue
+        matched.add(record_key)
+        for mismatch in _compare(record_key, record, actual):
+            yield mismatch
+    for record_key, record in build.items():
+        if record_key not in matched:
+            yield Mismatch(MismatchType.MISSING, record_key, record, None)
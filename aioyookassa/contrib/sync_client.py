@@ -0,0 +1,203 @@
+"""
+Blocking YooKassa client for synchronous code (Django views, Celery tasks).
+"""
+
+import asyncio
+import functools
+import threading
+from typing import Any, Callable, Coroutine, Dict, Optional, TypeVar, Union
+
+from aioyookassa.core.api.base import BaseAPI
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.priority import PriorityType
+
+T = TypeVar("T")
+
+
+class _SyncAPI:
+    """
+    Blocking proxy of an API module.
+
+    Coroutine methods of the wrapped module are run on the loop of the
+    :class:`SyncYooKassa` client; other attributes are returned as is, except
+    for copies of the module made by :meth:`with_priority`.
+    """
+
+    def __init__(self, client: "SyncYooKassa", api: BaseAPI[Any, Any]):
+        self._sync_client = client
+        self._api = api
+
+    def with_priority(self, priority: PriorityType) -> "_SyncAPI":
+        """
+        Get a copy of the module sending requests with another priority.
+
+        :param priority: Default priority of requests of the copy.
+        :returns: Blocking proxy of the copy.
+        """
+        return _SyncAPI(self._sync_client, self._api.with_priority(priority))
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def method(*args: Any, **kwargs: Any) -> Any:
+            return self._sync_client._run(attr(*args, **kwargs))
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, method)
+        return method
+
+
+class SyncYooKassa:
+    """
+    Synchronous YooKassa client.
+
+    Runs one :class:`YooKassa` client on a persistent event loop in a
+    background thread, so the connection pool and keep-alive connections are
+    reused across calls instead of being recreated by ``asyncio.run`` on every
+    call. All API modules are available with blocking methods and may be
+    called from any number of threads.
+
+    Example:
+        >>> client = SyncYooKassa(api_key="secret", shop_id=123456)
+        >>> payment = client.payments.get_payment("payment_id")
+        >>> client.close()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        shop_id: Union[int, str],
+        call_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize synchronous client and start its event loop thread.
+
+        :param api_key: YooKassa API key
+        :param shop_id: YooKassa shop ID
+        :param call_timeout: Maximum time in seconds a blocking call waits for
+            its result. Defaults to no limit besides the request timeouts.
+        :param kwargs: Other :class:`YooKassa` parameters (timeout, connector,
+            proxy, circuit_breaker, ...).
+        """
+        self.call_timeout = call_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="aioyookassa-sync", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+        # The client is created on the loop so its session belongs to it
+        self._client: YooKassa = self._run(
+            self._create_client(api_key, shop_id, kwargs)
+        )
+        # Blocking proxies of the API modules, created on first access
+        self._apis: Dict[str, _SyncAPI] = {}
+
+    def _run_loop(self) -> None:
+        """Run the event loop until it is stopped."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _create_client(
+        api_key: str, shop_id: Union[int, str], kwargs: Dict[str, Any]
+    ) -> YooKassa:
+        return YooKassa(api_key=api_key, shop_id=shop_id, **kwargs)
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run coroutine on the client loop and wait for its result.
+
+        :param coro: Coroutine to run
+        :return: Coroutine result
+        :raises RuntimeError: If the client is closed or called from its loop
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("SyncYooKassa client is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncYooKassa cannot be called from its own loop")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self.call_timeout)
+        except BaseException:
+            # Timed out or interrupted: do not leave the request running
+            future.cancel()
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        apis = self.__dict__.get("_apis")
+        if apis is not None and not name.startswith("_"):
+            if name in apis:
+                return apis[name]
+            api = getattr(self._client, name, None)
+            if isinstance(api, BaseAPI):
+                apis[name] = _SyncAPI(self, api)
+                return apis[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    @property
+    def client(self) -> YooKassa:
+        """Underlying async client. Its coroutines must run on :attr:`loop`."""
+        return self._client
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop running the client."""
+        return self._loop
+
+    def call(
+        self, func: Callable[..., Coroutine[Any, Any, T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run an arbitrary coroutine function on the client loop.
+
+        :param func: Coroutine function, e.g. using :attr:`client`
+        :return: Result of the coroutine
+        """
+        return self._run(func(*args, **kwargs))
+
+    def get_me(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Get shop or gateway settings information.
+
+        :return: Settings object, see :meth:`YooKassa.get_me`
+        """
+        return self._run(self._client.get_me(*args, **kwargs))
+
+    def warmup(
+        self, n_connections: int = 4, keepalive_interval: Optional[float] = None
+    ) -> int:
+        """
+        Pre-open keep-alive connections, see :meth:`YooKassa.warmup`.
+
+        :param n_connections: Number of connections to open.
+        :param keepalive_interval: Refresh interval in seconds.
+        :return: Number of connections that responded
+        """
+        return self._run(self._client.warmup(n_connections, keepalive_interval))
+
+    def close(self) -> None:
+        """Close the async client and stop the loop thread."""
+        if self._closed:
+            return
+        try:
+            self._run(self._client.close())
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> "SyncYooKassa":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
@@ -5,5 +5,6 @@ This module contains the main client and API implementations.
 """
 
 from .client import YooKassa
+from .pool import YooKassaPool
 
-__all__ = ["YooKassa"]
+__all__ = ["YooKassa", "YooKassaPool"]
@@ -1,20 +1,48 @@
 import abc
 import asyncio
 import logging
+import os
 import time
-from typing import Any, Dict, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import aiohttp
 from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout, TCPConnector
 
+from aioyookassa.core.circuit_breaker import CircuitBreaker
+from aioyookassa.core.hedging import HedgingPolicy
+from aioyookassa.core.idempotency import IdempotencyManager
 from aioyookassa.core.methods.base import APIMethod
-from aioyookassa.exceptions import APIError
+from aioyookassa.core.priority import Priority, PriorityScheduler, PriorityType
+from aioyookassa.core.transport import (
+    AiohttpTransport,
+    BaseTransport,
+    TransportError,
+    TransportResponse,
+)
+from aioyookassa.core.utils import clean_request_data
+from aioyookassa.exceptions import APIError, NetworkError, RequestTimeout
 
 try:
     from aioyookassa import __version__
 except ImportError:
     __version__ = "unknown"
 
+# Per-call timeout: seconds of total time or a full aiohttp ClientTimeout
+TimeoutType = Union[float, ClientTimeout]
+
 
 class BaseAPIClient(abc.ABC):
     """Base API Client with connection pooling, timeouts, and resource management."""
@@ -38,6 +66,11 @@ class BaseAPIClient(abc.ABC):
         proxy: Optional[str] = None,
         enable_logging: bool = False,
         logger: Optional[logging.Logger] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        transport: Optional[BaseTransport] = None,
+        idempotency: Optional[IdempotencyManager] = None,
+        scheduler: Optional[PriorityScheduler] = None,
     ):
         """
         Initialize Base API Client.
@@ -49,10 +82,27 @@ class BaseAPIClient(abc.ABC):
         :param proxy: Proxy URL (e.g., "http://proxy.example.com:8080")
         :param enable_logging: Enable request/response logging
         :param logger: Custom logger instance. If not provided, uses default logger.
+        :param circuit_breaker: Optional circuit breaker shared by all requests
+            of the client. Disabled by default.
+        :param hedging: Optional hedging policy for latency-critical GET
+            requests. Disabled by default.
+        :param transport: Optional transport replacing the aiohttp session,
+            e.g. :class:`HttpxTransport` for HTTP/2. Defaults to
+            :class:`AiohttpTransport` on the client session. ``timeout``
+            always applies, ``connector`` and ``proxy`` only apply to the
+            default transport.
+        :param idempotency: Optional idempotency manager deriving idempotence
+            keys from operation IDs and storing results of mutating requests.
+            Defaults to a random key per request.
+        :param scheduler: Optional scheduler limiting requests in flight and
+            dispatching them by priority. Disabled by default.
         """
         self.api_key = api_key
         self.shop_id = str(shop_id)
         self._session: Optional[ClientSession] = None
+        # Loop and process the session was created in
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_pid: Optional[int] = None
         self._proxy = proxy
         self._enable_logging = enable_logging
         self._logger = logger or logging.getLogger(__name__)
@@ -61,16 +111,40 @@ class BaseAPIClient(abc.ABC):
         self._connector_config = (
             None if connector else self._DEFAULT_CONNECTOR_CONFIG.copy()
         )
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
+        self._transport = transport
+        self._idempotency = idempotency
+        self._scheduler = scheduler
+        self._keepalive_task: Optional["asyncio.Task[None]"] = None
+        # Closes the session when its loop shuts down, see _watch_shutdown
+        self._session_guard: Optional[AsyncGenerator[None, None]] = None
+        # Sessions of loops that stopped without closing them
+        self._stale_sessions: List[
+            Tuple[ClientSession, Optional[asyncio.AbstractEventLoop]]
+        ] = []
 
     def _get_session(self) -> ClientSession:
         """
         Get or create aiohttp ClientSession with optimizations.
 
+        The session is rebuilt when it was created in another event loop or,
+        after ``os.fork()``, in the parent process, so one client can be
+        created at import time and used from any loop or worker process.
+
         :return: ClientSession with connection pooling and timeouts configured
         """
+        if self._session is not None and self._is_session_stale():
+            if self._connector_config is None:
+                raise RuntimeError(
+                    "The connector passed to the client is bound to another "
+                    "event loop or process; create the client with a connector "
+                    "of the loop it is used in or without a connector"
+                )
+            self._discard_session()
         if self._session is None or self._session.closed:
+            loop = self._get_event_loop()
             if self._connector is None and self._connector_config:
-                loop = self._get_event_loop()
                 self._connector = TCPConnector(loop=loop, **self._connector_config)
 
             self._session = ClientSession(
@@ -78,8 +152,83 @@ class BaseAPIClient(abc.ABC):
                 timeout=self._timeout,
                 headers={"User-Agent": f"aioyookassa/{__version__}"},
             )
+            self._session_loop = loop
+            self._session_pid = os.getpid()
+            if loop is not None:
+                self._watch_shutdown(self._session)
         return self._session
 
+    def _watch_shutdown(self, session: ClientSession) -> None:
+        """
+        Close the session when its event loop shuts down.
+
+        ``asyncio.run()`` finalizes the async generators of a loop before
+        closing it. A generator started in the loop therefore closes the
+        session while the loop can still close its connections, so a client
+        used with one ``asyncio.run()`` per call leaves no open sockets behind.
+
+        :param session: Session created in the running loop
+        """
+        guard = self._close_on_shutdown(session)
+        try:
+            # Run to the first yield, registering the generator with the loop
+            guard.asend(None).send(None)
+        except StopIteration:
+            pass
+        self._session_guard = guard
+
+    @staticmethod
+    async def _close_on_shutdown(session: ClientSession) -> AsyncGenerator[None, None]:
+        """
+        Wait for the shutdown of the loop, then close the session.
+
+        :param session: Session to close
+        """
+        try:
+            yield
+        finally:
+            if not session.closed:
+                await session.close()
+
+    def _is_session_stale(self) -> bool:
+        """
+        Check whether the session belongs to another process or event loop.
+
+        :return: True if the session must not be used in the current context
+        """
+        if self._session_pid is not None and self._session_pid != os.getpid():
+            return True
+        loop = self._get_event_loop()
+        return (
+            self._session_loop is not None
+            and loop is not None
+            and loop is not self._session_loop
+        )
+
+    def _discard_session(self) -> None:
+        """
+        Forget a stale session, closing it in its own loop when possible.
+
+        A session inherited from the parent process is only dropped: its
+        sockets are shared with the parent and must not be shut down here.
+        A session of a loop that no longer runs and was not closed by its
+        shutdown is closed by :meth:`close`.
+        """
+        session, loop = self._session, self._session_loop
+        forked = self._session_pid != os.getpid()
+        self._session = None
+        self._session_loop = None
+        self._session_pid = None
+        self._session_guard = None
+        # Owned connector is bound to the old loop: build a new one
+        self._connector = None
+        if session is None or session.closed or forked:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            self._stale_sessions.append((session, loop))
+
     @staticmethod
     def _get_event_loop() -> Optional[asyncio.AbstractEventLoop]:
         """
@@ -92,19 +241,125 @@ class BaseAPIClient(abc.ABC):
         except RuntimeError:
             return None
 
+    async def warmup(
+        self, n_connections: int = 4, keepalive_interval: Optional[float] = None
+    ) -> int:
+        """
+        Pre-open keep-alive connections to the API host.
+
+        Sends ``n_connections`` concurrent lightweight unauthenticated requests,
+        so DNS resolution, TCP and TLS handshakes are done before the first
+        real request. Any HTTP response counts as an opened connection.
+
+        :param n_connections: Number of connections to open. Limited by the
+            connector ``limit_per_host``.
+        :param keepalive_interval: If set, repeat the warm-up every
+            ``keepalive_interval`` seconds in background until :meth:`close`,
+            so idle connections are not dropped. Should be shorter than the
+            keep-alive timeout of the connector.
+        :return: Number of connections that responded
+        """
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+        opened = await self._open_connections(n_connections)
+        if keepalive_interval is not None:
+            self._stop_keepalive()
+            self._keepalive_task = asyncio.ensure_future(
+                self._keepalive_loop(n_connections, keepalive_interval)
+            )
+        return opened
+
+    async def _open_connections(self, n_connections: int) -> int:
+        """
+        Send concurrent ping requests to open connections.
+
+        :param n_connections: Number of concurrent requests
+        :return: Number of successful requests
+        """
+        results = await asyncio.gather(*(self._ping() for _ in range(n_connections)))
+        return sum(results)
+
+    async def _ping(self) -> bool:
+        """
+        Send a HEAD request to the API host and release the connection.
+
+        :return: True if the host responded
+        """
+        try:
+            response = await self._request("HEAD", self.BASE_URL, timeout=self._timeout)
+            async with response:
+                await response.read()
+            return True
+        except (ClientError, TransportError, asyncio.TimeoutError) as e:
+            self._log_error("network", "HEAD", self.BASE_URL, str(e))
+            return False
+
+    async def _keepalive_loop(self, n_connections: int, interval: float) -> None:
+        """
+        Periodically refresh keep-alive connections.
+
+        Unexpected errors of a refresh are logged and do not stop the loop;
+        it ends only when cancelled.
+
+        :param n_connections: Number of connections to keep
+        :param interval: Refresh interval in seconds
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._open_connections(n_connections)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if self._enable_logging:
+                    self._logger.warning(
+                        "Keep-alive connection refresh failed", exc_info=True
+                    )
+
+    def _stop_keepalive(self) -> None:
+        """Cancel background keep-alive refresh."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
     async def close(self) -> None:
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
+        """Close aiohttp session and transport."""
+        self._stop_keepalive()
+        if self._transport is not None:
+            await self._transport.close()
+        if self._session is not None and self._is_session_stale():
+            self._discard_session()
+        elif self._session and not self._session.closed:
             await self._session.close()
             self._session = None
+        await self._close_stale_sessions()
+
+    async def _close_stale_sessions(self) -> None:
+        """
+        Close sessions of loops that stopped without closing them.
+
+        Connections of a closed loop cannot be shut down any more; closing
+        the session only marks it and its connector closed. Sessions of
+        loops that may still run again are kept until they are closed.
+        """
+        sessions, self._stale_sessions = self._stale_sessions, []
+        for session, loop in sessions:
+            if session.closed:
+                continue
+            if loop is None or loop.is_closed():
+                await session.close()
+            else:
+                self._stale_sessions.append((session, loop))
 
     async def _handle_http_error(self, response: Any) -> None:
         """
         Handle HTTP error responses.
 
-        :param response: aiohttp response object
-        :raises APIError: Appropriate API error based on response data
+        :param response: Transport response object
+        :raises APIError: Appropriate API error based on error code or HTTP status
         """
+        status = response.status
+        error_cls = APIError.for_status(status)
         try:
             error_data = await response.json()
         except ValueError:
@@ -112,29 +367,78 @@ class BaseAPIClient(abc.ABC):
             try:
                 error_text = await response.text()
             except Exception as e:
-                raise APIError(
-                    f"HTTP {response.status}: Failed to read error response: {str(e)}"
+                raise self._make_http_error(
+                    error_cls,
+                    f"HTTP {status}: Failed to read error response: {str(e)}",
+                    response,
                 ) from e
-            raise APIError(f"HTTP {response.status}: {error_text}")
+            raise self._make_http_error(
+                error_cls, f"HTTP {status}: {error_text}", response
+            )
         except Exception as e:
             # Other errors (network, etc.)
-            raise APIError(
-                f"HTTP {response.status}: Failed to parse error response: {str(e)}"
+            raise self._make_http_error(
+                error_cls,
+                f"HTTP {status}: Failed to parse error response: {str(e)}",
+                response,
             ) from e
 
+        if not isinstance(error_data, dict):
+            # Empty or unexpected body: the status still selects the error
+            error_data = {}
+        retry_after = self._get_retry_after(response)
+        if retry_after is not None and "retry_after" not in error_data:
+            error_data = {**error_data, "retry_after": retry_after}
         APIError.detect(
             error_data.get("code", "unknown_error"),
-            error_data.get("description", f"HTTP {response.status}"),
+            error_data.get("description", f"HTTP {status}"),
             error_details=error_data,
+            status=status,
         )
 
+    def _make_http_error(
+        self, error_cls: Type[Exception], message: str, response: Any
+    ) -> Exception:
+        """
+        Create error for a response whose body could not be parsed.
+
+        :param error_cls: Exception class mapped from the HTTP status
+        :param message: Error message
+        :param response: Transport response object
+        :return: Exception instance with status and retry_after set
+        """
+        error = error_cls(message)
+        if isinstance(error, APIError):
+            error.status = response.status
+            error.retry_after = self._get_retry_after(response)
+        return error
+
+    @staticmethod
+    def _get_retry_after(response: Any) -> Optional[int]:
+        """
+        Get delay from the Retry-After header of the response.
+
+        :param response: Transport response object
+        :return: Delay in seconds or None if the header is absent or not numeric
+        """
+        headers = getattr(response, "headers", None)
+        if not isinstance(headers, Mapping):
+            return None
+        value = headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
     async def _parse_response(
         self, response: Any, method_instance: APIMethod[Any]
     ) -> dict:
         """
         Parse successful HTTP response.
 
-        :param response: aiohttp response object
+        :param response: Transport response object
         :param method_instance: API Method instance
         :return: Parsed JSON response or empty dict
         :raises APIError: If response parsing fails
@@ -154,8 +458,9 @@ class BaseAPIClient(abc.ABC):
             return {}
 
         try:
-            json_result: dict = await response.json()
-            return json_result
+            json_result = await response.json()
+            # aiohttp decodes an empty body to None
+            return {} if json_result is None else json_result
         except ValueError as e:
             # JSON decode error
             try:
@@ -170,8 +475,8 @@ class BaseAPIClient(abc.ABC):
                     f"Failed to parse JSON response: {str(e)}. "
                     f"Also failed to read response text: {str(read_error)}"
                 ) from read_error
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            raise APIError(f"Network error while parsing response: {str(e)}") from e
+        except (aiohttp.ClientError, TransportError, asyncio.TimeoutError) as e:
+            raise NetworkError(f"Network error while parsing response: {str(e)}") from e
         except Exception as e:
             raise APIError(f"Unexpected error parsing response: {str(e)}") from e
 
@@ -181,6 +486,9 @@ class BaseAPIClient(abc.ABC):
         json: Optional[dict] = None,
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
     ) -> dict:
         """
         Send request to the API with proper resource management.
@@ -189,15 +497,202 @@ class BaseAPIClient(abc.ABC):
         :param json: JSON data
         :param params: Query parameters
         :param headers: Additional headers
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+            The effective timeout never exceeds the time left until it.
+        :param priority: Priority of the request with a scheduler.
+            Defaults to ``Priority.DEFAULT``.
         :return: JSON response
+        :raises CircuitOpenError: If the circuit breaker of the endpoint is open
+        :raises RequestTimeout: If the deadline has already passed or no
+            scheduler slot was free within the timeout
         """
-        session = self._get_session()
-        # Handle both class and instance - normalize to instance once
+        # Handle both class and instance - classes share one instance
         if isinstance(method, APIMethod):
             method_instance = method
         else:
-            # If it's a class, create a default instance
-            method_instance = method()
+            method_instance = method.shared()
+        request_timeout = self._resolve_timeout(timeout, deadline)
+        execute = (
+            self._execute_hedged
+            if self._hedging is not None and self._hedging.is_hedgeable(method_instance)
+            else self._execute_request
+        )
+
+        # Cleaned once, not by every attempt or hedged duplicate
+        json = self._remove_none_values(json or {})
+        params = self._remove_none_values(params or {})
+
+        scheduler = self._scheduler
+        if scheduler is None:
+            return await self._execute_guarded(
+                execute, method_instance, json, params, headers, request_timeout
+            )
+        request_timeout = await self._acquire_slot(
+            scheduler, priority or Priority.DEFAULT, request_timeout
+        )
+        try:
+            return await self._execute_guarded(
+                execute, method_instance, json, params, headers, request_timeout
+            )
+        finally:
+            scheduler.release()
+
+    async def _acquire_slot(
+        self,
+        scheduler: PriorityScheduler,
+        priority: PriorityType,
+        timeout: ClientTimeout,
+    ) -> ClientTimeout:
+        """
+        Wait for a scheduler slot within the total timeout of a request.
+
+        :param scheduler: Scheduler of the client
+        :param priority: Priority of the request
+        :param timeout: Timeout of the request
+        :return: Timeout of the request without the time spent waiting
+        :raises RequestTimeout: If no slot was free within the timeout
+        """
+        if scheduler.try_acquire(priority):
+            return timeout
+        if timeout.total is None:
+            await scheduler.acquire(priority)
+            return timeout
+        start_time = time.monotonic()
+        error = RequestTimeout(
+            f"Request timeout: no {priority} request slot within {timeout.total}s"
+        )
+        try:
+            await asyncio.wait_for(scheduler.acquire(priority), timeout.total)
+        except asyncio.TimeoutError:
+            raise error
+        remaining = timeout.total - (time.monotonic() - start_time)
+        if remaining <= 0:
+            scheduler.release()
+            raise error
+        return self._with_total(timeout, remaining)
+
+    async def _execute_guarded(
+        self,
+        execute: Callable[..., Awaitable[dict]],
+        method_instance: APIMethod[Any],
+        json: Optional[dict],
+        params: Optional[dict],
+        headers: Optional[dict],
+        timeout: ClientTimeout,
+    ) -> dict:
+        """
+        Perform a request through the circuit breaker of its endpoint.
+
+        :param execute: Function performing the request
+        :param method_instance: API Method instance
+        :param json: JSON data
+        :param params: Query parameters
+        :param headers: Additional headers
+        :param timeout: Timeout of the request
+        :return: JSON response
+        :raises CircuitOpenError: If the circuit breaker of the endpoint is open
+        """
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await execute(method_instance, json, params, headers, timeout)
+
+        family = breaker.get_family(method_instance.path)
+        breaker.before_request(family)
+        start_time = self._get_current_time()
+        try:
+            result = await execute(method_instance, json, params, headers, timeout)
+        except BaseException as e:
+            breaker.record_error(family, e, self._calculate_duration(start_time))
+            raise
+        breaker.record_success(family, self._calculate_duration(start_time))
+        return result
+
+    async def _execute_hedged(
+        self,
+        method_instance: APIMethod[Any],
+        json: Optional[dict],
+        params: Optional[dict],
+        headers: Optional[dict],
+        timeout: ClientTimeout,
+    ) -> dict:
+        """
+        Perform a request, sending a duplicate if it is slower than the hedge delay.
+
+        The first successful response wins and the other request is cancelled.
+        If one of the requests fails, the result of the other one is awaited.
+
+        :param method_instance: API Method instance
+        :param json: JSON data
+        :param params: Query parameters
+        :param headers: Additional headers
+        :param timeout: Timeout of the request
+        :return: JSON response
+        """
+        policy = cast(HedgingPolicy, self._hedging)
+        policy.on_request()
+        start_time = self._get_current_time()
+        primary = asyncio.ensure_future(
+            self._execute_request(method_instance, json, params, headers, timeout)
+        )
+        pending = {primary}
+        try:
+            delay = policy.get_delay()
+            if delay is not None:
+                await asyncio.wait(pending, timeout=delay)
+            if not primary.done() and delay is not None and policy.try_acquire():
+                if self._enable_logging:
+                    self._logger.debug(
+                        f"Hedging {method_instance.http_method} request to "
+                        f"{method_instance.path} after {delay:.3f}s"
+                    )
+                pending.add(
+                    asyncio.ensure_future(
+                        self._execute_request(
+                            method_instance, json, params, headers, timeout
+                        )
+                    )
+                )
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Retrieve every exception so failed tasks are not reported
+                # as never retrieved
+                errors = [task.exception() for task in done]
+                for task, task_error in zip(done, errors):
+                    if task_error is None:
+                        duration = self._calculate_duration(start_time)
+                        if duration is not None:
+                            policy.record_latency(duration)
+                        return task.result()
+                    error = error or task_error
+            raise cast(BaseException, error)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _execute_request(
+        self,
+        method_instance: APIMethod[Any],
+        json: Optional[dict],
+        params: Optional[dict],
+        headers: Optional[dict],
+        timeout: ClientTimeout,
+    ) -> dict:
+        """
+        Perform a single HTTP request and parse its response.
+
+        :param method_instance: API Method instance
+        :param json: JSON data, cleaned by :meth:`_send_request`
+        :param params: Query parameters, cleaned by :meth:`_send_request`
+        :param headers: Additional headers
+        :param timeout: Timeout of the request
+        :return: JSON response
+        """
         request_url = self._get_request_url(method_instance)
         request_headers = {"Content-Type": "application/json"}
         request_headers.update(headers or {})
@@ -212,15 +707,14 @@ class BaseAPIClient(abc.ABC):
         self._log_request(method_instance.http_method, request_url)
 
         try:
-            response = await session.request(
+            response = await self._request(
                 method_instance.http_method,
                 request_url,
-                json=self._remove_none_values(json or {}),
-                params=self._remove_none_values(params or {}),
+                json=json,
+                params=params,
                 headers=request_headers,
                 auth=auth,
-                proxy=self._proxy,
-                timeout=self._timeout,
+                timeout=timeout,
             )
 
             async with response:
@@ -236,12 +730,102 @@ class BaseAPIClient(abc.ABC):
 
         except asyncio.TimeoutError:
             self._log_error("timeout", method_instance.http_method, request_url)
-            raise APIError(
-                f"Request timeout: server did not respond within {self._timeout.total}s"
+            raise RequestTimeout(
+                f"Request timeout: server did not respond within {timeout.total}s"
             )
-        except ClientError as e:
+        except (ClientError, TransportError) as e:
             self._log_error("network", method_instance.http_method, request_url, str(e))
-            raise APIError(f"Network error: {str(e)}")
+            raise NetworkError(f"Network error: {str(e)}")
+
+    def _get_transport(self) -> BaseTransport:
+        """
+        Get transport of the client, creating the default aiohttp one.
+
+        :return: Transport used for all requests
+        """
+        if self._transport is None:
+            # The session is looked up on every request, so it is recreated
+            # after close() and can be provided by subclasses
+            self._transport = AiohttpTransport(
+                session_factory=lambda: self._get_session(), proxy=self._proxy
+            )
+        return self._transport
+
+    async def _request(
+        self,
+        http_method: str,
+        url: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> TransportResponse:
+        """
+        Send HTTP request through the transport.
+
+        :param http_method: HTTP method
+        :param url: Request URL
+        :param json: JSON data
+        :param params: Query parameters
+        :param headers: Request headers
+        :param auth: Basic auth credentials
+        :param timeout: Timeout of the request
+        :return: Response object usable as async context manager
+        """
+        request_headers = {"User-Agent": f"aioyookassa/{__version__}"}
+        request_headers.update(headers or {})
+        return await self._get_transport().request(
+            http_method,
+            url,
+            json=json,
+            params=params,
+            headers=request_headers,
+            auth=auth,
+            timeout=timeout,
+        )
+
+    def _resolve_timeout(
+        self, timeout: Optional[TimeoutType], deadline: Optional[float]
+    ) -> ClientTimeout:
+        """
+        Get effective timeout of a call from per-call timeout and deadline.
+
+        :param timeout: Per-call timeout in seconds or ClientTimeout
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value
+        :return: ClientTimeout for the request
+        :raises RequestTimeout: If the deadline has already passed
+        """
+        if timeout is None:
+            resolved = self._timeout
+        elif isinstance(timeout, ClientTimeout):
+            resolved = timeout
+        else:
+            resolved = self._with_total(self._timeout, timeout)
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RequestTimeout("Request timeout: deadline exceeded")
+            if resolved.total is None or remaining < resolved.total:
+                resolved = self._with_total(resolved, remaining)
+        return resolved
+
+    @staticmethod
+    def _with_total(timeout: ClientTimeout, total: float) -> ClientTimeout:
+        """
+        Copy timeout configuration with another total timeout.
+
+        :param timeout: Base timeout configuration
+        :param total: Total timeout in seconds
+        :return: New ClientTimeout
+        """
+        return ClientTimeout(
+            total=total,
+            connect=timeout.connect,
+            sock_read=timeout.sock_read,
+            sock_connect=timeout.sock_connect,
+        )
 
     def _get_current_time(self) -> float:
         """
@@ -327,43 +911,33 @@ class BaseAPIClient(abc.ABC):
         """
         Get full URL for API request.
 
+        Paths built from the compiled template of the method are joined with
+        the base URL by the template; custom paths are appended as is.
+
         :param method_instance: API Method instance
         :return: Full request URL
         """
-        return f"{self.BASE_URL}{method_instance.path}"
+        template = method_instance._template
+        if template is not None:
+            params = method_instance._params
+            if params is not None:
+                return template.format(params, self.BASE_URL)
+            if not template.names and method_instance.path is template.template:
+                return template.format({}, self.BASE_URL)
+        return self.BASE_URL + method_instance.path
 
     def _remove_none_values(self, data: dict) -> dict:
         """
         Remove None values recursively from dictionary without mutating original.
 
-        Creates a copy of the dictionary and removes all keys with None values
-        recursively, including nested dictionaries and dictionaries in lists.
+        Removes all keys with None values, including nested dictionaries and
+        dictionaries in lists, and converts Decimal amounts to strings, as the
+        API expects them. Data marked as :class:`CleanDict` is returned as is.
 
         :param data: Dictionary to clean
         :return: New dictionary without None values
         """
-        result: Dict[str, Any] = {}
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, dict):
-                cleaned = self._remove_none_values(value)
-                if cleaned:  # Only add non-empty dicts
-                    result[key] = cleaned
-            elif isinstance(value, list):
-                cleaned_list: list = []
-                for item in value:
-                    if isinstance(item, dict):
-                        cleaned_item = self._remove_none_values(item)
-                        if cleaned_item:  # Only add non-empty dicts
-                            cleaned_list.append(cleaned_item)
-                    elif item is not None:
-                        cleaned_list.append(item)
-                if cleaned_list:  # Only add non-empty lists
-                    result[key] = cleaned_list
-            else:
-                result[key] = value
-        return result
+        return clean_request_data(data)
 
     async def __aenter__(self) -> "BaseAPIClient":
         return self
@@ -2,20 +2,43 @@
 YooKassa API clients.
 
 This module contains all API client implementations for different YooKassa services.
+
+API classes are imported from their modules on first access (PEP 562).
 """
 
-from .base import BaseAPI
-from .deals import DealsAPI
-from .invoices import InvoicesAPI
-from .payment_methods import PaymentMethodsAPI
-from .payments import PaymentsAPI
-from .payouts import PayoutsAPI
-from .personal_data import PersonalDataAPI
-from .receipts import ReceiptsAPI
-from .refunds import RefundsAPI
-from .sbp_banks import SbpBanksAPI
-from .self_employed import SelfEmployedAPI
-from .webhooks import WebhooksAPI
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from aioyookassa._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .base import BaseAPI
+    from .deals import DealsAPI
+    from .invoices import InvoicesAPI
+    from .payment_methods import PaymentMethodsAPI
+    from .payments import PaymentsAPI
+    from .payouts import PayoutsAPI
+    from .personal_data import PersonalDataAPI
+    from .receipts import ReceiptsAPI
+    from .refunds import RefundsAPI
+    from .sbp_banks import SbpBanksAPI
+    from .self_employed import SelfEmployedAPI
+    from .webhooks import WebhooksAPI
+
+# Submodule and attribute of every exported name
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "BaseAPI": (".base", "BaseAPI"),
+    "DealsAPI": (".deals", "DealsAPI"),
+    "InvoicesAPI": (".invoices", "InvoicesAPI"),
+    "PaymentMethodsAPI": (".payment_methods", "PaymentMethodsAPI"),
+    "PaymentsAPI": (".payments", "PaymentsAPI"),
+    "PayoutsAPI": (".payouts", "PayoutsAPI"),
+    "PersonalDataAPI": (".personal_data", "PersonalDataAPI"),
+    "ReceiptsAPI": (".receipts", "ReceiptsAPI"),
+    "RefundsAPI": (".refunds", "RefundsAPI"),
+    "SbpBanksAPI": (".sbp_banks", "SbpBanksAPI"),
+    "SelfEmployedAPI": (".self_employed", "SelfEmployedAPI"),
+    "WebhooksAPI": (".webhooks", "WebhooksAPI"),
+}
 
 __all__ = [
     "BaseAPI",
@@ -31,3 +54,6 @@ __all__ = [
     "SelfEmployedAPI",
     "WebhooksAPI",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _EXPORTS)
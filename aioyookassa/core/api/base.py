@@ -2,18 +2,23 @@
 Base API client class for common operations.
 """
 
+import copy
 from typing import Any, Generic, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
-from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.abc.client import BaseAPIClient, TimeoutType
+from aioyookassa.core.idempotency import IdempotencyManager, send_idempotent
 from aioyookassa.core.methods.base import APIMethod
-from aioyookassa.core.utils import create_idempotence_headers, normalize_params
+from aioyookassa.core.priority import Priority, PriorityType
+from aioyookassa.core.utils import normalize_params
+from aioyookassa.types.compact import compact_list
 
 T = TypeVar("T")
 TParams = TypeVar("TParams", bound=BaseModel)
 TResult = TypeVar("TResult", bound=BaseModel)
 TListResult = TypeVar("TListResult", bound=BaseModel)  # For list results
+TAPI = TypeVar("TAPI", bound="BaseAPI[Any, Any]")
 
 
 class _EmptyParams(BaseModel):
@@ -32,13 +37,92 @@ class BaseAPI(Generic[TParams, TResult]):
     :param TResult: Type variable for result (Pydantic model)
     """
 
-    def __init__(self, client: BaseAPIClient):
+    def __init__(self, client: BaseAPIClient, priority: Optional[PriorityType] = None):
         """
         Initialize base API client.
 
         :param client: Base API client instance.
+        :param priority: Default priority of requests of the module with a
+            scheduler. Defaults to ``Priority.DEFAULT``.
         """
         self._client = client
+        self._idempotency: Optional[IdempotencyManager] = getattr(
+            client, "_idempotency", None
+        )
+        self._priority = Priority(priority) if priority is not None else None
+
+    def with_priority(self: TAPI, priority: PriorityType) -> TAPI:
+        """
+        Get a copy of the module sending requests with another priority.
+
+        Example:
+            >>> exports = client.payments.with_priority(Priority.BULK)
+            >>> payments = await exports.get_payments()
+
+        :param priority: Default priority of requests of the copy.
+        :returns: API module of the same client.
+        """
+        api = copy.copy(self)
+        api._priority = Priority(priority)
+        return api
+
+    def _get_priority(self, priority: Optional[PriorityType]) -> Optional[PriorityType]:
+        """
+        Get priority of a request.
+
+        :param priority: Per-call priority.
+        :returns: Per-call priority or the default priority of the module.
+        """
+        return priority if priority is not None else self._priority
+
+    async def _send_mutation(
+        self,
+        method: Union[Type[APIMethod[Any]], APIMethod[Any]],
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
+    ) -> dict:
+        """
+        Send mutating request with an idempotence key.
+
+        The key is derived from the operation ID if it is given; with an
+        idempotency manager, results of repeated operations come from its
+        store (see :mod:`aioyookassa.core.idempotency`).
+
+        :param method: API method class or instance.
+        :param json: Request body.
+        :param headers: Additional headers.
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
+        :param operation_id: Caller's ID of the operation.
+        :returns: JSON response.
+        """
+        method_instance = method if isinstance(method, APIMethod) else method.shared()
+
+        async def send(key: str) -> dict:
+            request_headers = dict(headers or {})
+            request_headers["Idempotence-Key"] = key
+            return await self._client._send_request(
+                method_instance,
+                json=json,
+                headers=request_headers,
+                timeout=timeout,
+                deadline=deadline,
+                priority=self._get_priority(priority),
+            )
+
+        return await send_idempotent(
+            self._idempotency,
+            getattr(self._client, "shop_id", ""),
+            method_instance,
+            send,
+            json_data=json,
+            operation_id=operation_id,
+        )
 
     async def _create_resource(
         self,
@@ -46,6 +130,10 @@ class BaseAPI(Generic[TParams, TResult]):
         params_class: Type[TParams],
         method_class: Type[APIMethod[Any]],
         result_class: Type[TResult],
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> TResult:
         """
         Create a resource using the specified method.
@@ -54,13 +142,21 @@ class BaseAPI(Generic[TParams, TResult]):
         :param params_class: Pydantic model class for parameters.
         :param method_class: API method class to use.
         :param result_class: Result model class.
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
+        :param operation_id: Caller's ID of the operation for the idempotence key.
         :returns: Created resource instance.
         """
         params_dict = normalize_params(params, params_class)
         json_data = method_class.build_params(**params_dict)
-        headers = create_idempotence_headers()
-        result: dict = await self._client._send_request(
-            method_class, json=json_data, headers=headers
+        result = await self._send_mutation(
+            method_class,
+            json=json_data,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
         return result_class(**result)
 
@@ -70,6 +166,10 @@ class BaseAPI(Generic[TParams, TResult]):
         params_class: Optional[Type[Any]],
         method_class: Type[APIMethod[Any]],
         result_class: Type[Any],
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        compact: bool = False,
         **kwargs: Any,
     ) -> Any:
         """
@@ -80,14 +180,24 @@ class BaseAPI(Generic[TParams, TResult]):
         :param method_class: API method class to use.
         :param result_class: Result model class.
         :param kwargs: Additional parameters (merged with params).
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
+        :param compact: Return items as compact read-only objects.
         :returns: List of resources.
         """
         params_dict = normalize_params(params, params_class)
         params_dict.update(kwargs)
         request_params = method_class.build_params(**params_dict)
         result: dict = await self._client._send_request(
-            method_class, params=request_params
+            method_class,
+            params=request_params,
+            timeout=timeout,
+            deadline=deadline,
+            priority=self._get_priority(priority),
         )
+        if compact:
+            return compact_list(result_class, result)
         return result_class(**result)
 
     async def _get_by_id(
@@ -96,6 +206,9 @@ class BaseAPI(Generic[TParams, TResult]):
         method_class: Type[APIMethod[Any]],
         result_class: Type[TResult],
         id_param_name: str = "id",
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
     ) -> TResult:
         """
         Get a resource by its ID.
@@ -104,6 +217,9 @@ class BaseAPI(Generic[TParams, TResult]):
         :param method_class: API method class to use.
         :param result_class: Result model class.
         :param id_param_name: Name of the ID parameter in build method (default: "id").
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
         :returns: Resource instance.
         :raises ValueError: If resource_id is empty or None.
         """
@@ -113,7 +229,12 @@ class BaseAPI(Generic[TParams, TResult]):
                 f"Received: {repr(resource_id)}"
             )
         method = method_class.build(**{id_param_name: resource_id})
-        result: dict = await self._client._send_request(method)
+        result: dict = await self._client._send_request(
+            method,
+            timeout=timeout,
+            deadline=deadline,
+            priority=self._get_priority(priority),
+        )
         return result_class(**result)
 
     async def _update_resource(
@@ -124,6 +245,10 @@ class BaseAPI(Generic[TParams, TResult]):
         method_class: Type[APIMethod[Any]],
         result_class: Type[TResult],
         id_param_name: str = "id",
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> TResult:
         """
         Update a resource by its ID.
@@ -134,6 +259,10 @@ class BaseAPI(Generic[TParams, TResult]):
         :param method_class: API method class to use.
         :param result_class: Result model class.
         :param id_param_name: Name of the ID parameter in build method (default: "id").
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
+        :param operation_id: Caller's ID of the operation for the idempotence key.
         :returns: Updated resource instance.
         :raises ValueError: If resource_id is empty or None.
         """
@@ -145,9 +274,13 @@ class BaseAPI(Generic[TParams, TResult]):
         method = method_class.build(**{id_param_name: resource_id})
         params_dict = normalize_params(params, params_class)
         json_data = method.build_params(**params_dict)
-        headers = create_idempotence_headers()
-        result: dict = await self._client._send_request(
-            method, json=json_data, headers=headers
+        result = await self._send_mutation(
+            method,
+            json=json_data,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
         return result_class(**result)
 
@@ -157,6 +290,10 @@ class BaseAPI(Generic[TParams, TResult]):
         method_class: Type[APIMethod[Any]],
         result_class: Type[TResult],
         id_param_name: str = "id",
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> TResult:
         """
         Perform an action on a resource by its ID (without parameters).
@@ -165,6 +302,10 @@ class BaseAPI(Generic[TParams, TResult]):
         :param method_class: API method class to use.
         :param result_class: Result model class.
         :param id_param_name: Name of the ID parameter in build method (default: "id").
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
+        :param operation_id: Caller's ID of the operation for the idempotence key.
         :returns: Resource instance.
         :raises ValueError: If resource_id is empty or None.
         """
@@ -174,6 +315,11 @@ class BaseAPI(Generic[TParams, TResult]):
                 f"Received: {repr(resource_id)}"
             )
         method = method_class.build(**{id_param_name: resource_id})
-        headers = create_idempotence_headers()
-        result: dict = await self._client._send_request(method, headers=headers)
+        result = await self._send_mutation(
+            method,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
+        )
         return result_class(**result)
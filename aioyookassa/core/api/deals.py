@@ -1,7 +1,9 @@
 from typing import Any, Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.deals import CreateDeal, GetDeal, GetDeals
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.deals import Deal, DealsList
 from aioyookassa.types.params import CreateDealParams, GetDealsParams
 
@@ -16,12 +18,28 @@ class DealsAPI(BaseAPI[CreateDealParams, Deal]):
     async def create_deal(
         self,
         params: CreateDealParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Deal:
         """
         Create a new deal in YooKassa.
 
         :param params: Deal creation parameters (CreateDealParams).
         :type params: CreateDealParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Deal object.
         :rtype: Deal
         :seealso: https://yookassa.ru/developers/api#create_deal
@@ -31,11 +49,20 @@ class DealsAPI(BaseAPI[CreateDealParams, Deal]):
             params_class=CreateDealParams,
             method_class=CreateDeal,
             result_class=Deal,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
     async def get_deals(
         self,
         params: Optional[GetDealsParams] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        compact: bool = False,
         **kwargs: Any,
     ) -> DealsList:
         """
@@ -44,6 +71,16 @@ class DealsAPI(BaseAPI[CreateDealParams, Deal]):
         :param params: Filter parameters (GetDealsParams).
         :type params: Optional[GetDealsParams]
         :param kwargs: Additional parameters (merged with params).
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param compact: Return items as compact read-only objects that use
+            less memory (see :mod:`aioyookassa.types.compact`).
+        :type compact: bool
         :returns: Deals list object.
         :rtype: DealsList
         :seealso: https://yookassa.ru/developers/api#list_deals
@@ -53,15 +90,33 @@ class DealsAPI(BaseAPI[CreateDealParams, Deal]):
             params_class=GetDealsParams,
             method_class=GetDeals,
             result_class=DealsList,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            compact=compact,
             **kwargs,
         )
 
-    async def get_deal(self, deal_id: str) -> Deal:
+    async def get_deal(
+        self,
+        deal_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> Deal:
         """
         Retrieve deal information by deal ID.
 
         :param deal_id: Deal identifier.
         :type deal_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: Deal object.
         :rtype: Deal
         :seealso: https://yookassa.ru/developers/api#get_deal
@@ -71,4 +126,7 @@ class DealsAPI(BaseAPI[CreateDealParams, Deal]):
             method_class=GetDeal,
             result_class=Deal,
             id_param_name="deal_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
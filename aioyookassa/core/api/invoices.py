@@ -1,7 +1,9 @@
 from typing import Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.invoices import CreateInvoice, GetInvoice
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.invoice import Invoice
 from aioyookassa.types.params import CreateInvoiceParams
 
@@ -17,12 +19,28 @@ class InvoicesAPI(BaseAPI[CreateInvoiceParams, Invoice]):
     async def create_invoice(
         self,
         params: CreateInvoiceParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Invoice:
         """
         Create a new invoice in YooKassa.
 
         :param params: Invoice creation parameters (CreateInvoiceParams).
         :type params: CreateInvoiceParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Invoice object.
         :rtype: Invoice
         :seealso: https://yookassa.ru/developers/api#create_invoice
@@ -42,14 +60,32 @@ class InvoicesAPI(BaseAPI[CreateInvoiceParams, Invoice]):
             params_class=CreateInvoiceParams,
             method_class=CreateInvoice,
             result_class=Invoice,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
-    async def get_invoice(self, invoice_id: str) -> Invoice:
+    async def get_invoice(
+        self,
+        invoice_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> Invoice:
         """
         Retrieve invoice information by invoice ID.
 
         :param invoice_id: Invoice identifier.
         :type invoice_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: Invoice object.
         :rtype: Invoice
         :seealso: https://yookassa.ru/developers/api#get_invoice
@@ -59,4 +95,7 @@ class InvoicesAPI(BaseAPI[CreateInvoiceParams, Invoice]):
             method_class=GetInvoice,
             result_class=Invoice,
             id_param_name="invoice_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
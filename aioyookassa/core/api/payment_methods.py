@@ -1,7 +1,9 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods import CreatePaymentMethod, GetPaymentMethod
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import CreatePaymentMethodParams
 from aioyookassa.types.payment import PaymentMethod
 
@@ -14,7 +16,14 @@ class PaymentMethodsAPI(BaseAPI[CreatePaymentMethodParams, PaymentMethod]):
     """
 
     async def create_payment_method(
-        self, params: Union[CreatePaymentMethodParams, dict, None] = None, **kwargs: Any
+        self,
+        params: Union[CreatePaymentMethodParams, dict, None] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
+        **kwargs: Any,
     ) -> PaymentMethod:
         # Note: Union with dict kept for backward compatibility with kwargs support
         """
@@ -23,6 +32,17 @@ class PaymentMethodsAPI(BaseAPI[CreatePaymentMethodParams, PaymentMethod]):
         :param params: Payment method parameters (CreatePaymentMethodParams or dict).
         :type params: Union[CreatePaymentMethodParams, dict, None]
         :param kwargs: Additional parameters (merged with params if params is None or dict).
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: PaymentMethod object.
         :rtype: PaymentMethod
         :seealso: https://yookassa.ru/developers/api#create_payment_method
@@ -62,14 +82,32 @@ class PaymentMethodsAPI(BaseAPI[CreatePaymentMethodParams, PaymentMethod]):
             params_class=CreatePaymentMethodParams,
             method_class=CreatePaymentMethod,
             result_class=PaymentMethod,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
-    async def get_payment_method(self, payment_method_id: str) -> PaymentMethod:
+    async def get_payment_method(
+        self,
+        payment_method_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> PaymentMethod:
         """
         Retrieve payment method information by ID.
 
         :param payment_method_id: Payment method identifier.
         :type payment_method_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: PaymentMethod object.
         :rtype: PaymentMethod
         :seealso: https://yookassa.ru/developers/api#get_payment_method
@@ -79,4 +117,7 @@ class PaymentMethodsAPI(BaseAPI[CreatePaymentMethodParams, PaymentMethod]):
             method_class=GetPaymentMethod,
             result_class=PaymentMethod,
             id_param_name="payment_method_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
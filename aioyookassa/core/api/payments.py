@@ -1,5 +1,6 @@
 from typing import Any, Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.payments import (
     CancelPayment,
@@ -8,6 +9,7 @@ from aioyookassa.core.methods.payments import (
     GetPayment,
     GetPayments,
 )
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types import Payment, PaymentsList
 from aioyookassa.types.params import (
     CapturePaymentParams,
@@ -26,12 +28,28 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
     async def create_payment(
         self,
         params: CreatePaymentParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Payment:
         """
         Create a new payment in YooKassa.
 
         :param params: Payment creation parameters (CreatePaymentParams).
         :type params: CreatePaymentParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Payment object.
         :rtype: Payment
         :seealso: https://yookassa.ru/developers/api#create_payment
@@ -51,11 +69,20 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
             params_class=CreatePaymentParams,
             method_class=CreatePayment,
             result_class=Payment,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
     async def get_payments(
         self,
         params: Optional[GetPaymentsParams] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        compact: bool = False,
         **kwargs: Any,
     ) -> PaymentsList:
         """
@@ -64,6 +91,16 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
         :param params: Filter parameters (GetPaymentsParams).
         :type params: Optional[GetPaymentsParams]
         :param kwargs: Additional parameters (merged with params).
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param compact: Return items as compact read-only objects that use
+            less memory (see :mod:`aioyookassa.types.compact`).
+        :type compact: bool
         :returns: Payments list object.
         :rtype: PaymentsList
         :seealso: https://yookassa.ru/developers/api#list_payments
@@ -79,15 +116,33 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
             params_class=GetPaymentsParams,
             method_class=GetPayments,
             result_class=PaymentsList,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            compact=compact,
             **kwargs,
         )
 
-    async def get_payment(self, payment_id: str) -> Payment:
+    async def get_payment(
+        self,
+        payment_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> Payment:
         """
         Retrieve payment information by payment ID.
 
         :param payment_id: Payment identifier.
         :type payment_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: Payment object.
         :rtype: Payment
         :seealso: https://yookassa.ru/developers/api#get_payment
@@ -97,12 +152,20 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
             method_class=GetPayment,
             result_class=Payment,
             id_param_name="payment_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
 
     async def capture_payment(
         self,
         payment_id: str,
         params: Optional[CapturePaymentParams] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Payment:
         """
         Capture (confirm) a payment.
@@ -111,6 +174,17 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
         :type payment_id: str
         :param params: Capture parameters (CapturePaymentParams).
         :type params: Optional[CapturePaymentParams]
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Payment object.
         :rtype: Payment
         :seealso: https://yookassa.ru/developers/api#capture_payment
@@ -127,14 +201,37 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
             method_class=CapturePayment,
             result_class=Payment,
             id_param_name="payment_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
-    async def cancel_payment(self, payment_id: str) -> Payment:
+    async def cancel_payment(
+        self,
+        payment_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
+    ) -> Payment:
         """
         Cancel a payment by its identifier.
 
         :param payment_id: Payment identifier.
         :type payment_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Payment object.
         :rtype: Payment
         :seealso: https://yookassa.ru/developers/api#cancel_payment
@@ -144,4 +241,8 @@ class PaymentsAPI(BaseAPI[CreatePaymentParams, Payment]):
             method_class=CancelPayment,
             result_class=Payment,
             id_param_name="payment_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
@@ -1,7 +1,9 @@
-from typing import Union
+from typing import Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.payouts import CreatePayout, GetPayout
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import CreatePayoutParams
 from aioyookassa.types.payout import Payout
 
@@ -16,12 +18,28 @@ class PayoutsAPI(BaseAPI[CreatePayoutParams, Payout]):
     async def create_payout(
         self,
         params: CreatePayoutParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Payout:
         """
         Create a new payout in YooKassa.
 
         :param params: Payout creation parameters (CreatePayoutParams).
         :type params: CreatePayoutParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Payout object.
         :rtype: Payout
         :seealso: https://yookassa.ru/developers/api#create_payout
@@ -43,14 +61,32 @@ class PayoutsAPI(BaseAPI[CreatePayoutParams, Payout]):
             params_class=CreatePayoutParams,
             method_class=CreatePayout,
             result_class=Payout,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
-    async def get_payout(self, payout_id: str) -> Payout:
+    async def get_payout(
+        self,
+        payout_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> Payout:
         """
         Retrieve payout information by payout ID.
 
         :param payout_id: Payout identifier.
         :type payout_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: Payout object.
         :rtype: Payout
         :seealso: https://yookassa.ru/developers/api#get_payout
@@ -60,4 +96,7 @@ class PayoutsAPI(BaseAPI[CreatePayoutParams, Payout]):
             method_class=GetPayout,
             result_class=Payout,
             id_param_name="payout_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
@@ -1,7 +1,9 @@
-from typing import Union
+from typing import Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.personal_data import CreatePersonalData, GetPersonalData
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import (
     CreatePersonalDataParams,
     PayoutStatementRecipientData,
@@ -20,12 +22,28 @@ class PersonalDataAPI(BaseAPI[CreatePersonalDataParams, PersonalData]):
     async def create_personal_data(
         self,
         params: CreatePersonalDataParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> PersonalData:
         """
         Create personal data in YooKassa.
 
         :param params: Personal data creation parameters (CreatePersonalDataParams).
         :type params: CreatePersonalDataParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: PersonalData object.
         :rtype: PersonalData
         :seealso: https://yookassa.ru/developers/api#create_personal_data
@@ -44,14 +62,32 @@ class PersonalDataAPI(BaseAPI[CreatePersonalDataParams, PersonalData]):
             params_class=CreatePersonalDataParams,  # type: ignore[arg-type]
             method_class=CreatePersonalData,
             result_class=PersonalData,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
-    async def get_personal_data(self, personal_data_id: str) -> PersonalData:
+    async def get_personal_data(
+        self,
+        personal_data_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> PersonalData:
         """
         Retrieve personal data information by personal data ID.
 
         :param personal_data_id: Personal data identifier.
         :type personal_data_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: PersonalData object.
         :rtype: PersonalData
         :seealso: https://yookassa.ru/developers/api#get_personal_data
@@ -61,4 +97,7 @@ class PersonalDataAPI(BaseAPI[CreatePersonalDataParams, PersonalData]):
             method_class=GetPersonalData,
             result_class=PersonalData,
             id_param_name="personal_data_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
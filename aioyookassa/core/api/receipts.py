@@ -1,7 +1,9 @@
 from typing import Any, Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.receipts import CreateReceipt, GetReceipt, GetReceipts
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import CreateReceiptParams, GetReceiptsParams
 from aioyookassa.types.receipt_registration import FiscalReceipt, FiscalReceiptsList
 
@@ -16,12 +18,28 @@ class ReceiptsAPI(BaseAPI[CreateReceiptParams, FiscalReceipt]):
     async def create_receipt(
         self,
         params: CreateReceiptParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> FiscalReceipt:
         """
         Create a new receipt registration.
 
         :param params: Receipt creation parameters (CreateReceiptParams).
         :type params: CreateReceiptParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: FiscalReceipt object.
         :rtype: FiscalReceipt
         :seealso: https://yookassa.ru/developers/api#create_receipt
@@ -42,11 +60,20 @@ class ReceiptsAPI(BaseAPI[CreateReceiptParams, FiscalReceipt]):
             params_class=CreateReceiptParams,
             method_class=CreateReceipt,
             result_class=FiscalReceipt,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
     async def get_receipts(
         self,
         params: Optional[GetReceiptsParams] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        compact: bool = False,
         **kwargs: Any,
     ) -> FiscalReceiptsList:
         """
@@ -55,6 +82,16 @@ class ReceiptsAPI(BaseAPI[CreateReceiptParams, FiscalReceipt]):
         :param params: Filter parameters (GetReceiptsParams).
         :type params: Optional[GetReceiptsParams]
         :param kwargs: Additional parameters (merged with params).
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param compact: Return items as compact read-only objects that use
+            less memory (see :mod:`aioyookassa.types.compact`).
+        :type compact: bool
         :returns: FiscalReceiptsList object.
         :rtype: FiscalReceiptsList
         :seealso: https://yookassa.ru/developers/api#get_receipts_list
@@ -70,14 +107,29 @@ class ReceiptsAPI(BaseAPI[CreateReceiptParams, FiscalReceipt]):
             params_class=GetReceiptsParams,
             method_class=GetReceipts,
             result_class=FiscalReceiptsList,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            compact=compact,
             **kwargs,
         )
 
-    async def get_receipt(self, receipt_id: str) -> FiscalReceipt:
+    async def get_receipt(
+        self,
+        receipt_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> FiscalReceipt:
         """
         Retrieve receipt registration information by receipt ID.
 
         :param receipt_id: Receipt identifier.
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
         :return: FiscalReceipt object.
         :seealso: https://yookassa.ru/developers/api#get_receipt
         """
@@ -86,4 +138,7 @@ class ReceiptsAPI(BaseAPI[CreateReceiptParams, FiscalReceipt]):
             method_class=GetReceipt,
             result_class=FiscalReceipt,
             id_param_name="receipt_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
@@ -1,7 +1,9 @@
 from typing import Any, Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.refunds import CreateRefund, GetRefund, GetRefunds
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import CreateRefundParams, GetRefundsParams
 from aioyookassa.types.refund import Refund, RefundsList
 
@@ -16,12 +18,28 @@ class RefundsAPI(BaseAPI[CreateRefundParams, Refund]):
     async def create_refund(
         self,
         params: CreateRefundParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Refund:
         """
         Create a new refund for a successful payment.
 
         :param params: Refund creation parameters (CreateRefundParams).
         :type params: CreateRefundParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Refund object.
         :rtype: Refund
         :seealso: https://yookassa.ru/developers/api#create_refund
@@ -40,11 +58,20 @@ class RefundsAPI(BaseAPI[CreateRefundParams, Refund]):
             params_class=CreateRefundParams,
             method_class=CreateRefund,
             result_class=Refund,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
     async def get_refunds(
         self,
         params: Optional[GetRefundsParams] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        compact: bool = False,
         **kwargs: Any,
     ) -> RefundsList:
         """
@@ -53,6 +80,16 @@ class RefundsAPI(BaseAPI[CreateRefundParams, Refund]):
         :param params: Filter parameters (GetRefundsParams).
         :type params: Optional[GetRefundsParams]
         :param kwargs: Additional parameters (merged with params).
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param compact: Return items as compact read-only objects that use
+            less memory (see :mod:`aioyookassa.types.compact`).
+        :type compact: bool
         :returns: Refunds list object.
         :rtype: RefundsList
         :seealso: https://yookassa.ru/developers/api#get_refunds_list
@@ -67,15 +104,33 @@ class RefundsAPI(BaseAPI[CreateRefundParams, Refund]):
             params_class=GetRefundsParams,
             method_class=GetRefunds,
             result_class=RefundsList,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            compact=compact,
             **kwargs,
         )
 
-    async def get_refund(self, refund_id: str) -> Refund:
+    async def get_refund(
+        self,
+        refund_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> Refund:
         """
         Retrieve refund information by refund ID.
 
         :param refund_id: Refund identifier.
         :type refund_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: Refund object.
         :rtype: Refund
         :seealso: https://yookassa.ru/developers/api#get_refund
@@ -85,4 +140,7 @@ class RefundsAPI(BaseAPI[CreateRefundParams, Refund]):
             method_class=GetRefund,
             result_class=Refund,
             id_param_name="refund_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
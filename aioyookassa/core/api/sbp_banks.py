@@ -1,5 +1,9 @@
+from typing import Optional
+
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI, _EmptyParams
 from aioyookassa.core.methods.sbp_banks import GetSbpBanks
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.sbp_banks import SbpBanksList
 
 
@@ -10,10 +14,20 @@ class SbpBanksAPI(BaseAPI[_EmptyParams, SbpBanksList]):
     Provides methods for retrieving SBP participant banks list.
     """
 
-    async def get_sbp_banks(self) -> SbpBanksList:
+    async def get_sbp_banks(
+        self,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> SbpBanksList:
         """
         Retrieve list of SBP participant banks.
 
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :param priority: Priority of the request with a scheduler.
         :returns: SbpBanksList object.
         :rtype: SbpBanksList
         :seealso: https://yookassa.ru/developers/api#get_sbp_banks
@@ -28,4 +42,7 @@ class SbpBanksAPI(BaseAPI[_EmptyParams, SbpBanksList]):
             params_class=None,
             method_class=GetSbpBanks,
             result_class=SbpBanksList,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
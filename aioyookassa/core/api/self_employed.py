@@ -1,7 +1,9 @@
-from typing import Union
+from typing import Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.self_employed import CreateSelfEmployed, GetSelfEmployed
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import CreateSelfEmployedParams
 from aioyookassa.types.payout import SelfEmployed
 
@@ -16,12 +18,28 @@ class SelfEmployedAPI(BaseAPI[CreateSelfEmployedParams, SelfEmployed]):
     async def create_self_employed(
         self,
         params: CreateSelfEmployedParams,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> SelfEmployed:
         """
         Create a new self-employed in YooKassa.
 
         :param params: Self-employed creation parameters (CreateSelfEmployedParams).
         :type params: CreateSelfEmployedParams
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: SelfEmployed object.
         :rtype: SelfEmployed
         :seealso: https://yookassa.ru/developers/api#create_self_employed
@@ -44,14 +62,32 @@ class SelfEmployedAPI(BaseAPI[CreateSelfEmployedParams, SelfEmployed]):
             params_class=CreateSelfEmployedParams,
             method_class=CreateSelfEmployed,
             result_class=SelfEmployed,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
 
-    async def get_self_employed(self, self_employed_id: str) -> SelfEmployed:
+    async def get_self_employed(
+        self,
+        self_employed_id: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> SelfEmployed:
         """
         Retrieve self-employed information by self-employed ID.
 
         :param self_employed_id: Self-employed identifier.
         :type self_employed_id: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: SelfEmployed object.
         :rtype: SelfEmployed
         :seealso: https://yookassa.ru/developers/api#get_self_employed
@@ -61,4 +97,7 @@ class SelfEmployedAPI(BaseAPI[CreateSelfEmployedParams, SelfEmployed]):
             method_class=GetSelfEmployed,
             result_class=SelfEmployed,
             id_param_name="self_employed_id",
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
         )
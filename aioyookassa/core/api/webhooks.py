@@ -1,7 +1,9 @@
 from typing import Optional, Union
 
+from aioyookassa.core.abc.client import TimeoutType
 from aioyookassa.core.api.base import BaseAPI
 from aioyookassa.core.methods.webhooks import CreateWebhook, DeleteWebhook, GetWebhooks
+from aioyookassa.core.priority import PriorityType
 from aioyookassa.types.params import CreateWebhookParams
 from aioyookassa.types.webhooks import Webhook, WebhooksList
 
@@ -18,6 +20,11 @@ class WebhooksAPI(BaseAPI[CreateWebhookParams, Webhook]):
         self,
         params: CreateWebhookParams,
         oauth_token: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+        operation_id: Optional[str] = None,
     ) -> Webhook:
         """
         Create a new webhook in YooKassa.
@@ -26,6 +33,17 @@ class WebhooksAPI(BaseAPI[CreateWebhookParams, Webhook]):
         :type params: CreateWebhookParams
         :param oauth_token: OAuth token for authentication.
         :type oauth_token: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
+        :param operation_id: Caller's ID of the operation, e.g. an order ID.
+            Repeated operations get the same idempotence key, so they are
+            not performed twice (see :mod:`aioyookassa.core.idempotency`).
+        :type operation_id: Optional[str]
         :returns: Webhook object.
         :rtype: Webhook
         :seealso: https://yookassa.ru/developers/api#create_webhook
@@ -37,23 +55,37 @@ class WebhooksAPI(BaseAPI[CreateWebhookParams, Webhook]):
         headers = {
             "Authorization": f"Bearer {oauth_token}",
         }
-        from aioyookassa.core.utils import create_idempotence_headers
-
-        headers.update(create_idempotence_headers())
-        result = await self._client._send_request(
-            CreateWebhook, json=json_data, headers=headers
+        result = await self._send_mutation(
+            CreateWebhook,
+            json=json_data,
+            headers=headers,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+            operation_id=operation_id,
         )
         return Webhook(**result)
 
     async def get_webhooks(
         self,
         oauth_token: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
     ) -> WebhooksList:
         """
         Retrieve a list of webhooks for the OAuth token.
 
         :param oauth_token: OAuth token for authentication.
         :type oauth_token: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: WebhooksList object.
         :rtype: WebhooksList
         :seealso: https://yookassa.ru/developers/api#list_webhooks
@@ -61,13 +93,23 @@ class WebhooksAPI(BaseAPI[CreateWebhookParams, Webhook]):
         headers = {
             "Authorization": f"Bearer {oauth_token}",
         }
-        result = await self._client._send_request(GetWebhooks, headers=headers)
+        result = await self._client._send_request(
+            GetWebhooks,
+            headers=headers,
+            timeout=timeout,
+            deadline=deadline,
+            priority=self._get_priority(priority),
+        )
         return WebhooksList(**result)
 
     async def delete_webhook(
         self,
         webhook_id: str,
         oauth_token: str,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
     ) -> None:
         """
         Delete a webhook by its ID.
@@ -76,6 +118,13 @@ class WebhooksAPI(BaseAPI[CreateWebhookParams, Webhook]):
         :type webhook_id: str
         :param oauth_token: OAuth token for authentication.
         :type oauth_token: str
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :seealso: https://yookassa.ru/developers/api#delete_webhook
         """
         method = DeleteWebhook.build(webhook_id=webhook_id)
@@ -83,4 +132,10 @@ class WebhooksAPI(BaseAPI[CreateWebhookParams, Webhook]):
             "Authorization": f"Bearer {oauth_token}",
         }
         # DELETE returns empty body (204 No Content), _send_request handles it
-        await self._client._send_request(method, headers=headers)
+        await self._client._send_request(
+            method,
+            headers=headers,
+            timeout=timeout,
+            deadline=deadline,
+            priority=self._get_priority(priority),
+        )
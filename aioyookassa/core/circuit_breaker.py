@@ -0,0 +1,208 @@
+"""
+Circuit breaker for YooKassa API endpoint families.
+"""
+
+import time
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from aioyookassa.exceptions import APIError, CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    """
+    Circuit breaker state.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    """
+    State of a single endpoint family.
+    """
+
+    __slots__ = ("state", "failures", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker keyed by endpoint family (``/payments``, ``/refunds``, ...).
+
+    After ``failure_threshold`` consecutive failures the circuit of the family
+    opens and requests fail fast with :class:`CircuitOpenError` instead of
+    waiting for the request timeout. After ``recovery_timeout`` seconds the
+    circuit becomes half-open and lets up to ``half_open_max_calls`` probe
+    requests through: a successful probe closes the circuit, a failed one
+    opens it again.
+
+    Retryable errors (timeouts, network, 429 and 5xx responses) count as
+    failures, as do successful responses slower than ``slow_call_threshold``.
+    Other API errors mean the service is healthy and count as successes.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        slow_call_threshold: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param recovery_timeout: Seconds the circuit stays open before probing.
+        :param half_open_max_calls: Concurrent probe requests in half-open state.
+        :param slow_call_threshold: Duration in seconds after which a successful
+            call is counted as a failure. Disabled by default.
+        :param clock: Monotonic time source.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_threshold = slow_call_threshold
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+
+    @staticmethod
+    def get_family(path: str) -> str:
+        """
+        Get endpoint family for the request path.
+
+        :param path: Request path (e.g. ``/payments/{id}/capture``)
+        :return: Endpoint family (e.g. ``/payments``)
+        """
+        return "/" + path.lstrip("/").split("/", 1)[0]
+
+    def get_state(self, family: str) -> CircuitState:
+        """
+        Get current state of the endpoint family circuit.
+
+        :param family: Endpoint family
+        :return: Circuit state
+        """
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            return CircuitState.CLOSED
+        if (
+            circuit.state == CircuitState.OPEN
+            and self._clock() - circuit.opened_at >= self.recovery_timeout
+        ):
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+    def before_request(self, family: str) -> None:
+        """
+        Check whether a request to the endpoint family may be sent.
+
+        :param family: Endpoint family
+        :raises CircuitOpenError: If the circuit is open or all probes are taken
+        """
+        circuit = self._circuits.get(family)
+        if circuit is None or circuit.state == CircuitState.CLOSED:
+            return
+        if circuit.state == CircuitState.OPEN:
+            remaining = self.recovery_timeout - (self._clock() - circuit.opened_at)
+            if remaining > 0:
+                raise self._open_error(family, remaining)
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probes = 0
+        if circuit.probes >= self.half_open_max_calls:
+            raise self._open_error(family, self.recovery_timeout)
+        circuit.probes += 1
+
+    def record_success(self, family: str, duration: Optional[float] = None) -> None:
+        """
+        Record a completed request.
+
+        :param family: Endpoint family
+        :param duration: Request duration in seconds
+        """
+        if (
+            self.slow_call_threshold is not None
+            and duration is not None
+            and duration > self.slow_call_threshold
+        ):
+            self.record_failure(family)
+            return
+        circuit = self._circuits.get(family)
+        if circuit is not None:
+            circuit.state = CircuitState.CLOSED
+            circuit.failures = 0
+            circuit.probes = 0
+
+    def record_failure(self, family: str) -> None:
+        """
+        Record a failed request.
+
+        :param family: Endpoint family
+        """
+        circuit = self._circuits.setdefault(family, _Circuit())
+        circuit.failures += 1
+        if (
+            circuit.state == CircuitState.HALF_OPEN
+            or circuit.failures >= self.failure_threshold
+        ):
+            circuit.state = CircuitState.OPEN
+            circuit.opened_at = self._clock()
+            circuit.probes = 0
+
+    def record_error(
+        self, family: str, error: BaseException, duration: Optional[float] = None
+    ) -> None:
+        """
+        Record a request that raised an error.
+
+        :param family: Endpoint family
+        :param error: Raised exception
+        :param duration: Request duration in seconds
+        """
+        if isinstance(error, APIError) and not error.retryable:
+            self.record_success(family, duration)
+        elif isinstance(error, Exception):
+            self.record_failure(family)
+        else:
+            self.release(family)
+
+    def release(self, family: str) -> None:
+        """
+        Release a probe slot without recording an outcome (e.g. on cancellation).
+
+        :param family: Endpoint family
+        """
+        circuit = self._circuits.get(family)
+        if circuit is not None and circuit.probes > 0:
+            circuit.probes -= 1
+
+    def reset(self, family: Optional[str] = None) -> None:
+        """
+        Close circuits and forget collected failures.
+
+        :param family: Endpoint family to reset. Resets all if None.
+        """
+        if family is None:
+            self._circuits.clear()
+        else:
+            self._circuits.pop(family, None)
+
+    def _open_error(self, family: str, retry_after: float) -> CircuitOpenError:
+        error = CircuitOpenError(
+            f"Circuit for {family} is open: requests are failing fast"
+        )
+        error.family = family
+        error.retry_after = retry_after
+        return error
@@ -1,25 +1,73 @@
+import importlib
 import logging
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Any, Generic, Optional, Type, TypeVar, Union, overload
 
 from aiohttp import ClientTimeout, TCPConnector
 
-from aioyookassa.core.abc.client import BaseAPIClient
-from aioyookassa.core.api import (
-    DealsAPI,
-    InvoicesAPI,
-    PaymentMethodsAPI,
-    PaymentsAPI,
-    PayoutsAPI,
-    PersonalDataAPI,
-    ReceiptsAPI,
-    RefundsAPI,
-    SbpBanksAPI,
-    SelfEmployedAPI,
-    WebhooksAPI,
-)
+from aioyookassa.core.abc.client import BaseAPIClient, TimeoutType
+from aioyookassa.core.circuit_breaker import CircuitBreaker
+from aioyookassa.core.hedging import HedgingPolicy
+from aioyookassa.core.idempotency import IdempotencyManager
 from aioyookassa.core.methods.me import GetMe
+from aioyookassa.core.priority import PriorityScheduler, PriorityType
+from aioyookassa.core.transport import BaseTransport
 from aioyookassa.types.settings import Settings
 
+if TYPE_CHECKING:
+    from aioyookassa.core.api import (
+        DealsAPI,
+        InvoicesAPI,
+        PaymentMethodsAPI,
+        PaymentsAPI,
+        PayoutsAPI,
+        PersonalDataAPI,
+        ReceiptsAPI,
+        RefundsAPI,
+        SbpBanksAPI,
+        SelfEmployedAPI,
+        WebhooksAPI,
+    )
+
+TAPI = TypeVar("TAPI")
+
+
+class _APIModule(Generic[TAPI]):
+    """
+    Client attribute creating an API module on first access.
+
+    The module of the API class is imported only then, so clients that use
+    a few APIs do not import the others.
+    """
+
+    def __init__(self, module: str, name: str):
+        """
+        Initialize API module attribute.
+
+        :param module: Module of the API class
+        :param name: API class name
+        """
+        self.module = module
+        self.name = name
+        self.attribute = ""
+
+    def __set_name__(self, owner: Type[Any], attribute: str) -> None:
+        self.attribute = attribute
+
+    @overload
+    def __get__(self, instance: None, owner: Type[Any]) -> "_APIModule[TAPI]": ...
+
+    @overload
+    def __get__(self, instance: "YooKassa", owner: Type[Any]) -> TAPI: ...
+
+    def __get__(self, instance: Optional["YooKassa"], owner: Type[Any]) -> Any:
+        if instance is None:
+            return self
+        api_class = getattr(importlib.import_module(self.module), self.name)
+        api = api_class(instance)
+        # Stored on the instance, which takes precedence over this descriptor
+        instance.__dict__[self.attribute] = api
+        return api
+
 
 class YooKassa(BaseAPIClient):
     """
@@ -38,8 +86,42 @@ class YooKassa(BaseAPIClient):
     - personal_data: Personal data operations
     - deals: Safe Deal operations
     - webhooks: Webhook operations (requires OAuth token)
+
+    API modules are created on first access.
     """
 
+    payments: "_APIModule[PaymentsAPI]" = _APIModule(
+        "aioyookassa.core.api.payments", "PaymentsAPI"
+    )
+    payment_methods: "_APIModule[PaymentMethodsAPI]" = _APIModule(
+        "aioyookassa.core.api.payment_methods", "PaymentMethodsAPI"
+    )
+    invoices: "_APIModule[InvoicesAPI]" = _APIModule(
+        "aioyookassa.core.api.invoices", "InvoicesAPI"
+    )
+    refunds: "_APIModule[RefundsAPI]" = _APIModule(
+        "aioyookassa.core.api.refunds", "RefundsAPI"
+    )
+    receipts: "_APIModule[ReceiptsAPI]" = _APIModule(
+        "aioyookassa.core.api.receipts", "ReceiptsAPI"
+    )
+    payouts: "_APIModule[PayoutsAPI]" = _APIModule(
+        "aioyookassa.core.api.payouts", "PayoutsAPI"
+    )
+    self_employed: "_APIModule[SelfEmployedAPI]" = _APIModule(
+        "aioyookassa.core.api.self_employed", "SelfEmployedAPI"
+    )
+    sbp_banks: "_APIModule[SbpBanksAPI]" = _APIModule(
+        "aioyookassa.core.api.sbp_banks", "SbpBanksAPI"
+    )
+    personal_data: "_APIModule[PersonalDataAPI]" = _APIModule(
+        "aioyookassa.core.api.personal_data", "PersonalDataAPI"
+    )
+    deals: "_APIModule[DealsAPI]" = _APIModule("aioyookassa.core.api.deals", "DealsAPI")
+    webhooks: "_APIModule[WebhooksAPI]" = _APIModule(
+        "aioyookassa.core.api.webhooks", "WebhooksAPI"
+    )
+
     def __init__(
         self,
         api_key: str,
@@ -49,6 +131,11 @@ class YooKassa(BaseAPIClient):
         proxy: Optional[str] = None,
         enable_logging: bool = False,
         logger: Optional[logging.Logger] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        transport: Optional[BaseTransport] = None,
+        idempotency: Optional[IdempotencyManager] = None,
+        scheduler: Optional[PriorityScheduler] = None,
     ):
         super().__init__(
             api_key=api_key,
@@ -58,29 +145,43 @@ class YooKassa(BaseAPIClient):
             proxy=proxy,
             enable_logging=enable_logging,
             logger=logger,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            transport=transport,
+            idempotency=idempotency,
+            scheduler=scheduler,
         )
-        self.payments = PaymentsAPI(self)
-        self.payment_methods = PaymentMethodsAPI(self)
-        self.invoices = InvoicesAPI(self)
-        self.refunds = RefundsAPI(self)
-        self.receipts = ReceiptsAPI(self)
-        self.payouts = PayoutsAPI(self)
-        self.self_employed = SelfEmployedAPI(self)
-        self.sbp_banks = SbpBanksAPI(self)
-        self.personal_data = PersonalDataAPI(self)
-        self.deals = DealsAPI(self)
-        self.webhooks = WebhooksAPI(self)
-
-    async def get_me(self, on_behalf_of: Optional[str] = None) -> Settings:
+
+    async def get_me(
+        self,
+        on_behalf_of: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutType] = None,
+        deadline: Optional[float] = None,
+        priority: Optional[PriorityType] = None,
+    ) -> Settings:
         """
         Get shop or gateway settings information.
 
         :param on_behalf_of: Shop ID for Split payments. Only for those who use Split payments.
         :type on_behalf_of: Optional[str]
+        :param timeout: Per-call timeout in seconds or ClientTimeout.
+            Defaults to the client timeout.
+        :type timeout: Optional[TimeoutType]
+        :param deadline: Absolute deadline as a ``time.monotonic()`` value.
+        :type deadline: Optional[float]
+        :param priority: Priority of the request with a scheduler.
+        :type priority: Optional[PriorityType]
         :returns: Settings object with shop or gateway information.
         :rtype: Settings
         :seealso: https://yookassa.ru/developers/api#me
         """
         params = GetMe.build_params(on_behalf_of=on_behalf_of)
-        result = await self._send_request(GetMe, params=params)
+        result = await self._send_request(
+            GetMe,
+            params=params,
+            timeout=timeout,
+            deadline=deadline,
+            priority=priority,
+        )
         return Settings(**result)
@@ -0,0 +1,141 @@
+"""
+Request hedging for latency-critical idempotent GET endpoints.
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Optional, Tuple, Type
+
+from aioyookassa.core.methods.base import APIMethod
+
+
+def _get_default_methods() -> Tuple[Type[APIMethod[Any]], ...]:
+    """
+    Get method classes hedged by default.
+
+    The method modules import their types, so they are imported only when a
+    policy is created, not with the client.
+
+    :return: Lookups of payments, refunds, payouts and deals
+    """
+    from aioyookassa.core.methods.deals import GetDeal
+    from aioyookassa.core.methods.payments import GetPayment
+    from aioyookassa.core.methods.payouts import GetPayout
+    from aioyookassa.core.methods.refunds import GetRefund
+
+    return (GetPayment, GetRefund, GetPayout, GetDeal)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DEFAULT_HEDGED_METHODS":
+        return _get_default_methods()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class HedgingPolicy:
+    """
+    Policy for hedged requests.
+
+    If a hedgeable request has not completed after the hedge delay, a
+    duplicate request is sent and the first response wins; the other one is
+    cancelled. The delay is either fixed or derived from the observed latency
+    percentile of the hedgeable requests (p95 by default).
+
+    Hedges are limited by a token budget: every request earns
+    ``max_hedge_ratio`` tokens (up to ``burst``) and every hedge spends one,
+    so in the long run at most ``max_hedge_ratio`` of the traffic is
+    duplicated.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 1000,
+        max_hedge_ratio: float = 0.05,
+        burst: float = 10.0,
+        methods: Optional[Tuple[Type[APIMethod[Any]], ...]] = None,
+    ):
+        """
+        Initialize hedging policy.
+
+        :param delay: Fixed hedge delay in seconds. If None, the delay is
+            derived from the observed latency percentile.
+        :param percentile: Latency percentile used as the hedge delay.
+        :param min_samples: Samples required before the derived delay is used.
+            Requests are not hedged until then.
+        :param window: Number of latest latencies kept for the percentile.
+        :param max_hedge_ratio: Share of requests that may be hedged.
+        :param burst: Maximum number of hedges that can be sent in a row.
+        :param methods: API method classes that may be hedged. Only idempotent
+            GET methods should be listed. Defaults to ``DEFAULT_HEDGED_METHODS``:
+            lookups of payments, refunds, payouts and deals.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.burst = burst
+        self.methods = methods if methods is not None else _get_default_methods()
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._tokens = burst
+        self._cached_delay: Optional[float] = None
+        self._new_samples = 0
+
+    def is_hedgeable(self, method: APIMethod[Any]) -> bool:
+        """
+        Check whether the request may be hedged.
+
+        :param method: API method instance
+        :return: True for GET requests of the hedged method classes
+        """
+        return method.http_method == "GET" and isinstance(method, self.methods)
+
+    def get_delay(self) -> Optional[float]:
+        """
+        Get current hedge delay.
+
+        :return: Delay in seconds or None if not enough samples were collected
+        """
+        if self.delay is not None:
+            return self.delay
+        if len(self._latencies) < self.min_samples:
+            return None
+        # Sorting the window is cheap but not free: refresh every few samples
+        if self._cached_delay is None or self._new_samples >= 10:
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+            self._cached_delay = ordered[index]
+            self._new_samples = 0
+        return self._cached_delay
+
+    def record_latency(self, duration: float) -> None:
+        """
+        Record latency of a completed hedgeable request.
+
+        :param duration: Request duration in seconds
+        """
+        self._latencies.append(duration)
+        self._new_samples += 1
+
+    def on_request(self) -> None:
+        """
+        Earn hedge budget for a hedgeable request.
+        """
+        self._tokens = min(self.burst, self._tokens + self.max_hedge_ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Spend hedge budget.
+
+        :return: True if a hedge may be sent
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
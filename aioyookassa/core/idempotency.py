@@ -0,0 +1,373 @@
+"""
+Deterministic idempotence keys and stored results of mutating requests.
+
+By default every mutating request gets a random idempotence key, so an
+application-level retry (e.g. a job re-run after a crash) creates a second
+payment. With an :class:`IdempotencyManager` the key is derived from an
+operation ID supplied by the caller: a repeated operation sends the same key,
+and YooKassa returns the result of the first request instead of repeating
+it. Results are stored, so repeated operations are answered from the store
+without a request at all.
+
+YooKassa keeps an idempotence key for 24 hours, so stored results expire
+after the same time.
+
+Example:
+    >>> manager = IdempotencyManager(SQLiteIdempotencyStore("keys.sqlite3"))
+    >>> client = YooKassa(api_key="secret", shop_id=123456, idempotency=manager)
+    >>> payment = await client.payments.create_payment(
+    ...     params, operation_id=f"order-{order.id}"
+    ... )
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from aioyookassa.core.methods.base import APIMethod
+from aioyookassa.core.utils import clean_request_data, generate_idempotence_key
+
+logger = logging.getLogger(__name__)
+
+# Time in seconds YooKassa keeps an idempotence key
+IDEMPOTENCE_KEY_TTL = 24 * 60 * 60
+
+# Namespace of the UUIDs derived from operations
+_NAMESPACE = uuid.UUID("5b0f4d3e-8c3a-5d5e-9a55-8a1f1d0c2f6b")
+
+
+class IdempotencyStore(abc.ABC):
+    """
+    Base class for stores of results of idempotent requests.
+
+    Results are JSON-compatible response dicts stored by idempotence key
+    with the time they were saved.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """
+        Get stored result.
+
+        :param key: Idempotence key
+        :return: Time the result was saved and the result, or None
+        """
+
+    @abc.abstractmethod
+    async def set(self, key: str, result: Dict[str, Any], saved_at: float) -> None:
+        """
+        Save result.
+
+        :param key: Idempotence key
+        :param result: Response of the request
+        :param saved_at: Time of saving as a ``time.time()`` value
+        """
+
+    @abc.abstractmethod
+    async def purge(self, before: float) -> int:
+        """
+        Delete results saved before the given time.
+
+        :param before: Time as a ``time.time()`` value
+        :return: Number of deleted results
+        """
+
+    async def close(self) -> None:
+        """Release store resources."""
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    Store in process memory.
+
+    Results are lost on restart, so it only deduplicates retries within one
+    process; use :class:`SQLiteIdempotencyStore` to survive crashes.
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    async def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        return self._results.get(key)
+
+    async def set(self, key: str, result: Dict[str, Any], saved_at: float) -> None:
+        self._results[key] = (saved_at, result)
+
+    async def purge(self, before: float) -> int:
+        expired = [
+            key for key, (saved_at, _) in self._results.items() if saved_at < before
+        ]
+        for key in expired:
+            del self._results[key]
+        return len(expired)
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """
+    Store in an SQLite database.
+
+    Queries run directly on the event loop. Lookups by the primary key take
+    microseconds, but saving a result to a database file commits it and
+    waits for the disk, which may block the loop for milliseconds. Use
+    ``PRAGMA synchronous = NORMAL`` with the WAL journal, or a store running
+    queries in an executor, where that matters.
+
+    Example:
+        >>> store = SQLiteIdempotencyStore("keys.sqlite3")
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS idempotency_results (
+            key TEXT PRIMARY KEY,
+            saved_at REAL NOT NULL,
+            result TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idempotency_results_saved_at
+            ON idempotency_results (saved_at);
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize SQLite store.
+
+        :param path: Database file path. Defaults to an in-memory database.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+
+    async def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        row = self._connection.execute(
+            "SELECT saved_at, result FROM idempotency_results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    async def set(self, key: str, result: Dict[str, Any], saved_at: float) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO idempotency_results VALUES (?, ?, ?)",
+                (key, saved_at, json.dumps(result, ensure_ascii=False)),
+            )
+
+    async def purge(self, before: float) -> int:
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM idempotency_results WHERE saved_at < ?", (before,)
+            )
+        return cursor.rowcount
+
+    async def close(self) -> None:
+        self._connection.close()
+
+
+class IdempotencyManager:
+    """
+    Manager of idempotence keys and stored results of mutating requests.
+
+    The key of a request is derived from the shop, the endpoint and the
+    operation ID given by the caller. Without an operation ID the key is
+    random, unless ``keys_from_params`` is set: then it is derived from the
+    request body, so identical requests within 24 hours are sent only once.
+
+    Successful results are saved in the store and returned for repeated
+    operations without a request. Concurrent requests of one operation in
+    the process share a single API request.
+    """
+
+    def __init__(
+        self,
+        store: Optional[IdempotencyStore] = None,
+        ttl: float = IDEMPOTENCE_KEY_TTL,
+        keys_from_params: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize idempotency manager.
+
+        :param store: Store of results. Defaults to
+            :class:`MemoryIdempotencyStore`.
+        :param ttl: Time in seconds results are returned from the store.
+            Defaults to the 24 hours YooKassa keeps a key; a longer time
+            would return results of keys the API has already forgotten.
+        :param keys_from_params: Derive keys of requests without an operation
+            ID from their bodies. Two identical payments within ``ttl`` are
+            then one payment, so enable it only if that is intended.
+        :param clock: Wall clock used for expiration.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.store = store or MemoryIdempotencyStore()
+        self.ttl = ttl
+        self.keys_from_params = keys_from_params
+        self._clock = clock
+        self._pending: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def get_key(
+        self,
+        shop_id: str,
+        method: APIMethod[Any],
+        json_data: Optional[Dict[str, Any]] = None,
+        operation_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Get idempotence key of a request.
+
+        :param shop_id: Shop ID the request is sent for
+        :param method: API method of the request
+        :param json_data: Request body
+        :param operation_id: Operation ID given by the caller
+        :return: Derived key, or None if the request gets a random key
+        """
+        if operation_id is not None:
+            source = f"operation\n{operation_id}"
+        elif self.keys_from_params:
+            body = json.dumps(
+                clean_request_data(json_data or {}),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+                default=str,
+            )
+            source = f"params\n{body}"
+        else:
+            return None
+        return _derive_key(shop_id, method, source)
+
+    async def get_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get stored result of a request that has not expired.
+
+        :param key: Idempotence key
+        :return: Result or None
+        """
+        stored = await self.store.get(key)
+        if stored is None or stored[0] <= self._clock() - self.ttl:
+            return None
+        return stored[1]
+
+    async def execute(
+        self,
+        key: str,
+        send: Callable[[str], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return the stored result of a request or send it and store the result.
+
+        A result that cannot be stored is logged and still returned: the
+        request has succeeded, and a repeated operation sends the same key,
+        so YooKassa answers it with the same object.
+
+        If the caller sending the shared request is cancelled, the concurrent
+        callers are not: one of them sends the request again.
+
+        :param key: Idempotence key
+        :param send: Sends the request with the given key
+        :return: Result of the request
+        """
+        pending = self._pending.get(key)
+        while pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    # This caller is cancelled
+                    raise
+            # The sending caller was cancelled and has cleared its request
+            pending = self._pending.get(key)
+        result = await self.get_result(key)
+        if result is not None:
+            return result
+        future: "asyncio.Future[Dict[str, Any]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[key] = future
+        try:
+            result = await send(key)
+            try:
+                await self.store.set(key, result, self._clock())
+            except Exception as e:
+                logger.error(
+                    f"Failed to store result of idempotence key {key}: {e}",
+                    exc_info=True,
+                )
+        except asyncio.CancelledError:
+            # Wakes the waiting callers, they retry without this request
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved for futures nobody waits for
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._pending[key]
+
+    async def purge(self) -> int:
+        """
+        Delete expired results from the store.
+
+        :return: Number of deleted results
+        """
+        return await self.store.purge(self._clock() - self.ttl)
+
+    async def close(self) -> None:
+        """Close the store."""
+        await self.store.close()
+
+
+def _derive_key(shop_id: str, method: APIMethod[Any], source: str) -> str:
+    """
+    Derive idempotence key of a request.
+
+    :param shop_id: Shop ID the request is sent for
+    :param method: API method of the request
+    :param source: Operation ID or body the key is derived from
+    :return: UUID string, like random keys
+    """
+    return str(
+        uuid.uuid5(
+            _NAMESPACE, f"{shop_id}\n{method.http_method} {method.path}\n{source}"
+        )
+    )
+
+
+async def send_idempotent(
+    manager: Optional[IdempotencyManager],
+    shop_id: str,
+    method: APIMethod[Any],
+    send: Callable[[str], Awaitable[Dict[str, Any]]],
+    json_data: Optional[Dict[str, Any]] = None,
+    operation_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Send mutating request with an idempotence key.
+
+    Without a manager the key is derived from the operation ID if it is
+    given and random otherwise.
+
+    :param manager: Idempotency manager of the client
+    :param shop_id: Shop ID the request is sent for
+    :param method: API method of the request
+    :param send: Sends the request with the given key
+    :param json_data: Request body
+    :param operation_id: Operation ID given by the caller
+    :return: Result of the request
+    """
+    if manager is None:
+        if operation_id is None:
+            return await send(generate_idempotence_key())
+        return await send(_derive_key(shop_id, method, f"operation\n{operation_id}"))
+    key = manager.get_key(shop_id, method, json_data, operation_id)
+    if key is None:
+        return await send(generate_idempotence_key())
+    return await manager.execute(key, send)
@@ -1,22 +1,68 @@
-from .base import APIMethod, BaseAPIMethod
-from .deals import CreateDeal, GetDeal, GetDeals
-from .invoices import CreateInvoice, GetInvoice
-from .me import GetMe
-from .payment_methods import CreatePaymentMethod, GetPaymentMethod
-from .payments import (
-    CancelPayment,
-    CapturePayment,
-    CreatePayment,
-    GetPayment,
-    GetPayments,
-)
-from .payouts import CreatePayout, GetPayout
-from .personal_data import CreatePersonalData, GetPersonalData
-from .receipts import CreateReceipt, GetReceipt, GetReceipts
-from .refunds import CreateRefund, GetRefund, GetRefunds
-from .sbp_banks import GetSbpBanks
-from .self_employed import CreateSelfEmployed, GetSelfEmployed
-from .webhooks import CreateWebhook, DeleteWebhook, GetWebhooks
+"""
+YooKassa API methods.
+
+Method classes are imported from their modules on first access (PEP 562).
+"""
+
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from aioyookassa._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .base import APIMethod, BaseAPIMethod
+    from .deals import CreateDeal, GetDeal, GetDeals
+    from .invoices import CreateInvoice, GetInvoice
+    from .me import GetMe
+    from .payment_methods import CreatePaymentMethod, GetPaymentMethod
+    from .payments import (
+        CancelPayment,
+        CapturePayment,
+        CreatePayment,
+        GetPayment,
+        GetPayments,
+    )
+    from .payouts import CreatePayout, GetPayout
+    from .personal_data import CreatePersonalData, GetPersonalData
+    from .receipts import CreateReceipt, GetReceipt, GetReceipts
+    from .refunds import CreateRefund, GetRefund, GetRefunds
+    from .sbp_banks import GetSbpBanks
+    from .self_employed import CreateSelfEmployed, GetSelfEmployed
+    from .webhooks import CreateWebhook, DeleteWebhook, GetWebhooks
+
+# Submodule and attribute of every exported name
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "APIMethod": (".base", "APIMethod"),
+    "BaseAPIMethod": (".base", "BaseAPIMethod"),
+    "CreateDeal": (".deals", "CreateDeal"),
+    "GetDeal": (".deals", "GetDeal"),
+    "GetDeals": (".deals", "GetDeals"),
+    "CreateInvoice": (".invoices", "CreateInvoice"),
+    "GetInvoice": (".invoices", "GetInvoice"),
+    "GetMe": (".me", "GetMe"),
+    "CreatePaymentMethod": (".payment_methods", "CreatePaymentMethod"),
+    "GetPaymentMethod": (".payment_methods", "GetPaymentMethod"),
+    "CancelPayment": (".payments", "CancelPayment"),
+    "CapturePayment": (".payments", "CapturePayment"),
+    "CreatePayment": (".payments", "CreatePayment"),
+    "GetPayment": (".payments", "GetPayment"),
+    "GetPayments": (".payments", "GetPayments"),
+    "CreatePayout": (".payouts", "CreatePayout"),
+    "GetPayout": (".payouts", "GetPayout"),
+    "CreatePersonalData": (".personal_data", "CreatePersonalData"),
+    "GetPersonalData": (".personal_data", "GetPersonalData"),
+    "CreateReceipt": (".receipts", "CreateReceipt"),
+    "GetReceipt": (".receipts", "GetReceipt"),
+    "GetReceipts": (".receipts", "GetReceipts"),
+    "CreateRefund": (".refunds", "CreateRefund"),
+    "GetRefund": (".refunds", "GetRefund"),
+    "GetRefunds": (".refunds", "GetRefunds"),
+    "GetSbpBanks": (".sbp_banks", "GetSbpBanks"),
+    "CreateSelfEmployed": (".self_employed", "CreateSelfEmployed"),
+    "GetSelfEmployed": (".self_employed", "GetSelfEmployed"),
+    "CreateWebhook": (".webhooks", "CreateWebhook"),
+    "DeleteWebhook": (".webhooks", "DeleteWebhook"),
+    "GetWebhooks": (".webhooks", "GetWebhooks"),
+}
 
 __all__ = [
     "APIMethod",
@@ -51,3 +97,6 @@ __all__ = [
     "DeleteWebhook",
     "GetMe",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _EXPORTS)
@@ -1,4 +1,7 @@
-from typing import Any, Generic, Literal, Optional, TypeVar
+import re
+from string import Formatter
+from typing import Any, Generic, Literal, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import quote
 
 from pydantic import BaseModel
 
@@ -7,14 +10,130 @@ T = TypeVar("T")
 # HTTP method types for better type checking
 HTTPMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 
+# Values of unreserved characters only are used in paths as is
+_is_unreserved = re.compile(r"[A-Za-z0-9_~-][A-Za-z0-9._~-]*").fullmatch
+
+
+class PathTemplate:
+    """
+    Path template of an API method compiled once per method class.
+
+    The template (e.g. ``/payments/{payment_id}/capture``) is split into
+    literal parts and parameter names, so building a path is a join of the
+    escaped values instead of ``str.format`` with error handling.
+
+    :param template: Path template with ``{name}`` placeholders
+    :raises ValueError: If a placeholder is not a plain name
+    """
+
+    __slots__ = ("template", "names", "_literals", "_parts")
+
+    def __init__(self, template: str) -> None:
+        literals = [""]
+        names = []
+        for literal, name, spec, conversion in Formatter().parse(template):
+            literals[-1] += literal
+            if name is None:
+                continue
+            if not name.isidentifier() or spec or conversion:
+                raise ValueError(
+                    f"Invalid placeholder '{{{name}}}' in path '{template}'"
+                )
+            names.append(name)
+            literals.append("")
+        self.template = template
+        self.names: Tuple[str, ...] = tuple(names)
+        self._literals: Tuple[str, ...] = tuple(literals)
+        # Names with the literal following each of them
+        self._parts = tuple(zip(self.names, self._literals[1:]))
+
+    def format(self, params: Mapping[str, Any], prefix: str = "") -> str:
+        """
+        Build path with the given parameter values.
+
+        Values are URL-escaped, so an ID cannot change the endpoint; parameters
+        absent from the template are ignored.
+
+        :param params: Values of the placeholders
+        :param prefix: String to prepend to the path, e.g. the API base URL
+        :return: Request path
+        :raises ValueError: If a parameter is missing or its value is empty
+        """
+        path = prefix + self._literals[0]
+        for name, literal in self._parts:
+            try:
+                value = params[name]
+            except KeyError:
+                raise ValueError(
+                    f"Missing required parameter '{name}' for path "
+                    f"'{self.template}'. Provided parameters: {list(params)}"
+                ) from None
+            if type(value) is not str:
+                value = str(value)
+            if not _is_unreserved(value):
+                if not value.strip() or value in (".", ".."):
+                    raise ValueError(
+                        f"Invalid value {value!r} of parameter '{name}' "
+                        f"for path '{self.template}'"
+                    )
+                value = quote(value, safe="")
+            path += value + literal
+        return path
+
 
 class APIMethod(Generic[T]):
     """
     Base API method.
+
+    Instances describe one request: its HTTP method and path. The instance
+    returned by :meth:`shared` is reused between calls and therefore
+    immutable; other instances can be changed as before.
     """
 
     http_method: HTTPMethod = "GET"
     path: str
+    # Compiled path of the class, set for every class that defines ``path``
+    _template: Optional[PathTemplate] = None
+    # Values the path was built with by ``build``
+    _params: Optional[Mapping[str, Any]] = None
+    _frozen: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "path" in cls.__dict__:
+            cls._template = PathTemplate(cls.path)
+
+    @classmethod
+    def shared(cls) -> "APIMethod[T]":
+        """
+        Get the instance of the method with the class path.
+
+        The instance is created once per class and reused by every request
+        sent with the method class.
+
+        :return: Shared method instance
+        """
+        instance = cls.__dict__.get("_shared")
+        if instance is None:
+            instance = cls()
+            object.__setattr__(instance, "_frozen", True)
+            type.__setattr__(cls, "_shared", instance)
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"Shared {type(self).__name__} instance is immutable")
+        if name == "path":
+            # The built values no longer describe the path
+            self.__dict__.pop("_params", None)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self._frozen:
+            raise AttributeError(f"Shared {type(self).__name__} instance is immutable")
+        if name == "path":
+            self.__dict__.pop("_params", None)
+        object.__delattr__(self, name)
 
     @staticmethod
     def _safe_model_dump(
@@ -56,23 +175,19 @@ class BaseAPIMethod(APIMethod):
         """
         Build method for resource-specific endpoints.
 
+        The path template of the class is compiled once. Without parameters
+        the shared instance of the class is returned, with the path as defined
+        by the class.
+
         :param kwargs: Resource ID parameters (e.g., payment_id, refund_id, etc.).
         :return: Method instance with formatted path.
-        :raises ValueError: If path formatting fails due to missing or invalid parameters.
+        :raises ValueError: If a parameter is missing or its value is empty.
         """
-        if not kwargs:
-            return cls()
-        try:
-            # Format path with the provided ID parameters
-            path = cls.path.format(**kwargs)
-        except KeyError as e:
-            missing_key = str(e).strip("'\"")
-            raise ValueError(
-                f"Missing required parameter '{missing_key}' for path '{cls.path}'. "
-                f"Provided parameters: {list(kwargs.keys())}"
-            ) from e
-        except Exception as e:
-            raise ValueError(
-                f"Failed to format path '{cls.path}' with parameters {kwargs}: {str(e)}"
-            ) from e
-        return cls(path=path)
+        template = cls._template
+        if template is None or not kwargs:
+            return cls.shared()  # type: ignore[return-value]
+        method = object.__new__(cls)
+        # Same as cls(path=...) without the __init__ and __setattr__ calls
+        method.__dict__["path"] = template.format(kwargs)
+        method.__dict__["_params"] = kwargs
+        return method
@@ -0,0 +1,256 @@
+"""
+Cursor pagination over list endpoints.
+"""
+
+import asyncio
+import datetime
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from aioyookassa.core.api.payments import PaymentsAPI
+from aioyookassa.core.utils import format_datetime_to_iso
+
+ListMethod = Callable[..., Awaitable[Any]]
+TimeSlice = Tuple[datetime.datetime, datetime.datetime]
+
+# Marks the end of a slice in the page queues
+_SLICE_DONE = object()
+
+
+def get_page_items(page: Any) -> List[Any]:
+    """
+    Get items of a list response.
+
+    List models name their items ``list`` or ``items``.
+
+    :param page: List response model (PaymentsList, RefundsList, ...)
+    :return: Items of the page
+    """
+    items = getattr(page, "list", None)
+    if items is None:
+        items = getattr(page, "items", None)
+    return list(items or [])
+
+
+def get_next_cursor(page: Any) -> Optional[str]:
+    """
+    Get cursor of the next page.
+
+    :param page: List response model
+    :return: Cursor or None for the last page
+    """
+    return getattr(page, "next_cursor", None) or getattr(page, "cursor", None)
+
+
+async def iter_pages(
+    method: ListMethod,
+    params: Optional[dict] = None,
+    cursor: Optional[str] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Tuple[List[Any], Optional[str]]]:
+    """
+    Walk the cursor chain of a list endpoint.
+
+    Only one page is held in memory at a time.
+
+    :param method: List method, e.g. ``client.payments.get_payments``
+    :param params: Filter parameters
+    :param cursor: Cursor to start from. Starts from the first page if None.
+    :param kwargs: Other arguments of the list method (timeout, deadline, priority)
+    :return: Async iterator of page items and the cursor of the next page
+    """
+    params = dict(params or {})
+    while True:
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = await method(params, **kwargs)
+        cursor = get_next_cursor(page)
+        yield get_page_items(page), cursor
+        if not cursor:
+            return
+
+
+async def iter_items(
+    method: ListMethod, params: Optional[dict] = None, **kwargs: Any
+) -> AsyncIterator[Any]:
+    """
+    Iterate over all items of a list endpoint.
+
+    Example:
+        >>> async for payment in iter_items(client.payments.get_payments):
+        ...     print(payment.id)
+
+    :param method: List method, e.g. ``client.payments.get_payments``
+    :param params: Filter parameters
+    :param kwargs: Other arguments of the list method (timeout, deadline, priority)
+    :return: Async iterator of items
+    """
+    async for items, _ in iter_pages(method, params, **kwargs):
+        for item in items:
+            yield item
+
+
+def split_time_range(
+    start: datetime.datetime, end: datetime.datetime, slices: int
+) -> List[TimeSlice]:
+    """
+    Split a time range into equal half-open slices ``[gte, lt)``.
+
+    Adjacent slices share only a boundary that belongs to the later one, so
+    no object falls into two slices.
+
+    :param start: Range start, inclusive
+    :param end: Range end, exclusive
+    :param slices: Number of slices
+    :return: Slices from the oldest to the newest
+    :raises ValueError: If the range is empty or slices is less than 1
+    """
+    if slices < 1:
+        raise ValueError("slices must be at least 1")
+    if end <= start:
+        raise ValueError("end must be later than start")
+    step = (end - start) / slices
+    bounds = [start + step * index for index in range(slices)] + [end]
+    return [
+        (bounds[index], bounds[index + 1])
+        for index in range(slices)
+        if bounds[index] < bounds[index + 1]
+    ]
+
+
+def get_created_at_filters(
+    method: ListMethod,
+    gte: Optional[datetime.datetime] = None,
+    lt: Optional[datetime.datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Get creation time filters for the list method.
+
+    :param method: List method of payments, refunds, receipts or deals
+    :param gte: Minimum creation time, inclusive
+    :param lt: Maximum creation time, exclusive
+    :return: Keyword arguments of the list method
+    """
+    if isinstance(getattr(method, "__self__", None), PaymentsAPI):
+        # GetPayments sends unknown filters as is, in API notation
+        filters: Dict[str, Any] = {
+            "created_at.gte": format_datetime_to_iso(gte),
+            "created_at.lt": format_datetime_to_iso(lt),
+        }
+    else:
+        filters = {"created_at_gte": gte, "created_at_lt": lt}
+    return {key: value for key, value in filters.items() if value is not None}
+
+
+async def scan_time_slices(
+    method: ListMethod,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    slices: int = 8,
+    concurrency: int = 4,
+    ordered: bool = False,
+    params: Optional[dict] = None,
+    buffer_pages: int = 2,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over objects created in a time range, walking slices concurrently.
+
+    The range is split into ``slices`` half-open slices and the cursor chains
+    of up to ``concurrency`` slices are walked at the same time, so a long
+    historical scan is not limited by one sequential chain of requests.
+
+    With ``ordered=False`` items are yielded as soon as their page arrives.
+    With ``ordered=True`` items are yielded slice by slice from the newest
+    one, i.e. in the order of a single sequential scan. In both modes at most
+    ``buffer_pages`` pages per walked slice are kept in memory.
+
+    Example:
+        >>> async for refund in scan_time_slices(
+        ...     client.refunds.get_refunds,
+        ...     datetime(2024, 1, 1, tzinfo=timezone.utc),
+        ...     datetime(2024, 2, 1, tzinfo=timezone.utc),
+        ...     slices=31,
+        ...     params={"limit": 100},
+        ... ):
+        ...     process(refund)
+
+    :param method: List method of payments, refunds, receipts or deals
+    :param start: Range start, inclusive
+    :param end: Range end, exclusive
+    :param slices: Number of time slices
+    :param concurrency: Maximum number of slices walked at the same time
+    :param ordered: Yield items in the order of a sequential scan
+    :param params: Other filter parameters of the list method
+    :param buffer_pages: Pages buffered per walked slice
+    :param kwargs: Other arguments of the list method (timeout, deadline, priority)
+    :return: Async iterator of items
+    :raises ValueError: If the range or the limits are invalid
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if buffer_pages < 1:
+        raise ValueError("buffer_pages must be at least 1")
+    # Lists are returned newest first: walk the newest slice first as well
+    bounds = split_time_range(start, end, slices)[::-1]
+    queues: List["asyncio.Queue[Any]"]
+    if ordered:
+        queues = [asyncio.Queue(maxsize=buffer_pages) for _ in bounds]
+    else:
+        shared: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=buffer_pages * concurrency)
+        queues = [shared] * len(bounds)
+    pending: Deque[int] = deque(range(len(bounds)))
+    failed: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+
+    async def worker() -> None:
+        while pending:
+            index = pending.popleft()
+            gte, lt = bounds[index]
+            filters = get_created_at_filters(method, gte, lt)
+            try:
+                async for items, _ in iter_pages(method, params, **filters, **kwargs):
+                    await queues[index].put(items)
+            except Exception as e:
+                if not failed.done():
+                    failed.set_exception(e)
+                return
+            await queues[index].put(_SLICE_DONE)
+
+    async def get_page(queue: "asyncio.Queue[Any]") -> Any:
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.wait({getter, failed}, return_when=asyncio.FIRST_COMPLETED)
+        if failed.done():
+            getter.cancel()
+            failed.result()
+        return getter.result()
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(bounds)))
+    ]
+    try:
+        for queue in queues if ordered else queues[:1]:
+            remaining = 1 if ordered else len(bounds)
+            while remaining:
+                page = await get_page(queue)
+                if page is _SLICE_DONE:
+                    remaining -= 1
+                    continue
+                for item in page:
+                    yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        if failed.done():
+            # Mark the error as retrieved if the iteration was stopped early
+            failed.exception()
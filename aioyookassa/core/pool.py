@@ -0,0 +1,177 @@
+"""
+Multi-shop client pool sharing one connection pool.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.circuit_breaker import CircuitBreaker
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.hedging import HedgingPolicy
+from aioyookassa.core.idempotency import IdempotencyManager
+from aioyookassa.core.priority import PriorityScheduler
+from aioyookassa.core.transport import BaseTransport
+
+
+class _PooledYooKassa(YooKassa):
+    """
+    YooKassa client of a single shop using the session of its pool.
+    """
+
+    def __init__(self, pool: "YooKassaPool", api_key: str, shop_id: str, **kwargs: Any):
+        super().__init__(api_key=api_key, shop_id=shop_id, **kwargs)
+        self._pool = pool
+
+    def _get_session(self) -> ClientSession:
+        return self._pool._get_session()
+
+    async def close(self) -> None:
+        """Stop keep-alive refresh; the session is owned and closed by the pool."""
+        self._stop_keepalive()
+
+
+class YooKassaPool:
+    """
+    Pool of YooKassa clients for many shops.
+
+    All clients returned by :meth:`get` share one ``ClientSession`` and
+    ``TCPConnector``: credentials are sent per request, so serving hundreds
+    of shops costs one connection pool instead of hundreds. Clients are cheap
+    facades kept in an LRU cache of ``max_clients`` entries.
+
+    Example:
+        >>> async with YooKassaPool() as pool:
+        ...     client = pool.get(shop_id=123456, api_key="secret")
+        ...     payment = await client.payments.get_payment("payment_id")
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 1024,
+        timeout: Optional[ClientTimeout] = None,
+        connector: Optional[TCPConnector] = None,
+        proxy: Optional[str] = None,
+        enable_logging: bool = False,
+        logger: Optional[logging.Logger] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        transport: Optional[BaseTransport] = None,
+        idempotency: Optional[IdempotencyManager] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+    ):
+        """
+        Initialize client pool.
+
+        :param max_clients: Maximum number of cached shop clients.
+        :param timeout: Timeout configuration shared by all clients.
+        :param connector: Custom TCP connector shared by all clients.
+        :param proxy: Proxy URL.
+        :param enable_logging: Enable request/response logging.
+        :param logger: Custom logger instance.
+        :param circuit_breaker: Circuit breaker shared by all clients.
+        :param hedging: Hedging policy shared by all clients.
+        :param transport: Transport shared by all clients instead of the
+            aiohttp session.
+        :param idempotency: Idempotency manager shared by all clients. Keys
+            are derived per shop, so one store serves all of them.
+        :param scheduler: Priority scheduler shared by all clients, which
+            share one connection pool.
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+        self.max_clients = max_clients
+        # Credentials of the session owner are never used: every pooled client
+        # authenticates its own requests.
+        self._session_owner = BaseAPIClient(
+            api_key="",
+            shop_id="",
+            timeout=timeout,
+            connector=connector,
+            proxy=proxy,
+            transport=transport,
+        )
+        self._client_kwargs = {
+            "timeout": timeout,
+            "proxy": proxy,
+            "enable_logging": enable_logging,
+            "logger": logger,
+            "circuit_breaker": circuit_breaker,
+            "hedging": hedging,
+            "transport": transport,
+            "idempotency": idempotency,
+            "scheduler": scheduler,
+        }
+        self._clients: "OrderedDict[str, Tuple[str, _PooledYooKassa]]" = OrderedDict()
+
+    def _get_session(self) -> ClientSession:
+        """
+        Get or create the shared session.
+
+        :return: ClientSession shared by all pooled clients
+        """
+        return self._session_owner._get_session()
+
+    async def warmup(
+        self, n_connections: int = 4, keepalive_interval: Optional[float] = None
+    ) -> int:
+        """
+        Pre-open keep-alive connections of the shared session.
+
+        :param n_connections: Number of connections to open.
+        :param keepalive_interval: Refresh interval in seconds, see
+            :meth:`BaseAPIClient.warmup`.
+        :return: Number of connections that responded
+        """
+        return await self._session_owner.warmup(n_connections, keepalive_interval)
+
+    def get(self, shop_id: Union[int, str], api_key: str) -> YooKassa:
+        """
+        Get client for the shop.
+
+        :param shop_id: YooKassa shop ID
+        :param api_key: YooKassa API key of the shop
+        :return: YooKassa client using the shared connection pool
+        """
+        key = str(shop_id)
+        cached = self._clients.get(key)
+        if cached is not None and cached[0] == api_key:
+            self._clients.move_to_end(key)
+            return cached[1]
+
+        client = _PooledYooKassa(self, api_key, key, **self._client_kwargs)
+        self._clients[key] = (api_key, client)
+        self._clients.move_to_end(key)
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    def remove(self, shop_id: Union[int, str]) -> None:
+        """
+        Forget the cached client of the shop.
+
+        :param shop_id: YooKassa shop ID
+        """
+        self._clients.pop(str(shop_id), None)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, shop_id: object) -> bool:
+        return str(shop_id) in self._clients
+
+    async def close(self) -> None:
+        """Close the shared session and forget cached clients."""
+        for _, client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        await self._session_owner.close()
+
+    async def __aenter__(self) -> "YooKassaPool":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
@@ -0,0 +1,175 @@
+"""
+Priority lanes for outbound requests.
+
+Batch jobs (exports, reconciliation) and live checkout traffic sharing one
+client compete for the same connections. A :class:`PriorityScheduler` limits
+the number of requests in flight, dispatches waiting requests of higher
+priority first and reserves part of the capacity for them, so a batch job
+can never occupy every connection.
+
+Example:
+    >>> client = YooKassa(
+    ...     api_key="secret", shop_id=123456, scheduler=PriorityScheduler()
+    ... )
+    >>> payment = await client.payments.get_payment(
+    ...     payment_id, priority=Priority.INTERACTIVE
+    ... )
+    >>> bulk_payments = client.payments.with_priority(Priority.BULK)
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, Union
+
+from aioyookassa.types.enum import StrEnum
+
+
+class Priority(StrEnum):
+    """
+    Priority of a request, from the highest to the lowest.
+    """
+
+    INTERACTIVE = "interactive"
+    DEFAULT = "default"
+    BULK = "bulk"
+
+
+# Priority given as an enum member or its value
+PriorityType = Union[Priority, str]
+
+# Priorities from the highest to the lowest
+_PRIORITIES = tuple(Priority)
+
+
+class PriorityScheduler:
+    """
+    Scheduler of requests by priority.
+
+    At most ``limit`` requests are in flight. When the limit is reached,
+    requests wait in a FIFO queue per priority, and a freed slot goes to the
+    highest priority that is waiting. ``reserved`` slots of a priority can
+    only be used by it and higher priorities: with the defaults and
+    ``limit=30``, interactive requests may use all 30 slots, default ones 20
+    and bulk ones 15.
+
+    Waiting is bounded by the total timeout of the request, and time spent
+    waiting counts towards it.
+    """
+
+    def __init__(
+        self,
+        limit: int = 30,
+        reserved: Optional[Mapping[PriorityType, int]] = None,
+    ):
+        """
+        Initialize priority scheduler.
+
+        :param limit: Maximum number of requests in flight. Defaults to the
+            ``limit_per_host`` of the default connector: all requests go to
+            one host, so this is the number of connections.
+        :param reserved: Slots reserved for each priority and higher ones.
+            Defaults to 10 for interactive and 5 for default requests.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if reserved is None:
+            reserved = {Priority.INTERACTIVE: 10, Priority.DEFAULT: 5}
+        reserved_slots = {Priority(key): value for key, value in reserved.items()}
+        if any(value < 0 for value in reserved_slots.values()):
+            raise ValueError("reserved slots cannot be negative")
+        self.limit = limit
+        # Slots each priority may use: the limit without the slots reserved
+        # for higher priorities
+        self._capacity: Dict[Priority, int] = {}
+        reserved_above = 0
+        for priority in _PRIORITIES:
+            self._capacity[priority] = limit - reserved_above
+            reserved_above += reserved_slots.get(priority, 0)
+        if self._capacity[_PRIORITIES[-1]] < 1:
+            raise ValueError("reserved slots must leave a slot for every priority")
+        self._in_use = 0
+        self._waiters: Dict[Priority, Deque["asyncio.Future[None]"]] = {
+            priority: deque() for priority in _PRIORITIES
+        }
+
+    @property
+    def in_use(self) -> int:
+        """Number of requests in flight."""
+        return self._in_use
+
+    def get_capacity(self, priority: PriorityType) -> int:
+        """
+        Get number of slots requests of a priority may use.
+
+        :param priority: Request priority
+        :return: Number of slots
+        """
+        return self._capacity[Priority(priority)]
+
+    def get_waiting(self, priority: Optional[PriorityType] = None) -> int:
+        """
+        Get number of waiting requests.
+
+        :param priority: Request priority. Defaults to all priorities.
+        :return: Number of requests waiting for a slot
+        """
+        if priority is None:
+            return sum(len(waiters) for waiters in self._waiters.values())
+        return len(self._waiters[Priority(priority)])
+
+    def try_acquire(self, priority: PriorityType = Priority.DEFAULT) -> bool:
+        """
+        Take a slot if one is free and no request of the same or a higher
+        priority is waiting.
+
+        :param priority: Request priority
+        :return: Whether a slot was taken
+        """
+        priority = Priority(priority)
+        if self._in_use >= self._capacity[priority]:
+            return False
+        for waiting in _PRIORITIES:
+            if self._waiters[waiting]:
+                return False
+            if waiting is priority:
+                break
+        self._in_use += 1
+        return True
+
+    async def acquire(self, priority: PriorityType = Priority.DEFAULT) -> None:
+        """
+        Wait for a slot.
+
+        :param priority: Request priority
+        """
+        priority = Priority(priority)
+        if self.try_acquire(priority):
+            return
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        waiters = self._waiters[priority]
+        waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                if future in waiters:
+                    waiters.remove(future)
+            else:
+                # The slot was granted before the cancellation: pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot and grant it to the highest priority waiting."""
+        self._in_use -= 1
+        for priority in _PRIORITIES:
+            waiters = self._waiters[priority]
+            while waiters and self._in_use < self._capacity[priority]:
+                future = waiters.popleft()
+                # Cancelled waiters are skipped, they remove themselves later
+                if not future.done():
+                    future.set_result(None)
+                    self._in_use += 1
+            if waiters:
+                # Lower priorities do not overtake waiting higher ones
+                return
@@ -0,0 +1,276 @@
+"""
+Record-and-replay transports for deterministic offline tests and benchmarks.
+
+:class:`RecordingTransport` wraps a real transport and stores every
+request/response pair with its latency in a cassette file (JSON Lines,
+gzip-compressed if the path ends with ``.gz``). :class:`ReplayTransport`
+serves the recorded responses with the original or scaled timing.
+
+Credentials are never written: the shop ID and API key are replaced with
+placeholders and request headers are not stored.
+"""
+
+import asyncio
+import gzip
+import json as jsonlib
+import re
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
+
+from aiohttp import BasicAuth, ClientTimeout
+
+from aioyookassa.core.transport import (
+    AiohttpTransport,
+    BaseTransport,
+    Response,
+    TransportError,
+    TransportResponse,
+)
+
+SHOP_ID_PLACEHOLDER = "<shop_id>"
+API_KEY_PLACEHOLDER = "<api_key>"
+
+# Response headers that are session-specific and not worth replaying
+_SKIPPED_HEADERS = frozenset({"set-cookie", "date", "content-length"})
+
+_Key = Tuple[str, str, str]
+
+
+def _open_cassette(path: str, mode: str) -> TextIO:
+    """
+    Open cassette file, using gzip for ``.gz`` paths.
+
+    :param path: Cassette path
+    :param mode: ``"r"`` or ``"w"``
+    :return: Text file object
+    """
+    if path.endswith(".gz"):
+        if mode == "w":
+            return gzip.open(path, "wt", encoding="utf-8")
+        return gzip.open(path, "rt", encoding="utf-8")
+    if mode == "w":
+        return open(path, "w", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _sanitize(text: str, auth: Optional[BasicAuth]) -> str:
+    """
+    Replace credentials in the text with placeholders.
+
+    The API key is replaced everywhere. The shop ID, usually a short number,
+    is replaced only as a whole JSON string or URL path segment so amounts
+    and other IDs are left intact.
+
+    :param text: JSON or URL to sanitize
+    :param auth: Basic auth credentials of the request
+    :return: Sanitized text
+    """
+    if auth is None:
+        return text
+    if auth.password:
+        text = text.replace(auth.password, API_KEY_PLACEHOLDER)
+    if auth.login:
+        text = re.sub(
+            rf'(?<=["/]){re.escape(auth.login)}(?=["/?]|$)', SHOP_ID_PLACEHOLDER, text
+        )
+    return text
+
+
+def _restore(text: str, auth: Optional[BasicAuth]) -> str:
+    """
+    Replace placeholders in the text with credentials.
+
+    :param text: Sanitized text
+    :param auth: Basic auth credentials of the replaying request
+    :return: Text with credentials
+    """
+    if auth is None:
+        return text
+    return text.replace(SHOP_ID_PLACEHOLDER, auth.login).replace(
+        API_KEY_PLACEHOLDER, auth.password
+    )
+
+
+def _dumps(data: Any) -> str:
+    return jsonlib.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _get_key(
+    method: str, url: str, params: Optional[dict], auth: Optional[BasicAuth]
+) -> _Key:
+    """
+    Get key matching a request with its recording.
+
+    :param method: HTTP method
+    :param url: Request URL
+    :param params: Query parameters
+    :param auth: Basic auth credentials
+    :return: Method, sanitized URL and query parameters
+    """
+    query = _sanitize(_dumps(params), auth) if params else ""
+    return method.upper(), _sanitize(url, auth), query
+
+
+class RecordingTransport(BaseTransport):
+    """
+    Transport recording requests sent through another transport.
+
+    Responses are read completely and returned buffered. Interactions are kept
+    in memory and written to the cassette by :meth:`save` or :meth:`close`.
+
+    Example:
+        >>> transport = RecordingTransport("checkout.jsonl.gz")
+        >>> async with YooKassa(api_key, shop_id, transport=transport) as client:
+        ...     await client.payments.get_payments()
+    """
+
+    def __init__(self, path: str, transport: Optional[BaseTransport] = None):
+        """
+        Initialize recording transport.
+
+        :param path: Cassette file path.
+        :param transport: Transport sending the real requests. Defaults to
+            :class:`AiohttpTransport` with its own session.
+        """
+        self.path = path
+        self._transport = transport or AiohttpTransport()
+        self.interactions: List[dict] = []
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> TransportResponse:
+        start_time = time.monotonic()
+        response = await self._transport.request(
+            method,
+            url,
+            json=json,
+            params=params,
+            headers=headers,
+            auth=auth,
+            timeout=timeout,
+        )
+        async with response:
+            body = await response.read()
+        elapsed = time.monotonic() - start_time
+
+        method, url, query = _get_key(method, url, params, auth)
+        self.interactions.append(
+            {
+                "method": method,
+                "url": url,
+                "params": query,
+                "json": jsonlib.loads(_sanitize(_dumps(json), auth)) if json else None,
+                "status": response.status,
+                "headers": {
+                    name: _sanitize(value, auth)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _SKIPPED_HEADERS
+                },
+                "body": _sanitize(body.decode("utf-8", errors="replace"), auth),
+                "elapsed": round(elapsed, 6),
+            }
+        )
+        return Response(response.status, response.headers, body)
+
+    def save(self) -> None:
+        """Write recorded interactions to the cassette file."""
+        with _open_cassette(self.path, "w") as file:
+            for interaction in self.interactions:
+                file.write(_dumps(interaction))
+                file.write("\n")
+
+    async def close(self) -> None:
+        """Save the cassette and close the wrapped transport."""
+        self.save()
+        await self._transport.close()
+
+
+class ReplayTransport(BaseTransport):
+    """
+    Transport serving responses recorded by :class:`RecordingTransport`.
+
+    Requests are matched by method, URL and query parameters; repeated
+    requests get the recorded responses in order. Placeholders in the
+    recorded bodies are replaced with the credentials of the replaying client.
+
+    Example:
+        >>> transport = ReplayTransport("checkout.jsonl.gz", speed=10)
+        >>> client = YooKassa(api_key, shop_id, transport=transport)
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, repeat: bool = True):
+        """
+        Initialize replay transport.
+
+        :param path: Cassette file path.
+        :param speed: Timing scale: ``1.0`` replays the recorded latency,
+            ``2.0`` replays twice as fast. ``None`` disables delays.
+        :param repeat: Start over when the recordings of a request are
+            exhausted. If False, such requests raise :class:`TransportError`.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.path = path
+        self.speed = speed
+        self.repeat = repeat
+        self._recordings: Dict[_Key, List[dict]] = defaultdict(list)
+        with _open_cassette(path, "r") as file:
+            for line in file:
+                if line.strip():
+                    interaction = jsonlib.loads(line)
+                    key = (
+                        interaction["method"],
+                        interaction["url"],
+                        interaction["params"],
+                    )
+                    self._recordings[key].append(interaction)
+        self._queues: Dict[_Key, Deque[dict]] = {}
+
+    def _next_interaction(self, key: _Key) -> dict:
+        """
+        Get next recorded interaction for the request.
+
+        :param key: Request key
+        :return: Recorded interaction
+        :raises TransportError: If there is no recording for the request
+        """
+        queue = self._queues.get(key)
+        if not queue:
+            if key not in self._recordings or (key in self._queues and not self.repeat):
+                raise TransportError(
+                    f"No recorded response for {key[0]} {key[1]} in {self.path}"
+                )
+            queue = self._queues[key] = deque(self._recordings[key])
+        return queue.popleft()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> TransportResponse:
+        interaction = self._next_interaction(_get_key(method, url, params, auth))
+        if self.speed is not None:
+            delay = interaction["elapsed"] / self.speed
+            total = timeout.total if timeout else None
+            if total is not None and delay > total:
+                await asyncio.sleep(total)
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(delay)
+
+        body = _restore(interaction["body"], auth)
+        return Response(interaction["status"], interaction["headers"], body.encode())
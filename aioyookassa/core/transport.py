@@ -0,0 +1,405 @@
+"""
+Pluggable HTTP transports for BaseAPIClient.
+
+A transport sends a request and returns a response exposing ``status``,
+``headers`` and the body. By default the client uses
+:class:`AiohttpTransport` on top of its own aiohttp session;
+:class:`HttpxTransport` multiplexes concurrent requests over a few HTTP/2
+connections and :class:`InProcessTransport` serves requests from a Python
+callable without any network.
+"""
+
+import abc
+import asyncio
+import inspect
+import json as jsonlib
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Union,
+)
+
+from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout
+
+
+class TransportError(Exception):
+    """
+    Connection-level failure raised by a transport.
+
+    Transports raise ``asyncio.TimeoutError`` on timeouts and
+    ``TransportError`` on other network failures; the client converts them
+    into :class:`RequestTimeout` and :class:`NetworkError`.
+    """
+
+
+class Response:
+    """
+    Buffered HTTP response returned by transports.
+
+    Provides the subset of the aiohttp response interface used by the
+    client: ``status``, ``headers`` and async ``read``/``text``/``json``.
+    """
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes):
+        """
+        Initialize response.
+
+        :param status: HTTP status code
+        :param headers: Response headers
+        :param body: Raw response body
+        """
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    async def read(self) -> bytes:
+        """Get raw response body."""
+        return self.body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Get response body decoded as text."""
+        return self.body.decode(encoding, errors="replace")
+
+    async def json(self) -> Any:
+        """
+        Get response body decoded as JSON.
+
+        :return: Decoded JSON
+        :raises ValueError: If the body is empty or not valid JSON
+        """
+        return jsonlib.loads(self.body)
+
+    async def __aenter__(self) -> "Response":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+
+class TransportResponse(Protocol):
+    """
+    Response interface used by the client.
+
+    Implemented by :class:`Response` and by aiohttp ``ClientResponse``.
+    """
+
+    status: int
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    async def read(self) -> bytes: ...
+
+    async def text(self) -> str: ...
+
+    async def json(self) -> Any: ...
+
+    async def __aenter__(self) -> Any: ...
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> Any: ...
+
+
+class Request:
+    """
+    HTTP request passed to :class:`InProcessTransport` handlers.
+    """
+
+    __slots__ = ("method", "url", "json", "params", "headers", "auth")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+    ):
+        """
+        Initialize request.
+
+        :param method: HTTP method
+        :param url: Full request URL
+        :param json: JSON body
+        :param params: Query parameters
+        :param headers: Request headers
+        :param auth: Basic auth credentials
+        """
+        self.method = method
+        self.url = url
+        self.json = json
+        self.params = params
+        self.headers = headers or {}
+        self.auth = auth
+
+
+class BaseTransport(abc.ABC):
+    """
+    Base class for HTTP transports.
+    """
+
+    @abc.abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> TransportResponse:
+        """
+        Send HTTP request.
+
+        :param method: HTTP method
+        :param url: Full request URL
+        :param json: JSON body
+        :param params: Query parameters
+        :param headers: Request headers
+        :param auth: Basic auth credentials
+        :param timeout: Timeout of the request
+        :return: Response usable as async context manager
+        :raises asyncio.TimeoutError: If the request timed out
+        :raises TransportError: On connection-level failures
+        """
+
+    async def close(self) -> None:
+        """Release transport resources."""
+
+
+class AiohttpTransport(BaseTransport):
+    """
+    Transport based on aiohttp, used by default.
+
+    Responses are returned as aiohttp ``ClientResponse`` objects without
+    buffering, so the body is read only once by the client.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], ClientSession]] = None,
+        proxy: Optional[str] = None,
+    ):
+        """
+        Initialize aiohttp transport.
+
+        :param session_factory: Callable returning the session to use. If not
+            provided, the transport creates and owns its own session.
+        :param proxy: Proxy URL.
+        """
+        self._session_factory = session_factory
+        self._proxy = proxy
+        self._session: Optional[ClientSession] = None
+
+    def _get_session(self) -> ClientSession:
+        """
+        Get session from the factory or the owned session.
+
+        :return: ClientSession
+        """
+        if self._session_factory is not None:
+            return self._session_factory()
+        if self._session is None or self._session.closed:
+            self._session = ClientSession()
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> TransportResponse:
+        try:
+            return await self._get_session().request(
+                method,
+                url,
+                json=json,
+                params=params,
+                headers=headers,
+                auth=auth,
+                proxy=self._proxy,
+                timeout=timeout,
+            )
+        except ClientError as e:
+            raise TransportError(str(e)) from e
+
+    async def close(self) -> None:
+        """Close the owned session. Sessions from the factory are left open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class HttpxTransport(BaseTransport):
+    """
+    Transport based on httpx with optional HTTP/2 support.
+
+    With HTTP/2 concurrent requests are multiplexed as streams over a few
+    connections, so concurrency is not capped by the number of sockets per
+    host. Requires ``httpx`` 0.26 or newer (``pip install "aioyookassa[httpx]"``).
+
+    Example:
+        >>> client = YooKassa(api_key, shop_id, transport=HttpxTransport(http2=True))
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        proxy: Optional[str] = None,
+    ):
+        """
+        Initialize httpx transport.
+
+        :param http2: Use HTTP/2 when the server supports it.
+        :param max_connections: Maximum number of open connections.
+        :param max_keepalive_connections: Maximum number of idle connections.
+        :param proxy: Proxy URL.
+        :raises ImportError: If httpx is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as e:  # pragma: no cover - depends on environment
+            raise ImportError(
+                'HttpxTransport requires httpx: pip install "aioyookassa[httpx]"'
+            ) from e
+        self._httpx = httpx
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._proxy = proxy
+        self._client: Optional[Any] = None
+
+    def _get_client(self) -> Any:
+        """
+        Get or create httpx AsyncClient.
+
+        :return: httpx.AsyncClient
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._httpx.AsyncClient(
+                http2=self._http2, limits=self._limits, proxy=self._proxy
+            )
+        return self._client
+
+    def _get_timeout(self, timeout: Optional[ClientTimeout]) -> Any:
+        """
+        Convert aiohttp timeout to httpx timeout.
+
+        :param timeout: aiohttp ClientTimeout
+        :return: httpx.Timeout
+        """
+        if timeout is None:
+            return self._httpx.Timeout(None)
+        connect = timeout.sock_connect or timeout.connect or timeout.total
+        read = timeout.sock_read or timeout.total
+        return self._httpx.Timeout(
+            connect=connect, read=read, write=read, pool=timeout.connect
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> Response:
+        client = self._get_client()
+        request = client.request(
+            method,
+            url,
+            json=json,
+            params=params,
+            headers=headers,
+            auth=(auth.login, auth.password) if auth else None,
+            timeout=self._get_timeout(timeout),
+        )
+        try:
+            # httpx has no total timeout: enforce it around the whole request
+            total = timeout.total if timeout else None
+            response = await asyncio.wait_for(request, total)
+        except self._httpx.TimeoutException as e:
+            raise asyncio.TimeoutError() from e
+        except self._httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+        return Response(response.status_code, response.headers, response.content)
+
+    async def close(self) -> None:
+        """Close httpx client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+Handler = Callable[[Request], Union[Response, Awaitable[Response]]]
+
+
+class InProcessTransport(BaseTransport):
+    """
+    Transport serving requests from a Python callable without network.
+
+    Useful for tests and for benchmarking client-side overhead in isolation.
+    The latest requests are recorded in :attr:`requests`.
+
+    Example:
+        >>> def handler(request):
+        ...     return Response(200, {}, b'{"id": "123", ...}')
+        >>> client = YooKassa(api_key, shop_id, transport=InProcessTransport(handler))
+    """
+
+    def __init__(self, handler: Handler, max_recorded: int = 100):
+        """
+        Initialize in-process transport.
+
+        :param handler: Sync or async callable taking :class:`Request` and
+            returning :class:`Response`.
+        :param max_recorded: Number of latest requests kept in
+            :attr:`requests`. Use 0 to disable recording, e.g. in benchmarks.
+        """
+        if max_recorded < 0:
+            raise ValueError("max_recorded cannot be negative")
+        self._handler = handler
+        self.requests: Deque[Request] = deque(maxlen=max_recorded)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ) -> TransportResponse:
+        request = Request(method, url, json, params, headers, auth)
+        if self.requests.maxlen:
+            self.requests.append(request)
+        response = self._handler(request)
+        if inspect.isawaitable(response):
+            total = timeout.total if timeout else None
+            response = await asyncio.wait_for(response, total)
+        return response
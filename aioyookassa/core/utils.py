@@ -1,5 +1,6 @@
 import datetime
 import uuid
+from decimal import Decimal
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
@@ -81,12 +82,123 @@ def format_datetime_params(
     return formatted
 
 
+class CleanDict(dict):
+    """
+    Request body or query known to need no cleaning.
+
+    It has no None values, no empty dicts or lists and no Decimals, so the
+    client sends it as is. :func:`clean_request_data` returns it, and so
+    does :func:`remove_none_values` for data of plain values only.
+    """
+
+    __slots__ = ()
+
+
+# Types of values that are sent as they are
+_PLAIN_TYPES = frozenset((str, int, float, bool))
+
+
+def _needs_cleaning(data: Dict[str, Any]) -> bool:
+    """
+    Check whether request data has values that cleaning removes or converts.
+
+    :param data: Request body or query
+    :return: Whether :func:`clean_request_data` would change the data
+    """
+    stack = [data]
+    while stack:
+        for value in stack.pop().values():
+            if type(value) in _PLAIN_TYPES:
+                continue
+            if isinstance(value, dict):
+                if not value:
+                    return True
+                stack.append(value)
+            elif isinstance(value, list):
+                if not value:
+                    return True
+                for item in value:
+                    if type(item) in _PLAIN_TYPES:
+                        continue
+                    if item is None or isinstance(item, Decimal):
+                        return True
+                    if isinstance(item, dict):
+                        if not item:
+                            return True
+                        stack.append(item)
+            elif value is None or isinstance(value, Decimal):
+                return True
+    return False
+
+
+def _clean_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy dictionary without None values and empty containers.
+
+    :param data: Dictionary to clean
+    :return: Cleaned copy
+    """
+    result: Dict[str, Any] = {}
+    for key, value in data.items():
+        if type(value) in _PLAIN_TYPES:
+            result[key] = value
+        elif value is None:
+            continue
+        elif isinstance(value, dict):
+            value = _clean_dict(value)
+            if value:
+                result[key] = value
+        elif isinstance(value, list):
+            items = []
+            for item in value:
+                if type(item) in _PLAIN_TYPES:
+                    items.append(item)
+                elif isinstance(item, dict):
+                    item = _clean_dict(item)
+                    if item:
+                        items.append(item)
+                elif isinstance(item, Decimal):
+                    items.append(format(item, "f"))
+                elif item is not None:
+                    items.append(item)
+            if items:
+                result[key] = items
+        elif isinstance(value, Decimal):
+            result[key] = format(value, "f")
+        else:
+            result[key] = value
+    return result
+
+
+def clean_request_data(data: Dict[str, Any]) -> CleanDict:
+    """
+    Remove None values from request data without mutating it.
+
+    None values are removed from nested dictionaries and from lists in them;
+    dictionaries and lists that become empty are removed as well. Decimal
+    amounts are converted to strings, as the API expects them.
+
+    The data is scanned first without recursion, and when nothing has to
+    change only the top level is copied.
+
+    :param data: Request body or query
+    :return: Cleaned copy of the data
+    """
+    if type(data) is CleanDict:
+        return data
+    if not _needs_cleaning(data):
+        return CleanDict(data)
+    return CleanDict(_clean_dict(data))
+
+
 def remove_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Remove None values from dictionary.
 
     This utility function removes all keys with None values from a dictionary,
-    which is commonly needed when building API request parameters.
+    which is commonly needed when building API request parameters. A result
+    of plain values only is returned as :class:`CleanDict`, so the client
+    does not walk it again.
 
     :param data: Dictionary to clean.
     :returns: Dictionary without None values.
@@ -94,4 +206,8 @@ def remove_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
         >>> remove_none_values({"a": 1, "b": None, "c": "value"})
         {"a": 1, "c": "value"}
     """
-    return {k: v for k, v in data.items() if v is not None}
+    result = {k: v for k, v in data.items() if v is not None}
+    for value in result.values():
+        if isinstance(value, (dict, list, Decimal)):
+            return result
+    return CleanDict(result)
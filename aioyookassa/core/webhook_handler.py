@@ -5,12 +5,13 @@ Webhook event handler for YooKassa notifications.
 import asyncio
 import logging
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from aioyookassa.core.webhook_validator import WebhookIPValidator
 from aioyookassa.exceptions.webhooks import InvalidWebhookDataError
+from aioyookassa.types.compact import CompactModel, to_compact
 from aioyookassa.types.deals import Deal
 from aioyookassa.types.enum import WebhookEvent
 from aioyookassa.types.payment import Payment, PaymentMethod
@@ -18,6 +19,11 @@ from aioyookassa.types.payout import Payout
 from aioyookassa.types.refund import Refund
 from aioyookassa.types.webhook_notification import WebhookNotification
 
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# Event object: a model, its compact object, or the raw dict of unknown events
+EventObject = Union[Payment, Refund, Payout, Deal, PaymentMethod, CompactModel, dict]
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +42,7 @@ class WebhookHandler:
         self,
         validator: Optional[WebhookIPValidator] = None,
         logger: Optional[logging.Logger] = None,
+        compact: bool = False,
     ):
         """
         Initialize webhook handler.
@@ -43,9 +50,13 @@ class WebhookHandler:
         :param validator: IP validator instance. If None, creates default validator
                          with YooKassa official IP ranges.
         :param logger: Logger instance. If None, uses default logger.
+        :param compact: Pass event objects to callbacks as compact read-only
+                        objects without validation
+                        (see :mod:`aioyookassa.types.compact`).
         """
         self.validator = validator if validator is not None else WebhookIPValidator()
         self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.compact = compact
         self.callbacks: Dict[str, Callable] = {}
         self.pattern_callbacks: List[Tuple[re.Pattern, Callable]] = []
 
@@ -148,7 +159,7 @@ class WebhookHandler:
 
     async def handle_notification(
         self, notification: WebhookNotification
-    ) -> Union[Payment, Refund, Payout, Deal, PaymentMethod, dict]:
+    ) -> EventObject:
         """
         Process webhook notification and return typed event object.
 
@@ -156,7 +167,9 @@ class WebhookHandler:
         Pydantic model based on event type and calls registered callbacks.
 
         :param notification: Parsed webhook notification.
-        :return: Typed event object (Payment, Refund, Payout, Deal, PaymentMethod).
+        :return: Typed event object (Payment, Refund, Payout, Deal, PaymentMethod),
+            its compact object if ``compact`` is enabled, or the raw dict of
+            unknown events.
         """
         event = notification.event
         self.logger.info(f"Processing webhook notification: event={event}")
@@ -186,34 +199,34 @@ class WebhookHandler:
         self.logger.info(f"Successfully processed webhook notification: event={event}")
         return event_object
 
-    def _parse_object(
-        self, notification: WebhookNotification
-    ) -> Union[Payment, Refund, Payout, Deal, PaymentMethod, dict]:
+    def _parse_object(self, notification: WebhookNotification) -> EventObject:
         """Parse notification object into appropriate Pydantic type."""
         event = notification.event
         obj_data = notification.object
 
         try:
-            parsed: Union[Payment, Refund, Payout, Deal, PaymentMethod, dict]
+            parsed: Union[Payment, Refund, Payout, Deal, PaymentMethod, CompactModel]
             if event.startswith("payment."):
-                parsed = Payment(**obj_data)
-                self.logger.debug(f"Parsed Payment object: id={parsed.id}")
+                parsed = self._build(Payment, obj_data)
+                self.logger.debug(f"Parsed Payment object: id={obj_data.get('id')}")
                 return parsed
             elif event.startswith("refund."):
-                parsed = Refund(**obj_data)
-                self.logger.debug(f"Parsed Refund object: id={parsed.id}")
+                parsed = self._build(Refund, obj_data)
+                self.logger.debug(f"Parsed Refund object: id={obj_data.get('id')}")
                 return parsed
             elif event.startswith("payout."):
-                parsed = Payout(**obj_data)
-                self.logger.debug(f"Parsed Payout object: id={parsed.id}")
+                parsed = self._build(Payout, obj_data)
+                self.logger.debug(f"Parsed Payout object: id={obj_data.get('id')}")
                 return parsed
             elif event == WebhookEvent.DEAL_CLOSED:
-                parsed = Deal(**obj_data)
-                self.logger.debug(f"Parsed Deal object: id={parsed.id}")
+                parsed = self._build(Deal, obj_data)
+                self.logger.debug(f"Parsed Deal object: id={obj_data.get('id')}")
                 return parsed
             elif event == WebhookEvent.PAYMENT_METHOD_ACTIVE:
-                parsed = PaymentMethod(**obj_data)
-                self.logger.debug(f"Parsed PaymentMethod object: id={parsed.id}")
+                parsed = self._build(PaymentMethod, obj_data)
+                self.logger.debug(
+                    f"Parsed PaymentMethod object: id={obj_data.get('id')}"
+                )
                 return parsed
             else:
                 # Unknown event type, return raw dict
@@ -227,6 +240,14 @@ class WebhookHandler:
             )
             return obj_data
 
+    def _build(
+        self, model: Type[ModelType], data: dict
+    ) -> Union[ModelType, CompactModel]:
+        """Create event object of the model, compact if enabled."""
+        if self.compact:
+            return to_compact(model, data)
+        return model(**data)
+
     def _find_callback(self, event: str) -> Optional[Callable]:
         """Find callback for given event (exact match or pattern)."""
         # Check exact matches first
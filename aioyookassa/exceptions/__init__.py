@@ -1,5 +1,12 @@
-from .authorization import InvalidCredentials, InvalidRequestError
+from .authorization import Forbidden, InvalidCredentials, InvalidRequestError
 from .base import APIError
+from .http import (
+    CircuitOpenError,
+    NetworkError,
+    RequestTimeout,
+    ServerError,
+    TooManyRequests,
+)
 from .payments import NotFound
 from .webhooks import InvalidWebhookDataError, InvalidWebhookIPError
 
@@ -8,6 +15,12 @@ __all__ = [
     "InvalidRequestError",
     "NotFound",
     "InvalidCredentials",
+    "Forbidden",
+    "TooManyRequests",
+    "ServerError",
+    "RequestTimeout",
+    "NetworkError",
+    "CircuitOpenError",
     "InvalidWebhookIPError",
     "InvalidWebhookDataError",
 ]
@@ -5,9 +5,18 @@ class InvalidRequestError(APIError):
     """Invalid request error"""
 
     match = "invalid_request"
+    status_codes = (400,)
 
 
 class InvalidCredentials(APIError):
     """Invalid credentials error"""
 
     match = "invalid_credentials"
+    status_codes = (401,)
+
+
+class Forbidden(APIError):
+    """Operation is not allowed for the shop or token"""
+
+    match = "forbidden"
+    status_codes = (403,)
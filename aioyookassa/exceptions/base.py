@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 
 class _MatchErrorMixin:
@@ -6,13 +6,24 @@ class _MatchErrorMixin:
 
     match: str = ""
     text: Optional[str] = None
+    status_codes: Tuple[int, ...] = ()
 
     __subclasses: List[Type["_MatchErrorMixin"]] = []
+    # Exact error code -> exception class, first registered class wins. It
+    # takes precedence over the substring scan, which only runs for codes
+    # without an exact match, so the two may pick different classes.
+    __code_index: Dict[str, Type["_MatchErrorMixin"]] = {}
+    # HTTP status -> exception class, used when the error code is unknown.
+    __status_index: Dict[int, Type["_MatchErrorMixin"]] = {}
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super(_MatchErrorMixin, cls).__init_subclass__(**kwargs)
         if not hasattr(cls, f"_{cls.__name__}__group"):
             cls.__subclasses.append(cls)
+            if cls.match:
+                cls.__code_index.setdefault(cls.match.lower(), cls)
+            for status in cls.status_codes:
+                cls.__status_index.setdefault(status, cls)
 
     @classmethod
     def check(cls, message: str) -> bool:
@@ -60,15 +71,20 @@ class _MatchErrorMixin:
 
     @classmethod
     def _find_matching_exception(
-        cls, description_lower: str, detailed_message: str
+        cls, description_lower: str
     ) -> Optional[Type["_MatchErrorMixin"]]:
         """
         Find matching exception subclass for the given description.
 
+        Exact error codes are resolved through the code index; the substring
+        scan over all registered subclasses is only used on a miss.
+
         :param description_lower: Lowercase error description
-        :param detailed_message: Detailed error message
         :return: Matching exception class or None
         """
+        err = cls.__code_index.get(description_lower)
+        if err is not None and err is not cls and issubclass(err, Exception):
+            return err
         for err in cls.__subclasses:
             if err is cls:
                 continue
@@ -76,40 +92,117 @@ class _MatchErrorMixin:
                 return err
         return None
 
+    @classmethod
+    def for_status(cls, status: Optional[int]) -> Type[Exception]:
+        """
+        Get exception class registered for the HTTP status.
+
+        :param status: HTTP status code
+        :return: Exception class for the status or the class itself
+        """
+        err = cls.__status_index.get(status) if status is not None else None
+        if err is not None and issubclass(err, Exception):
+            return err
+        return cast(Type[Exception], cls)
+
     @classmethod
     def detect(
-        cls, description: str, message: str, error_details: Optional[dict] = None
+        cls,
+        description: str,
+        message: str,
+        error_details: Optional[dict] = None,
+        status: Optional[int] = None,
     ) -> None:
         """
         Find existing exception
         :param description: error code/description
         :param message: error message
         :param error_details: full error response from API
+        :param status: HTTP status of the response, used for unknown codes
         :return:
         """
-        detailed_message = cls._build_detailed_message(
-            description, message, error_details
-        )
-
-        description_lower = description.lower()
-        matching_exception = cls._find_matching_exception(
-            description_lower, detailed_message
-        )
+        matching_exception = cls._find_matching_exception(description.lower())
+        if matching_exception is None and status is not None:
+            status_exception = cls.__status_index.get(status)
+            if status_exception is not None and status_exception is not cls:
+                matching_exception = status_exception
 
         if matching_exception:
-            exception_text = (
-                getattr(matching_exception, "text", None) or detailed_message
-            )
+            text = getattr(matching_exception, "text", None)
             exception_cls = cast(Type[Exception], matching_exception)
-            raise exception_cls(exception_text)
+            error = exception_cls(text or message or description)
+            _attach_error_details(error, error_details, not text, status)
+            raise error
 
         # For unknown errors, use description if no error_details (backward compatibility)
         if issubclass(cls, Exception):
             exception_cls = cast(Type[Exception], cls)
-            raise exception_cls(detailed_message if error_details else description)
+            error = exception_cls(
+                (message or description) if error_details else description
+            )
+            _attach_error_details(error, error_details, True, status)
+            raise error
+
+
+def _attach_error_details(
+    error: Exception,
+    error_details: Optional[dict],
+    detailed: bool,
+    status: Optional[int] = None,
+) -> None:
+    """
+    Attach structured API error fields to an exception instance.
+
+    :param error: Exception instance
+    :param error_details: full error response from API
+    :param detailed: Whether details should be appended to the message
+    :param status: HTTP status of the response
+    """
+    if not isinstance(error, APIError):
+        return
+    if status is not None:
+        error.status = status
+    if not error_details:
+        return
+    error.error_details = error_details
+    error.code = error_details.get("code")
+    error.parameter = error_details.get("parameter")
+    error.error_type = error_details.get("type")
+    error.retry_after = error_details.get("retry_after")
+    error.id = error_details.get("id")
+    error._detailed = detailed
 
 
 class APIError(Exception, _MatchErrorMixin):
     """
     API Error
+
+    Errors raised from API responses carry the HTTP ``status`` and the
+    structured fields of the response (``code``, ``parameter``, ``error_type``,
+    ``retry_after``, ``id``) as attributes. The detailed message is only built
+    when the error is converted to a string.
+
+    ``retryable`` marks error types for which repeating the request may
+    succeed (rate limiting, server-side and network failures).
     """
+
+    retryable: bool = False
+    status: Optional[int] = None
+    error_details: Optional[dict] = None
+    code: Optional[str] = None
+    parameter: Optional[str] = None
+    error_type: Optional[str] = None
+    retry_after: Optional[Any] = None
+    id: Optional[str] = None
+    _detailed: bool = False
+
+    @property
+    def request_id(self) -> Optional[str]:
+        """Identifier of the failed request as reported by YooKassa."""
+        return self.id
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if not self._detailed or not self.error_details:
+            return message
+        return self._build_detailed_message(message, message, self.error_details)
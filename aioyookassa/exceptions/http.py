@@ -0,0 +1,46 @@
+"""
+Transport-level and server-side exceptions.
+
+All of them are marked as ``retryable``: repeating the request later
+may succeed.
+"""
+
+from .base import APIError
+
+
+class TooManyRequests(APIError):
+    """Rate limit exceeded; ``retry_after`` holds the delay if provided"""
+
+    match = "too_many_requests"
+    status_codes = (429,)
+    retryable = True
+
+
+class ServerError(APIError):
+    """YooKassa failed to process the request (HTTP 5xx)"""
+
+    match = "internal_server_error"
+    status_codes = tuple(range(500, 600))
+    retryable = True
+
+
+class RequestTimeout(APIError):
+    """Server did not respond within the configured timeout"""
+
+    retryable = True
+
+
+class NetworkError(APIError):
+    """Connection-level failure before a response was received"""
+
+    retryable = True
+
+
+class CircuitOpenError(APIError):
+    """
+    Request was not sent because the circuit breaker of its endpoint family
+    is open; ``retry_after`` holds seconds until probing resumes
+    """
+
+    retryable = True
+    family: str = ""
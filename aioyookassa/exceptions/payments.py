@@ -5,3 +5,4 @@ class NotFound(APIError):
     """Not found error"""
 
     match = "not_found"
+    status_codes = (404,)
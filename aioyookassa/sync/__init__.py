@@ -0,0 +1,8 @@
+"""
+Local mirror of YooKassa objects kept up to date by webhooks and scans.
+"""
+
+from aioyookassa.sync.engine import SyncEngine
+from aioyookassa.sync.store import MirrorStore, SQLiteStore
+
+__all__ = ["MirrorStore", "SQLiteStore", "SyncEngine"]
@@ -0,0 +1,314 @@
+"""
+Incremental synchronization of a local mirror with YooKassa.
+"""
+
+import asyncio
+import datetime
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.pagination import get_created_at_filters, iter_pages
+from aioyookassa.core.webhook_handler import WebhookHandler
+from aioyookassa.sync.store import MirrorStore, SQLiteStore
+from aioyookassa.types.compact import CompactModel
+from aioyookassa.types.payment import Payment
+from aioyookassa.types.payout import Payout
+from aioyookassa.types.refund import Refund
+
+PAYMENTS = "payments"
+REFUNDS = "refunds"
+PAYOUTS = "payouts"
+
+_MODELS: Dict[str, Type[BaseModel]] = {
+    PAYMENTS: Payment,
+    REFUNDS: Refund,
+    PAYOUTS: Payout,
+}
+_WEBHOOK_EVENTS = {PAYMENTS: "payment.*", REFUNDS: "refund.*", PAYOUTS: "payout.*"}
+_LIST_METHODS = {PAYMENTS: "get_payments", REFUNDS: "get_refunds"}
+_GET_METHODS = {PAYMENTS: "get_payment", REFUNDS: "get_refund", PAYOUTS: "get_payout"}
+
+
+def _get_kind(obj: Union[BaseModel, CompactModel]) -> str:
+    """
+    Get mirror kind of an API object.
+
+    :param obj: Payment, Refund or Payout, full or compact
+    :return: Object kind
+    :raises TypeError: If objects of this type are not mirrored
+    """
+    obj_model = obj.model if isinstance(obj, CompactModel) else type(obj)
+    for kind, model in _MODELS.items():
+        if issubclass(obj_model, model):
+            return kind
+    raise TypeError(f"Objects of type {type(obj).__name__} are not mirrored")
+
+
+def _dump(obj: Union[BaseModel, CompactModel]) -> Dict[str, Any]:
+    if isinstance(obj, CompactModel):
+        return obj.to_dict()
+    return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+class SyncEngine:
+    """
+    Keeps a local mirror of payments, refunds and payouts up to date.
+
+    Webhook notifications update objects as soon as they change. Periodic
+    incremental scans list payments and refunds created after the high-water
+    mark of the previous scan (minus ``overlap`` for objects that become
+    visible late) and catch anything a lost notification missed. Payouts
+    have no list endpoint and are mirrored from notifications and lookups.
+
+    Lookups are answered from the store; a missing object is fetched from
+    the API and stored.
+
+    Example:
+        >>> engine = SyncEngine(client, SQLiteStore("yookassa.sqlite3"))
+        >>> engine.attach(webhook_handler)
+        >>> engine.start(interval=60)
+        >>> payment = await engine.get_payment("payment_id")
+        >>> paid = await engine.find_payments(status="succeeded", metadata={"order_id": "42"})
+    """
+
+    def __init__(
+        self,
+        client: YooKassa,
+        store: Optional[MirrorStore] = None,
+        kinds: Sequence[str] = (PAYMENTS, REFUNDS),
+        page_size: int = 100,
+        overlap: datetime.timedelta = datetime.timedelta(minutes=5),
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize synchronization engine.
+
+        :param client: YooKassa client.
+        :param store: Mirror store. Defaults to an in-memory SQLite store.
+        :param kinds: Kinds scanned incrementally: ``payments``, ``refunds``.
+        :param page_size: Page size of incremental scans.
+        :param overlap: How far before the high-water mark scans start.
+        :param logger: Logger instance. If None, uses default logger.
+        """
+        unknown = set(kinds) - set(_LIST_METHODS)
+        if unknown:
+            raise ValueError(f"Kinds cannot be scanned: {sorted(unknown)}")
+        self.client = client
+        self.store = store if store is not None else SQLiteStore()
+        self.kinds = tuple(kinds)
+        self.page_size = page_size
+        self.overlap = overlap
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def attach(self, handler: WebhookHandler) -> None:
+        """
+        Update the mirror from notifications of the webhook handler.
+
+        Registers ``payment.*``, ``refund.*`` and ``payout.*`` callbacks.
+        Callbacks registered for exact events take precedence over them:
+        call :meth:`apply` from such callbacks.
+
+        :param handler: Webhook handler
+        """
+        for pattern in _WEBHOOK_EVENTS.values():
+            handler.add_callback(pattern, self.apply)
+
+    async def apply(
+        self, obj: Union[Payment, Refund, Payout, CompactModel, dict]
+    ) -> None:
+        """
+        Store an object received from a notification.
+
+        Notifications delivered late or retried do not roll back an object
+        whose status has already moved on.
+
+        :param obj: Payment, Refund or Payout, full or compact. Unparsed
+            dicts are ignored.
+        """
+        if isinstance(obj, dict):
+            return
+        await self.store.upsert(_get_kind(obj), [_dump(obj)])
+
+    async def sync_once(self) -> int:
+        """
+        Run one incremental scan of every kind.
+
+        :return: Number of stored objects
+        """
+        total = 0
+        for kind in self.kinds:
+            total += await self._sync_kind(kind)
+        return total
+
+    async def _sync_kind(self, kind: str) -> int:
+        """
+        Scan objects of one kind created after the high-water mark.
+
+        :param kind: Object kind
+        :return: Number of stored objects
+        """
+        method = getattr(getattr(self.client, kind), _LIST_METHODS[kind])
+        high_water_mark = await self.store.get_high_water_mark(kind)
+        since = None
+        if high_water_mark is not None:
+            since = datetime.datetime.fromisoformat(high_water_mark) - self.overlap
+
+        count = 0
+        newest: Optional[datetime.datetime] = None
+        async for items, _ in iter_pages(
+            method, {"limit": self.page_size}, **get_created_at_filters(method, since)
+        ):
+            if not items:
+                continue
+            await self.store.upsert(kind, [_dump(item) for item in items])
+            count += len(items)
+            page_newest = max(item.created_at for item in items)
+            newest = page_newest if newest is None else max(newest, page_newest)
+        if newest is not None and (
+            high_water_mark is None
+            or newest > datetime.datetime.fromisoformat(high_water_mark)
+        ):
+            # A scan interrupted midway keeps the old mark and is repeated
+            await self.store.set_high_water_mark(kind, newest.isoformat())
+        self.logger.debug(f"Synchronized {count} {kind}")
+        return count
+
+    async def run(self, interval: float = 60.0) -> None:
+        """
+        Run incremental scans forever.
+
+        Errors of a scan are logged and the scan is retried after ``interval``.
+
+        :param interval: Seconds between scans
+        """
+        while True:
+            try:
+                await self.sync_once()
+            except Exception as e:
+                self.logger.error(f"Incremental sync failed: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = 60.0) -> None:
+        """
+        Start incremental scans in background.
+
+        :param interval: Seconds between scans
+        """
+        self.stop()
+        self._task = asyncio.ensure_future(self.run(interval))
+
+    def stop(self) -> None:
+        """Stop background scans."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _get(self, kind: str, object_id: str, fetch: bool) -> Optional[Any]:
+        """
+        Get object from the store, fetching it from the API on a miss.
+
+        :param kind: Object kind
+        :param object_id: Object ID
+        :param fetch: Fetch missing objects from the API
+        :return: API object or None
+        """
+        data = await self.store.get(kind, object_id)
+        if data is not None:
+            return _MODELS[kind](**data)
+        if not fetch:
+            return None
+        obj = await getattr(getattr(self.client, kind), _GET_METHODS[kind])(object_id)
+        await self.store.upsert(kind, [_dump(obj)])
+        return obj
+
+    async def get_payment(
+        self, payment_id: str, fetch: bool = True
+    ) -> Optional[Payment]:
+        """
+        Get payment from the mirror.
+
+        :param payment_id: Payment ID
+        :param fetch: Fetch the payment from the API if it is not mirrored
+        :return: Payment or None if it is not mirrored and fetch is False
+        """
+        return await self._get(PAYMENTS, payment_id, fetch)
+
+    async def get_refund(self, refund_id: str, fetch: bool = True) -> Optional[Refund]:
+        """
+        Get refund from the mirror.
+
+        :param refund_id: Refund ID
+        :param fetch: Fetch the refund from the API if it is not mirrored
+        :return: Refund or None if it is not mirrored and fetch is False
+        """
+        return await self._get(REFUNDS, refund_id, fetch)
+
+    async def get_payout(self, payout_id: str, fetch: bool = True) -> Optional[Payout]:
+        """
+        Get payout from the mirror.
+
+        :param payout_id: Payout ID
+        :param fetch: Fetch the payout from the API if it is not mirrored
+        :return: Payout or None if it is not mirrored and fetch is False
+        """
+        return await self._get(PAYOUTS, payout_id, fetch)
+
+    async def find_payments(
+        self,
+        status: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        merchant_customer_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Payment]:
+        """
+        Find mirrored payments, newest first.
+
+        :param status: Payment status
+        :param metadata: Metadata keys and values
+        :param merchant_customer_id: Customer ID in the merchant system
+        :param limit: Maximum number of payments
+        :return: Matching payments
+        """
+        rows = await self.store.find(
+            PAYMENTS, status, metadata, merchant_customer_id, limit
+        )
+        return [Payment(**row) for row in rows]
+
+    async def find_refunds(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Refund]:
+        """
+        Find mirrored refunds, newest first.
+
+        :param status: Refund status
+        :param limit: Maximum number of refunds
+        :return: Matching refunds
+        """
+        rows = await self.store.find(REFUNDS, status, limit=limit)
+        return [Refund(**row) for row in rows]
+
+    async def find_payouts(
+        self,
+        status: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Payout]:
+        """
+        Find mirrored payouts, newest first.
+
+        :param status: Payout status
+        :param metadata: Metadata keys and values
+        :param limit: Maximum number of payouts
+        :return: Matching payouts
+        """
+        rows = await self.store.find(PAYOUTS, status, metadata, limit=limit)
+        return [Payout(**row) for row in rows]
+
+    async def close(self) -> None:
+        """Stop background scans and close the store."""
+        self.stop()
+        await self.store.close()
@@ -0,0 +1,279 @@
+"""
+Local stores of mirrored YooKassa objects.
+"""
+
+import abc
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence
+
+from aioyookassa.types.enum import PaymentStatus
+
+# Position of a status in the lifecycle of payments, refunds and payouts.
+# Statuses only move forward, so a snapshot with an earlier status is stale.
+_STATUS_RANKS: Dict[str, int] = {
+    PaymentStatus.PENDING: 0,
+    PaymentStatus.WAITING_FOR_CAPTURE: 1,
+    PaymentStatus.SUCCEEDED: 2,
+    PaymentStatus.CANCELED: 2,
+}
+
+
+def _get_status_rank(status: Optional[str]) -> int:
+    """
+    Get position of a status in the object lifecycle.
+
+    :param status: Object status
+    :return: Rank, 0 for unknown statuses
+    """
+    return _STATUS_RANKS.get(status, 0) if status is not None else 0
+
+
+def _get_refunded_value(obj: Dict[str, Any]) -> float:
+    """
+    Get refunded amount of a payment.
+
+    The amount only grows, so it orders snapshots with the same status, e.g.
+    of a succeeded payment before and after a partial refund.
+
+    :param obj: Object in API notation
+    :return: Refunded amount, 0 if the object has none
+    """
+    refunded_amount = obj.get("refunded_amount")
+    return float(refunded_amount["value"]) if refunded_amount else 0.0
+
+
+class MirrorStore(abc.ABC):
+    """
+    Base class for stores of mirrored objects.
+
+    Objects are JSON-compatible dicts in API notation grouped by kind
+    (``payments``, ``refunds``, ``payouts``). Implementations must index them
+    by id, status, metadata keys and ``merchant_customer_id``.
+    """
+
+    @abc.abstractmethod
+    async def upsert(self, kind: str, objects: Sequence[Dict[str, Any]]) -> None:
+        """
+        Insert or replace objects.
+
+        Notifications and scans may deliver snapshots out of order. A stored
+        object is only replaced by a snapshot whose status is not earlier in
+        the lifecycle and, with the same status, whose refunded amount is not
+        smaller, so a stale snapshot never rolls it back.
+
+        :param kind: Object kind
+        :param objects: Objects with an ``id`` key
+        """
+
+    @abc.abstractmethod
+    async def get(self, kind: str, object_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get object by id.
+
+        :param kind: Object kind
+        :param object_id: Object ID
+        :return: Object or None if it is not stored
+        """
+
+    @abc.abstractmethod
+    async def find(
+        self,
+        kind: str,
+        status: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        merchant_customer_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find objects matching all given filters, newest first.
+
+        :param kind: Object kind
+        :param status: Object status
+        :param metadata: Metadata keys and values
+        :param merchant_customer_id: Customer ID in the merchant system
+        :param limit: Maximum number of objects
+        :return: Matching objects
+        """
+
+    @abc.abstractmethod
+    async def get_high_water_mark(self, kind: str) -> Optional[str]:
+        """
+        Get creation time of the newest object seen by incremental scans.
+
+        :param kind: Object kind
+        :return: ISO timestamp or None before the first scan
+        """
+
+    @abc.abstractmethod
+    async def set_high_water_mark(self, kind: str, value: str) -> None:
+        """
+        Save creation time of the newest object seen by incremental scans.
+
+        :param kind: Object kind
+        :param value: ISO timestamp
+        """
+
+    async def close(self) -> None:
+        """Release store resources."""
+
+
+class SQLiteStore(MirrorStore):
+    """
+    Store in an SQLite database.
+
+    Queries run directly on the event loop: lookups by indexed columns of a
+    local database take microseconds, far less than any API request.
+
+    Example:
+        >>> store = SQLiteStore("yookassa.sqlite3")
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS objects (
+            kind TEXT NOT NULL,
+            id TEXT NOT NULL,
+            status TEXT,
+            status_rank INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT,
+            merchant_customer_id TEXT,
+            data TEXT NOT NULL,
+            refunded_value REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (kind, id)
+        );
+        CREATE INDEX IF NOT EXISTS objects_status
+            ON objects (kind, status, created_at);
+        CREATE INDEX IF NOT EXISTS objects_customer
+            ON objects (kind, merchant_customer_id);
+        CREATE TABLE IF NOT EXISTS object_metadata (
+            kind TEXT NOT NULL,
+            id TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT,
+            PRIMARY KEY (kind, id, key)
+        );
+        CREATE INDEX IF NOT EXISTS object_metadata_value
+            ON object_metadata (kind, key, value);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            kind TEXT PRIMARY KEY,
+            high_water_mark TEXT
+        );
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize SQLite store.
+
+        :param path: Database file path. Defaults to an in-memory database.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+        columns = {
+            row[1] for row in self._connection.execute("PRAGMA table_info(objects)")
+        }
+        if "refunded_value" not in columns:
+            # Database created before the column was added
+            self._connection.execute(
+                "ALTER TABLE objects "
+                "ADD COLUMN refunded_value REAL NOT NULL DEFAULT 0"
+            )
+
+    async def upsert(self, kind: str, objects: Sequence[Dict[str, Any]]) -> None:
+        with self._connection:
+            for obj in objects:
+                object_id = obj["id"]
+                cursor = self._connection.execute(
+                    "INSERT INTO objects (kind, id, status, status_rank, "
+                    "created_at, merchant_customer_id, data, refunded_value) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (kind, id) DO UPDATE SET "
+                    "status = excluded.status, "
+                    "status_rank = excluded.status_rank, "
+                    "created_at = excluded.created_at, "
+                    "merchant_customer_id = excluded.merchant_customer_id, "
+                    "data = excluded.data, "
+                    "refunded_value = excluded.refunded_value "
+                    "WHERE excluded.status_rank > objects.status_rank "
+                    "OR (excluded.status_rank = objects.status_rank "
+                    "AND excluded.refunded_value >= objects.refunded_value)",
+                    (
+                        kind,
+                        object_id,
+                        obj.get("status"),
+                        _get_status_rank(obj.get("status")),
+                        obj.get("created_at"),
+                        obj.get("merchant_customer_id"),
+                        json.dumps(obj, ensure_ascii=False),
+                        _get_refunded_value(obj),
+                    ),
+                )
+                if not cursor.rowcount:
+                    # Stale snapshot, the stored object is newer
+                    continue
+                self._connection.execute(
+                    "DELETE FROM object_metadata WHERE kind = ? AND id = ?",
+                    (kind, object_id),
+                )
+                self._connection.executemany(
+                    "INSERT INTO object_metadata VALUES (?, ?, ?, ?)",
+                    [
+                        (kind, object_id, key, str(value))
+                        for key, value in (obj.get("metadata") or {}).items()
+                    ],
+                )
+
+    async def get(self, kind: str, object_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection.execute(
+            "SELECT data FROM objects WHERE kind = ? AND id = ?", (kind, object_id)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def find(
+        self,
+        kind: str,
+        status: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        merchant_customer_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        query = ["SELECT o.data FROM objects o"]
+        args: List[Any] = []
+        for index, (key, value) in enumerate((metadata or {}).items()):
+            alias = f"m{index}"
+            query.append(
+                f"JOIN object_metadata {alias} ON {alias}.kind = o.kind "
+                f"AND {alias}.id = o.id AND {alias}.key = ? AND {alias}.value = ?"
+            )
+            args.extend((key, str(value)))
+        conditions = ["o.kind = ?"]
+        args.append(kind)
+        if status is not None:
+            conditions.append("o.status = ?")
+            args.append(status)
+        if merchant_customer_id is not None:
+            conditions.append("o.merchant_customer_id = ?")
+            args.append(merchant_customer_id)
+        query.append("WHERE " + " AND ".join(conditions))
+        query.append("ORDER BY o.created_at DESC")
+        if limit is not None:
+            query.append("LIMIT ?")
+            args.append(limit)
+        rows = self._connection.execute(" ".join(query), args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    async def get_high_water_mark(self, kind: str) -> Optional[str]:
+        row = self._connection.execute(
+            "SELECT high_water_mark FROM sync_state WHERE kind = ?", (kind,)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def set_high_water_mark(self, kind: str, value: str) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (kind, value)
+            )
+
+    async def close(self) -> None:
+        """Close database connection."""
+        self._connection.close()
@@ -1,116 +1,247 @@
-from .deals import Deal as SafeDeal
-from .deals import DealsList
-from .enum import (
-    CancellationParty,
-    CancellationReason,
-    ConfirmationType,
-    Currency,
-    DealStatus,
-    FeeMoment,
-    PaymentMethodType,
-    PaymentMode,
-    PaymentStatus,
-    PaymentSubject,
-    PayoutStatus,
-    PersonalDataCancellationParty,
-    PersonalDataCancellationReason,
-    PersonalDataStatus,
-    PersonalDataType,
-    ReceiptRegistration,
-    ReceiptStatus,
-    ReceiptType,
-    SelfEmployedStatus,
-    WebhookEvent,
-)
-from .invoice import (
-    Invoice,
-    InvoiceCartItem,
-    InvoiceDeliveryMethodData,
-    InvoicePaymentData,
-    InvoiceReceipt,
-    InvoiceReceiptItem,
-)
-from .params import (
-    CapturePaymentParams,
-    CreateDealParams,
-    CreateInvoiceParams,
-    CreatePaymentMethodParams,
-    CreatePaymentParams,
-    CreatePayoutParams,
-    CreatePersonalDataParams,
-    CreateReceiptParams,
-    CreateRefundParams,
-    CreateSelfEmployedParams,
-    CreateWebhookParams,
-    GetDealsParams,
-    GetPaymentsParams,
-    GetReceiptsParams,
-    GetRefundsParams,
-    PaymentMethodCardData,
-    PaymentMethodConfirmation,
-    PaymentMethodHolder,
-    PayoutDestinationData,
-    PayoutStatementRecipientData,
-    SbpPayoutRecipientData,
-    SelfEmployedConfirmationData,
-)
-from .payment import (
-    Airline,
-    Article,
-    AuthorizationDetails,
-    CancellationDetails,
-    CardInfo,
-    CardProduct,
-    Certificate,
-    CertificateCompensation,
-    Confirmation,
-    Customer,
-    Deal,
-    Flight,
-    IndustryDetails,
-    InvoiceDetails,
-    MarkCodeInfo,
-    MarkQuantity,
-    Money,
-    OperationDetails,
-    Passenger,
-    PayerBankDetails,
-    Payment,
-    PaymentAmount,
-    PaymentItem,
-    PaymentMethod,
-    PaymentsList,
-    Receipt,
-    Recipient,
-    Settlement,
-    ThreeDSInfo,
-    Transfer,
-    VatData,
-)
-from .payout import (
-    BankCardPayoutDestination,
-    Payout,
-    PayoutCardInfo,
-    PayoutDestination,
-    PayoutReceipt,
-    SbpPayoutDestination,
-    SelfEmployed,
-    SelfEmployedConfirmation,
-    YooMoneyPayoutDestination,
-)
-from .personal_data import PersonalData, PersonalDataCancellationDetails
-from .receipt_registration import (
-    AdditionalUserProps,
-    FiscalReceipt,
-    FiscalReceiptsList,
-    ReceiptRegistrationItem,
-    Supplier,
-)
-from .refund import Refund, RefundDeal, RefundMethod, RefundsList, RefundSource
-from .sbp_banks import SbpBanksList, SbpParticipantBank
-from .settings import Settings
-from .webhook_notification import WebhookNotification
-from .webhooks import Webhook, WebhooksList
+"""
+YooKassa API types.
+
+Types are imported from their submodules on first access (PEP 562), so
+using a few of them does not build every model of the package.
+"""
+
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from aioyookassa._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .compact import CompactModel, compact_class, to_compact
+    from .deals import Deal as SafeDeal
+    from .deals import DealsList
+    from .enum import (
+        CancellationParty,
+        CancellationReason,
+        ConfirmationType,
+        Currency,
+        DealStatus,
+        FeeMoment,
+        PaymentMethodType,
+        PaymentMode,
+        PaymentStatus,
+        PaymentSubject,
+        PayoutStatus,
+        PersonalDataCancellationParty,
+        PersonalDataCancellationReason,
+        PersonalDataStatus,
+        PersonalDataType,
+        ReceiptRegistration,
+        ReceiptStatus,
+        ReceiptType,
+        SelfEmployedStatus,
+        WebhookEvent,
+    )
+    from .invoice import (
+        Invoice,
+        InvoiceCartItem,
+        InvoiceDeliveryMethodData,
+        InvoicePaymentData,
+        InvoiceReceipt,
+        InvoiceReceiptItem,
+    )
+    from .params import (
+        CapturePaymentParams,
+        CreateDealParams,
+        CreateInvoiceParams,
+        CreatePaymentMethodParams,
+        CreatePaymentParams,
+        CreatePayoutParams,
+        CreatePersonalDataParams,
+        CreateReceiptParams,
+        CreateRefundParams,
+        CreateSelfEmployedParams,
+        CreateWebhookParams,
+        GetDealsParams,
+        GetPaymentsParams,
+        GetReceiptsParams,
+        GetRefundsParams,
+        PaymentMethodCardData,
+        PaymentMethodConfirmation,
+        PaymentMethodHolder,
+        PayoutDestinationData,
+        PayoutStatementRecipientData,
+        SbpPayoutRecipientData,
+        SelfEmployedConfirmationData,
+    )
+    from .payment import (
+        Airline,
+        Article,
+        AuthorizationDetails,
+        CancellationDetails,
+        CardInfo,
+        CardProduct,
+        Certificate,
+        CertificateCompensation,
+        Confirmation,
+        Customer,
+        Deal,
+        Flight,
+        IndustryDetails,
+        InvoiceDetails,
+        MarkCodeInfo,
+        MarkQuantity,
+        Money,
+        OperationDetails,
+        Passenger,
+        PayerBankDetails,
+        Payment,
+        PaymentAmount,
+        PaymentItem,
+        PaymentMethod,
+        PaymentsList,
+        Receipt,
+        Recipient,
+        Settlement,
+        ThreeDSInfo,
+        Transfer,
+        VatData,
+    )
+    from .payout import (
+        BankCardPayoutDestination,
+        Payout,
+        PayoutCardInfo,
+        PayoutDestination,
+        PayoutReceipt,
+        SbpPayoutDestination,
+        SelfEmployed,
+        SelfEmployedConfirmation,
+        YooMoneyPayoutDestination,
+    )
+    from .personal_data import PersonalData, PersonalDataCancellationDetails
+    from .receipt_registration import (
+        AdditionalUserProps,
+        FiscalReceipt,
+        FiscalReceiptsList,
+        ReceiptRegistrationItem,
+        Supplier,
+    )
+    from .refund import Refund, RefundDeal, RefundMethod, RefundsList, RefundSource
+    from .sbp_banks import SbpBanksList, SbpParticipantBank
+    from .settings import Settings
+    from .webhook_notification import WebhookNotification
+    from .webhooks import Webhook, WebhooksList
+
+# Submodule and attribute of every exported name
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "CompactModel": (".compact", "CompactModel"),
+    "compact_class": (".compact", "compact_class"),
+    "to_compact": (".compact", "to_compact"),
+    "SafeDeal": (".deals", "Deal"),
+    "DealsList": (".deals", "DealsList"),
+    "CancellationParty": (".enum", "CancellationParty"),
+    "CancellationReason": (".enum", "CancellationReason"),
+    "ConfirmationType": (".enum", "ConfirmationType"),
+    "Currency": (".enum", "Currency"),
+    "DealStatus": (".enum", "DealStatus"),
+    "FeeMoment": (".enum", "FeeMoment"),
+    "PaymentMethodType": (".enum", "PaymentMethodType"),
+    "PaymentMode": (".enum", "PaymentMode"),
+    "PaymentStatus": (".enum", "PaymentStatus"),
+    "PaymentSubject": (".enum", "PaymentSubject"),
+    "PayoutStatus": (".enum", "PayoutStatus"),
+    "PersonalDataCancellationParty": (".enum", "PersonalDataCancellationParty"),
+    "PersonalDataCancellationReason": (".enum", "PersonalDataCancellationReason"),
+    "PersonalDataStatus": (".enum", "PersonalDataStatus"),
+    "PersonalDataType": (".enum", "PersonalDataType"),
+    "ReceiptRegistration": (".enum", "ReceiptRegistration"),
+    "ReceiptStatus": (".enum", "ReceiptStatus"),
+    "ReceiptType": (".enum", "ReceiptType"),
+    "SelfEmployedStatus": (".enum", "SelfEmployedStatus"),
+    "WebhookEvent": (".enum", "WebhookEvent"),
+    "Invoice": (".invoice", "Invoice"),
+    "InvoiceCartItem": (".invoice", "InvoiceCartItem"),
+    "InvoiceDeliveryMethodData": (".invoice", "InvoiceDeliveryMethodData"),
+    "InvoicePaymentData": (".invoice", "InvoicePaymentData"),
+    "InvoiceReceipt": (".invoice", "InvoiceReceipt"),
+    "InvoiceReceiptItem": (".invoice", "InvoiceReceiptItem"),
+    "CapturePaymentParams": (".params", "CapturePaymentParams"),
+    "CreateDealParams": (".params", "CreateDealParams"),
+    "CreateInvoiceParams": (".params", "CreateInvoiceParams"),
+    "CreatePaymentMethodParams": (".params", "CreatePaymentMethodParams"),
+    "CreatePaymentParams": (".params", "CreatePaymentParams"),
+    "CreatePayoutParams": (".params", "CreatePayoutParams"),
+    "CreatePersonalDataParams": (".params", "CreatePersonalDataParams"),
+    "CreateReceiptParams": (".params", "CreateReceiptParams"),
+    "CreateRefundParams": (".params", "CreateRefundParams"),
+    "CreateSelfEmployedParams": (".params", "CreateSelfEmployedParams"),
+    "CreateWebhookParams": (".params", "CreateWebhookParams"),
+    "GetDealsParams": (".params", "GetDealsParams"),
+    "GetPaymentsParams": (".params", "GetPaymentsParams"),
+    "GetReceiptsParams": (".params", "GetReceiptsParams"),
+    "GetRefundsParams": (".params", "GetRefundsParams"),
+    "PaymentMethodCardData": (".params", "PaymentMethodCardData"),
+    "PaymentMethodConfirmation": (".params", "PaymentMethodConfirmation"),
+    "PaymentMethodHolder": (".params", "PaymentMethodHolder"),
+    "PayoutDestinationData": (".params", "PayoutDestinationData"),
+    "PayoutStatementRecipientData": (".params", "PayoutStatementRecipientData"),
+    "SbpPayoutRecipientData": (".params", "SbpPayoutRecipientData"),
+    "SelfEmployedConfirmationData": (".params", "SelfEmployedConfirmationData"),
+    "Airline": (".payment", "Airline"),
+    "Article": (".payment", "Article"),
+    "AuthorizationDetails": (".payment", "AuthorizationDetails"),
+    "CancellationDetails": (".payment", "CancellationDetails"),
+    "CardInfo": (".payment", "CardInfo"),
+    "CardProduct": (".payment", "CardProduct"),
+    "Certificate": (".payment", "Certificate"),
+    "CertificateCompensation": (".payment", "CertificateCompensation"),
+    "Confirmation": (".payment", "Confirmation"),
+    "Customer": (".payment", "Customer"),
+    "Deal": (".payment", "Deal"),
+    "Flight": (".payment", "Flight"),
+    "IndustryDetails": (".payment", "IndustryDetails"),
+    "InvoiceDetails": (".payment", "InvoiceDetails"),
+    "MarkCodeInfo": (".payment", "MarkCodeInfo"),
+    "MarkQuantity": (".payment", "MarkQuantity"),
+    "Money": (".payment", "Money"),
+    "OperationDetails": (".payment", "OperationDetails"),
+    "Passenger": (".payment", "Passenger"),
+    "PayerBankDetails": (".payment", "PayerBankDetails"),
+    "Payment": (".payment", "Payment"),
+    "PaymentAmount": (".payment", "PaymentAmount"),
+    "PaymentItem": (".payment", "PaymentItem"),
+    "PaymentMethod": (".payment", "PaymentMethod"),
+    "PaymentsList": (".payment", "PaymentsList"),
+    "Receipt": (".payment", "Receipt"),
+    "Recipient": (".payment", "Recipient"),
+    "Settlement": (".payment", "Settlement"),
+    "ThreeDSInfo": (".payment", "ThreeDSInfo"),
+    "Transfer": (".payment", "Transfer"),
+    "VatData": (".payment", "VatData"),
+    "BankCardPayoutDestination": (".payout", "BankCardPayoutDestination"),
+    "Payout": (".payout", "Payout"),
+    "PayoutCardInfo": (".payout", "PayoutCardInfo"),
+    "PayoutDestination": (".payout", "PayoutDestination"),
+    "PayoutReceipt": (".payout", "PayoutReceipt"),
+    "SbpPayoutDestination": (".payout", "SbpPayoutDestination"),
+    "SelfEmployed": (".payout", "SelfEmployed"),
+    "SelfEmployedConfirmation": (".payout", "SelfEmployedConfirmation"),
+    "YooMoneyPayoutDestination": (".payout", "YooMoneyPayoutDestination"),
+    "PersonalData": (".personal_data", "PersonalData"),
+    "PersonalDataCancellationDetails": (
+        ".personal_data",
+        "PersonalDataCancellationDetails",
+    ),
+    "AdditionalUserProps": (".receipt_registration", "AdditionalUserProps"),
+    "FiscalReceipt": (".receipt_registration", "FiscalReceipt"),
+    "FiscalReceiptsList": (".receipt_registration", "FiscalReceiptsList"),
+    "ReceiptRegistrationItem": (".receipt_registration", "ReceiptRegistrationItem"),
+    "Supplier": (".receipt_registration", "Supplier"),
+    "Refund": (".refund", "Refund"),
+    "RefundDeal": (".refund", "RefundDeal"),
+    "RefundMethod": (".refund", "RefundMethod"),
+    "RefundsList": (".refund", "RefundsList"),
+    "RefundSource": (".refund", "RefundSource"),
+    "SbpBanksList": (".sbp_banks", "SbpBanksList"),
+    "SbpParticipantBank": (".sbp_banks", "SbpParticipantBank"),
+    "Settings": (".settings", "Settings"),
+    "WebhookNotification": (".webhook_notification", "WebhookNotification"),
+    "Webhook": (".webhooks", "Webhook"),
+    "WebhooksList": (".webhooks", "WebhooksList"),
+}
 
 __all__ = [
     # Payment types - Core
@@ -215,6 +346,10 @@ __all__ = [
     "Supplier",
     # Settings types
     "Settings",
+    # Compact read-only objects
+    "CompactModel",
+    "compact_class",
+    "to_compact",
     # API Parameters
     "CreatePaymentParams",
     "CapturePaymentParams",
@@ -240,3 +375,6 @@ __all__ = [
     "PaymentMethodHolder",
     "PaymentMethodConfirmation",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _EXPORTS)
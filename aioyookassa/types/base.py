@@ -0,0 +1,16 @@
+"""
+Base class of API types.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class YooKassaModel(BaseModel):
+    """
+    Base model of YooKassa API objects and parameters.
+
+    Validation schemas are built on first use instead of at import time, so
+    importing the library does not pay for models that are never used.
+    """
+
+    model_config = ConfigDict(defer_build=True)
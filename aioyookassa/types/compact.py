@@ -0,0 +1,227 @@
+"""
+Compact read-only representations of API objects.
+
+A compact object is an instance of a slotted class generated from a
+pydantic model: it has the same attributes, but no per-instance ``__dict__``
+and no validation. Values are kept as received from the API (timestamps are
+ISO strings, amounts are strings and enums are their values), so building one
+is much cheaper than validating a model and uses several times less memory.
+
+Compact objects are returned by list methods called with ``compact=True``
+and by :class:`WebhookHandler` created with ``compact=True``. Convert them
+with :meth:`CompactModel.to_model` when the full model is needed.
+"""
+
+import sys
+import typing
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+# Conversions of field values: nothing, a nested object or a list of them
+_RAW = 0
+_NESTED = 1
+_NESTED_LIST = 2
+
+_classes: Dict[Type[BaseModel], Type["CompactModel"]] = {}
+
+
+class CompactModel:
+    """
+    Base class of compact objects.
+
+    Subclasses are created by :func:`compact_class`.
+    """
+
+    __slots__ = ()
+
+    # Pydantic model the class is generated from
+    model: Type[BaseModel]
+    # API names, attribute names, conversions and compact classes of fields
+    _fields: Tuple[Tuple[str, str, int, Optional[Type["CompactModel"]], bool], ...]
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "CompactModel":
+        """
+        Create compact object from API data.
+
+        Keys unknown to the model are dropped, like the model does.
+
+        :param data: Object in API notation
+        :return: Compact object
+        """
+        obj = object.__new__(cls)
+        for key, name, conversion, nested, intern in cls._fields:
+            value = data.get(key)
+            if value is not None:
+                if conversion == _NESTED:
+                    value = nested.from_data(value)  # type: ignore[union-attr]
+                elif conversion == _NESTED_LIST:
+                    value = [nested.from_data(item) for item in value]  # type: ignore[union-attr]
+                elif intern and isinstance(value, str):
+                    # Enum values repeat in every object: keep one copy
+                    value = sys.intern(value)
+            object.__setattr__(obj, name, value)
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict in API notation without empty fields.
+
+        :return: JSON-compatible dictionary
+        """
+        data: Dict[str, Any] = {}
+        for key, name, conversion, _, _ in self._fields:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if conversion == _NESTED:
+                value = value.to_dict()
+            elif conversion == _NESTED_LIST:
+                value = [item.to_dict() for item in value]
+            data[key] = value
+        return data
+
+    def to_model(self) -> Any:
+        """
+        Convert to the full pydantic model.
+
+        :return: Validated model instance
+        """
+        return self.model.model_validate(self.to_dict())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for _, name, *_ in self._fields
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for _, name, *_ in self._fields
+            if getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> Any:
+        return _restore, (self.model, self.to_dict())
+
+
+def _restore(model: Type[BaseModel], data: Dict[str, Any]) -> CompactModel:
+    """Unpickle compact object."""
+    return compact_class(model).from_data(data)
+
+
+def _describe(annotation: Any) -> Tuple[int, Optional[Type[BaseModel]], bool]:
+    """
+    Get conversion of a field annotation.
+
+    :param annotation: Field annotation
+    :return: Conversion, nested model and whether the values are enums
+    """
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union and len(args) == 1:
+        return _describe(args[0])
+    if origin in (list, typing.List) and args:
+        conversion, model, intern = _describe(args[0])
+        if conversion == _NESTED:
+            return _NESTED_LIST, model, False
+        return _RAW, None, False
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _NESTED, annotation, False
+        return _RAW, None, issubclass(annotation, Enum)
+    # Unions of enums and strings are interned, other unions are kept as is
+    return (
+        _RAW,
+        None,
+        any(isinstance(arg, type) and issubclass(arg, Enum) for arg in args),
+    )
+
+
+def compact_class(model: Type[BaseModel]) -> Type[CompactModel]:
+    """
+    Get compact class of a pydantic model.
+
+    Classes are generated once per model, with compact classes of the nested
+    models.
+
+    Example:
+        >>> CompactPayment = compact_class(Payment)
+        >>> payment = CompactPayment.from_data(data)
+        >>> payment.amount.value
+        '100.00'
+
+    :param model: Pydantic model class
+    :return: Slotted read-only class with the attributes of the model
+    """
+    cls = _classes.get(model)
+    if cls is not None:
+        return cls
+    names = tuple(model.model_fields)
+    cls = type(
+        f"Compact{model.__name__}",
+        (CompactModel,),
+        {"__slots__": names, "__module__": __name__, "model": model},
+    )
+    # Registered before the fields are described to allow recursive models
+    _classes[model] = cls
+    fields = []
+    for name, info in model.model_fields.items():
+        conversion, nested, intern = _describe(info.annotation)
+        fields.append(
+            (
+                info.alias or name,
+                name,
+                conversion,
+                compact_class(nested) if nested is not None else None,
+                intern,
+            )
+        )
+    cls._fields = tuple(fields)
+    return cls
+
+
+def to_compact(model: Type[BaseModel], data: Dict[str, Any]) -> CompactModel:
+    """
+    Create compact object of a model from API data.
+
+    :param model: Pydantic model class, e.g. Payment
+    :param data: Object in API notation
+    :return: Compact object
+    """
+    return compact_class(model).from_data(data)
+
+
+def compact_list(result_class: Type[BaseModel], data: Dict[str, Any]) -> Any:
+    """
+    Create list model with compact items.
+
+    The list model is constructed without validation; only its items are
+    compact, cursors are kept as is.
+
+    :param result_class: List model, e.g. PaymentsList
+    :param data: List response in API notation
+    :return: List model instance
+    """
+    values: Dict[str, Any] = {}
+    for name, info in result_class.model_fields.items():
+        value = data.get(info.alias or name)
+        conversion, nested, _ = _describe(info.annotation)
+        if value is not None and conversion == _NESTED_LIST:
+            item_class = compact_class(nested)  # type: ignore[arg-type]
+            value = [item_class.from_data(item) for item in value]
+        values[name] = value
+    return result_class.model_construct(**values)
@@ -5,13 +5,14 @@ Deal types for YooKassa API.
 import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import YooKassaModel
 from .enum import DealStatus, FeeMoment
 from .payment import PaymentAmount
 
 
-class Deal(BaseModel):
+class Deal(YooKassaModel):
     """
     Deal object for Safe Deal API
 
@@ -32,7 +33,7 @@ class Deal(BaseModel):
     test: bool
 
 
-class DealsList(BaseModel):
+class DealsList(YooKassaModel):
     """
     List of deals
     """
@@ -2,8 +2,9 @@ import datetime
 from decimal import Decimal
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import YooKassaModel
 from .enum import Currency
 from .payment import (
     Customer,
@@ -16,7 +17,7 @@ from .payment import (
 )
 
 
-class InvoiceCartItem(BaseModel):
+class InvoiceCartItem(YooKassaModel):
     """
     Invoice cart item.
     """
@@ -27,7 +28,7 @@ class InvoiceCartItem(BaseModel):
     quantity: Union[int, float, str, Decimal]  # API accepts number (integer or decimal)
 
 
-class InvoiceDeliveryMethodData(BaseModel):
+class InvoiceDeliveryMethodData(YooKassaModel):
     """
     Invoice delivery method data.
     """
@@ -35,7 +36,7 @@ class InvoiceDeliveryMethodData(BaseModel):
     type: str  # self
 
 
-class InvoiceReceiptItem(BaseModel):
+class InvoiceReceiptItem(YooKassaModel):
     """
     Invoice receipt item.
     """
@@ -58,7 +59,7 @@ class InvoiceReceiptItem(BaseModel):
     payment_subject_industry_details: Optional[List[IndustryDetails]] = None
 
 
-class InvoiceReceipt(BaseModel):
+class InvoiceReceipt(YooKassaModel):
     """
     Invoice receipt data for fiscal receipt generation.
     """
@@ -72,7 +73,7 @@ class InvoiceReceipt(BaseModel):
     receipt_operational_details: Optional[OperationDetails] = None
 
 
-class InvoicePaymentData(BaseModel):
+class InvoicePaymentData(YooKassaModel):
     """
     Invoice payment data for processing payment by invoice.
     """
@@ -87,7 +88,7 @@ class InvoicePaymentData(BaseModel):
     metadata: Optional[dict] = None
 
 
-class Invoice(BaseModel):
+class Invoice(YooKassaModel):
     """
     Invoice.
     """
@@ -5,8 +5,7 @@ Pydantic models for API method parameters.
 from datetime import date, datetime
 from typing import Any, List, Optional, Union
 
-from pydantic import BaseModel
-
+from .base import YooKassaModel
 from .enum import (
     DealStatus,
     FeeMoment,
@@ -36,7 +35,7 @@ from .refund import RefundDeal, RefundMethod, RefundSource
 
 
 # Payments API Parameters
-class CreatePaymentParams(BaseModel):
+class CreatePaymentParams(YooKassaModel):
     """Parameters for creating a payment."""
 
     amount: PaymentAmount
@@ -57,7 +56,7 @@ class CreatePaymentParams(BaseModel):
     merchant_customer_id: Optional[str] = None
 
 
-class CapturePaymentParams(BaseModel):
+class CapturePaymentParams(YooKassaModel):
     """Parameters for capturing a payment."""
 
     amount: Optional[PaymentAmount] = None
@@ -67,7 +66,7 @@ class CapturePaymentParams(BaseModel):
     deal: Optional[Deal] = None
 
 
-class GetPaymentsParams(BaseModel):
+class GetPaymentsParams(YooKassaModel):
     """Parameters for getting payments list."""
 
     created_at: Optional[datetime] = None
@@ -79,7 +78,7 @@ class GetPaymentsParams(BaseModel):
 
 
 # Refunds API Parameters
-class CreateRefundParams(BaseModel):
+class CreateRefundParams(YooKassaModel):
     """Parameters for creating a refund."""
 
     payment_id: str
@@ -91,7 +90,7 @@ class CreateRefundParams(BaseModel):
     refund_method_data: Optional[RefundMethod] = None
 
 
-class GetRefundsParams(BaseModel):
+class GetRefundsParams(YooKassaModel):
     """Parameters for getting refunds list."""
 
     created_at_gte: Optional[datetime] = None
@@ -105,7 +104,7 @@ class GetRefundsParams(BaseModel):
 
 
 # Invoices API Parameters
-class CreateInvoiceParams(BaseModel):
+class CreateInvoiceParams(YooKassaModel):
     """Parameters for creating an invoice."""
 
     payment_data: InvoicePaymentData
@@ -118,7 +117,7 @@ class CreateInvoiceParams(BaseModel):
 
 
 # Receipts API Parameters
-class CreateReceiptParams(BaseModel):
+class CreateReceiptParams(YooKassaModel):
     """Parameters for creating a receipt."""
 
     type: Union[ReceiptType, str]
@@ -137,7 +136,7 @@ class CreateReceiptParams(BaseModel):
     on_behalf_of: Optional[str] = None
 
 
-class GetReceiptsParams(BaseModel):
+class GetReceiptsParams(YooKassaModel):
     """Parameters for getting receipts list."""
 
     created_at_gte: Optional[datetime] = None
@@ -152,7 +151,7 @@ class GetReceiptsParams(BaseModel):
 
 
 # Payment Methods API Parameters
-class PaymentMethodCardData(BaseModel):
+class PaymentMethodCardData(YooKassaModel):
     """Bank card data for payment method creation."""
 
     number: str
@@ -162,13 +161,13 @@ class PaymentMethodCardData(BaseModel):
     csc: Optional[str] = None  # CVC2 or CVV2 code
 
 
-class PaymentMethodHolder(BaseModel):
+class PaymentMethodHolder(YooKassaModel):
     """Holder data for payment method creation."""
 
     gateway_id: str
 
 
-class PaymentMethodConfirmation(BaseModel):
+class PaymentMethodConfirmation(YooKassaModel):
     """Confirmation data for payment method creation."""
 
     type: str  # Usually "redirect"
@@ -177,7 +176,7 @@ class PaymentMethodConfirmation(BaseModel):
     return_url: str
 
 
-class CreatePaymentMethodParams(BaseModel):
+class CreatePaymentMethodParams(YooKassaModel):
     """Parameters for creating a payment method."""
 
     type: str  # Required, e.g., "bank_card"
@@ -188,20 +187,20 @@ class CreatePaymentMethodParams(BaseModel):
 
 
 # Payouts API Parameters
-class BankCardPayoutCardData(BaseModel):
+class BankCardPayoutCardData(YooKassaModel):
     """Bank card number for payout creation."""
 
     number: str
 
 
-class BankCardPayoutDestinationData(BaseModel):
+class BankCardPayoutDestinationData(YooKassaModel):
     """Bank card data for payout creation."""
 
     type: str = "bank_card"
     card: BankCardPayoutCardData
 
 
-class SbpPayoutDestinationData(BaseModel):
+class SbpPayoutDestinationData(YooKassaModel):
     """SBP payout destination data for payout creation."""
 
     type: str = "sbp"
@@ -209,7 +208,7 @@ class SbpPayoutDestinationData(BaseModel):
     phone: str
 
 
-class YooMoneyPayoutDestinationData(BaseModel):
+class YooMoneyPayoutDestinationData(YooKassaModel):
     """YooMoney payout destination data for payout creation."""
 
     type: str = "yoo_money"
@@ -223,14 +222,14 @@ PayoutDestinationData = Union[
 ]
 
 
-class PayoutReceiptData(BaseModel):
+class PayoutReceiptData(YooKassaModel):
     """Receipt data for self-employed payout creation."""
 
     service_name: str
     amount: Optional[PaymentAmount] = None
 
 
-class CreatePayoutParams(BaseModel):
+class CreatePayoutParams(YooKassaModel):
     """Parameters for creating a payout."""
 
     amount: PaymentAmount
@@ -246,14 +245,14 @@ class CreatePayoutParams(BaseModel):
 
 
 # Self-Employed API Parameters
-class SelfEmployedConfirmationData(BaseModel):
+class SelfEmployedConfirmationData(YooKassaModel):
     """Confirmation data for self-employed creation."""
 
     type: str = "redirect"
     confirmation_url: str
 
 
-class CreateSelfEmployedParams(BaseModel):
+class CreateSelfEmployedParams(YooKassaModel):
     """Parameters for creating a self-employed."""
 
     itn: Optional[str] = None
@@ -262,7 +261,7 @@ class CreateSelfEmployedParams(BaseModel):
 
 
 # Personal Data API Parameters
-class SbpPayoutRecipientData(BaseModel):
+class SbpPayoutRecipientData(YooKassaModel):
     """Data for sbp_payout_recipient type personal data."""
 
     type: str = "sbp_payout_recipient"
@@ -272,7 +271,7 @@ class SbpPayoutRecipientData(BaseModel):
     metadata: Optional[dict] = None
 
 
-class PayoutStatementRecipientData(BaseModel):
+class PayoutStatementRecipientData(YooKassaModel):
     """Data for payout_statement_recipient type personal data."""
 
     type: str = "payout_statement_recipient"
@@ -287,7 +286,7 @@ CreatePersonalDataParams = Union[SbpPayoutRecipientData, PayoutStatementRecipien
 
 
 # Deals API Parameters
-class CreateDealParams(BaseModel):
+class CreateDealParams(YooKassaModel):
     """Parameters for creating a deal."""
 
     type: str = "safe_deal"
@@ -296,7 +295,7 @@ class CreateDealParams(BaseModel):
     description: Optional[str] = None
 
 
-class GetDealsParams(BaseModel):
+class GetDealsParams(YooKassaModel):
     """Parameters for getting deals list."""
 
     created_at_gte: Optional[datetime] = None
@@ -314,7 +313,7 @@ class GetDealsParams(BaseModel):
 
 
 # Webhooks API Parameters
-class CreateWebhookParams(BaseModel):
+class CreateWebhookParams(YooKassaModel):
     """Parameters for creating a webhook."""
 
     event: str
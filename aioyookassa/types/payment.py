@@ -1,9 +1,17 @@
 import datetime
-from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel, Field, model_validator
+import math
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from pydantic import (
+    Field,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
+from .base import YooKassaModel
 from .enum import (
     CancellationParty,
     CancellationReason,
@@ -17,7 +25,7 @@ from .enum import (
 )
 
 
-class Confirmation(BaseModel):
+class Confirmation(YooKassaModel):
     """Confirmation"""
 
     type: ConfirmationType
@@ -41,29 +49,174 @@ class Confirmation(BaseModel):
         return data
 
 
-class Money(BaseModel):
+# Digits after the decimal point of amounts. All currencies accepted by
+# YooKassa use two; others are listed in _CURRENCY_EXPONENTS.
+_DEFAULT_EXPONENT = 2
+_CURRENCY_EXPONENTS: Dict[str, int] = {}
+_QUANTUMS: Dict[str, Decimal] = {}
+
+
+def _get_quantum(currency: Union[Currency, str]) -> Decimal:
+    """
+    Get the smallest unit of a currency, e.g. ``Decimal("0.01")``.
+
+    :param currency: Currency code
+    :return: Quantum of amounts in the currency
+    """
+    code = str(currency)
+    quantum = _QUANTUMS.get(code)
+    if quantum is None:
+        exponent = _CURRENCY_EXPONENTS.get(code, _DEFAULT_EXPONENT)
+        quantum = _QUANTUMS[code] = Decimal(1).scaleb(-exponent)
+    return quantum
+
+
+class Money(YooKassaModel):
     """
     Monetary amount with currency.
 
     Represents a monetary value with currency. Used across all API domains
     (payments, payouts, refunds, deals, etc.) to represent monetary values.
 
-    Supports multiple numeric types for convenience:
+    The value is always a Decimal quantized to the minor unit of the currency
+    and is serialized to JSON as a string (``"100.50"``). It accepts:
     - int: Money(value=100, currency="RUB")
-    - float: Money(value=100.50, currency="RUB")
     - str: Money(value="100.00", currency="RUB")
     - Decimal: Money(value=Decimal("100.00"), currency="RUB")
+    - float: Money(value=100.50, currency="RUB"), rounded half up to the
+      minor unit
+
+    Exact values with more digits than the currency has are rejected.
+
+    Amounts of the same currency can be added, subtracted and compared;
+    use :meth:`sum` to add up many amounts.
     """
 
-    value: Union[int, float, str, Decimal]
+    # Validated before the value, which is quantized to the currency
     currency: Union[Currency, str] = Currency.RUB
+    value: Decimal
+
+    @field_validator("value", mode="before")
+    @classmethod
+    def quantize_value(cls, value: Any, info: ValidationInfo) -> Any:
+        quantum = _get_quantum(info.data.get("currency", Currency.RUB))
+        if isinstance(value, float) and math.isfinite(value):
+            # Floats cannot represent amounts exactly: round them to the currency
+            return Decimal(repr(value)).quantize(quantum, ROUND_HALF_UP)
+        if isinstance(value, bool) or not isinstance(value, (Decimal, int, str)):
+            return value
+        try:
+            decimal = Decimal(value)
+        except InvalidOperation:
+            # Invalid values are reported by the Decimal validation
+            return value
+        if not decimal.is_finite():
+            return value
+        quantized = decimal.quantize(quantum)
+        if quantized != decimal:
+            currency = info.data.get("currency", Currency.RUB)
+            raise ValueError(
+                f"Amount {decimal} has more decimal places than {currency}"
+            )
+        return quantized
+
+    @field_serializer("value", when_used="json")
+    def serialize_value(self, value: Decimal) -> str:
+        return format(value, "f")
+
+    @classmethod
+    def _new(cls, value: Decimal, currency: Union[Currency, str]) -> "Money":
+        """Create amount from an already quantized value without validation."""
+        return cls.model_construct(value=value, currency=currency)
+
+    def _check_currency(self, other: "Money") -> None:
+        if other.currency != self.currency:
+            raise ValueError(
+                f"Cannot combine amounts in {self.currency} and {other.currency}"
+            )
+
+    def __add__(self, other: Any) -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self._new(self.value + other.value, self.currency)
+
+    def __radd__(self, other: Any) -> "Money":
+        # Allows the builtin sum() with its default start of 0
+        if isinstance(other, int) and other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: Any) -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self._new(self.value - other.value, self.currency)
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.value < other.value
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.value <= other.value
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.value > other.value
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.value >= other.value
+
+    @classmethod
+    def sum(
+        cls,
+        amounts: Iterable[Optional["Money"]],
+        currency: Optional[Union[Currency, str]] = None,
+    ) -> "Money":
+        """
+        Add up amounts of one currency.
+
+        Example:
+            >>> Money.sum(payment.refunded_amount for payment in payments)
+
+        :param amounts: Amounts. None items (absent optional amounts) are
+            skipped.
+        :param currency: Currency of the amounts. Defaults to the currency of
+            the first amount, or RUB if there are none.
+        :return: Total amount
+        :raises ValueError: If the amounts are in different currencies
+        """
+        total = Decimal(0)
+        for amount in amounts:
+            if amount is None:
+                continue
+            if currency is None:
+                currency = amount.currency
+            elif amount.currency != currency:
+                raise ValueError(
+                    f"Cannot combine amounts in {currency} and {amount.currency}"
+                )
+            total += amount.value
+        if currency is None:
+            currency = Currency.RUB
+        return cls._new(total.quantize(_get_quantum(currency)), currency)
 
 
 # Alias for backward compatibility
 PaymentAmount = Money
 
 
-class Recipient(BaseModel):
+class Recipient(YooKassaModel):
     """
     Payment receiver
     """
@@ -72,7 +225,7 @@ class Recipient(BaseModel):
     gateway_id: str
 
 
-class PayerBankDetails(BaseModel):
+class PayerBankDetails(YooKassaModel):
     """
     Bank details of the payer
     """
@@ -92,7 +245,7 @@ class PayerBankDetails(BaseModel):
     sbp_operation_id: Optional[str] = None
 
 
-class VatData(BaseModel):
+class VatData(YooKassaModel):
     """
     VAT data
     """
@@ -102,7 +255,7 @@ class VatData(BaseModel):
     rate: Optional[str] = None
 
 
-class CardProduct(BaseModel):
+class CardProduct(YooKassaModel):
     """
     Card product information
     """
@@ -111,7 +264,7 @@ class CardProduct(BaseModel):
     name: Optional[str] = None
 
 
-class CardInfo(BaseModel):
+class CardInfo(YooKassaModel):
     """
     Card information
     """
@@ -127,16 +280,13 @@ class CardInfo(BaseModel):
     source: Optional[str] = None
 
 
-class CertificateCompensation(BaseModel):
+class CertificateCompensation(Money):
     """
     Certificate compensation information
     """
 
-    value: Union[int, float, str, Decimal]
-    currency: Union[Currency, str] = Currency.RUB
-
 
-class Certificate(BaseModel):
+class Certificate(YooKassaModel):
     """
     Electronic certificate information
     """
@@ -147,7 +297,7 @@ class Certificate(BaseModel):
     applied_compensation: CertificateCompensation
 
 
-class Article(BaseModel):
+class Article(YooKassaModel):
     """
     Article information for electronic certificate
     """
@@ -158,7 +308,7 @@ class Article(BaseModel):
     certificates: List[Certificate]
 
 
-class PaymentMethod(BaseModel):
+class PaymentMethod(YooKassaModel):
     """
     Payment method
     """
@@ -182,12 +332,12 @@ class PaymentMethod(BaseModel):
     articles: Optional[List[Article]] = None
 
 
-class CancellationDetails(BaseModel):
+class CancellationDetails(YooKassaModel):
     party: CancellationParty
     reason: CancellationReason
 
 
-class ThreeDSInfo(BaseModel):
+class ThreeDSInfo(YooKassaModel):
     """
     3DS information
     """
@@ -195,13 +345,13 @@ class ThreeDSInfo(BaseModel):
     applied: bool
 
 
-class AuthorizationDetails(BaseModel):
+class AuthorizationDetails(YooKassaModel):
     transaction_identifier: Optional[str] = Field(None, alias="rrn")
     authorization_code: Optional[str] = Field(None, alias="auth_code")
     three_d_secure: ThreeDSInfo
 
 
-class Transfer(BaseModel):
+class Transfer(YooKassaModel):
     account_id: str
     amount: PaymentAmount
     status: PaymentStatus
@@ -210,17 +360,17 @@ class Transfer(BaseModel):
     metadata: Optional[dict] = None
 
 
-class Settlement(BaseModel):
+class Settlement(YooKassaModel):
     type: str
     amount: PaymentAmount
 
 
-class Deal(BaseModel):
+class Deal(YooKassaModel):
     id: str
     settlements: Optional[List[PaymentAmount]] = None
 
 
-class InvoiceDetails(BaseModel):
+class InvoiceDetails(YooKassaModel):
     """
     Invoice details
     """
@@ -228,7 +378,7 @@ class InvoiceDetails(BaseModel):
     id: Optional[str] = None
 
 
-class Payment(BaseModel):
+class Payment(YooKassaModel):
     """
     Payment
     """
@@ -258,16 +408,17 @@ class Payment(BaseModel):
     invoice_details: Optional[InvoiceDetails] = None
 
 
-class PaymentsList(BaseModel):
+class PaymentsList(YooKassaModel):
     """
     Payments list
     """
 
     list: Optional[List[Payment]] = Field(None, alias="items")
     cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
-class Customer(BaseModel):
+class Customer(YooKassaModel):
     """
     Customer
     """
@@ -278,7 +429,7 @@ class Customer(BaseModel):
     phone: Optional[str] = None
 
 
-class MarkQuantity(BaseModel):
+class MarkQuantity(YooKassaModel):
     """
     Mark quantity
     """
@@ -287,7 +438,7 @@ class MarkQuantity(BaseModel):
     denominator: int
 
 
-class MarkCodeInfo(BaseModel):
+class MarkCodeInfo(YooKassaModel):
     """
     Mark code information
     """
@@ -305,7 +456,7 @@ class MarkCodeInfo(BaseModel):
     egais_30: Optional[str] = None
 
 
-class IndustryDetails(BaseModel):
+class IndustryDetails(YooKassaModel):
     """
     Industry details
     """
@@ -316,7 +467,7 @@ class IndustryDetails(BaseModel):
     value: str
 
 
-class PaymentItem(BaseModel):
+class PaymentItem(YooKassaModel):
     """
     Payment items
     """
@@ -339,7 +490,7 @@ class PaymentItem(BaseModel):
     payment_subject_industry_details: Optional[List[IndustryDetails]] = None
 
 
-class OperationDetails(BaseModel):
+class OperationDetails(YooKassaModel):
     """
     Operation details
     """
@@ -349,7 +500,7 @@ class OperationDetails(BaseModel):
     created_at: datetime.datetime
 
 
-class Receipt(BaseModel):
+class Receipt(YooKassaModel):
     """
     Receipt
     """
@@ -365,19 +516,19 @@ class Receipt(BaseModel):
     receipt_operational_details: Optional[OperationDetails] = None
 
 
-class Passenger(BaseModel):
+class Passenger(YooKassaModel):
     first_name: str
     last_name: str
 
 
-class Flight(BaseModel):
+class Flight(YooKassaModel):
     departure_airport: str
     arrival_airport: str
     departure_date: datetime.datetime
     carrier_code: Optional[str] = None
 
 
-class Airline(BaseModel):
+class Airline(YooKassaModel):
     """
     Airline
     """
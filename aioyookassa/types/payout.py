@@ -2,13 +2,14 @@ import datetime
 from decimal import Decimal
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import YooKassaModel
 from .enum import Currency, PayoutStatus, SelfEmployedStatus
 from .payment import CancellationDetails, Deal, PaymentAmount
 
 
-class PayoutCardInfo(BaseModel):
+class PayoutCardInfo(YooKassaModel):
     """
     Bank card information for payout
     """
@@ -20,7 +21,7 @@ class PayoutCardInfo(BaseModel):
     issuer_name: Optional[str] = None
 
 
-class BankCardPayoutDestination(BaseModel):
+class BankCardPayoutDestination(YooKassaModel):
     """
     Bank card payout destination
     """
@@ -29,7 +30,7 @@ class BankCardPayoutDestination(BaseModel):
     card: PayoutCardInfo
 
 
-class SbpPayoutDestination(BaseModel):
+class SbpPayoutDestination(YooKassaModel):
     """
     SBP (Fast Payments System) payout destination
     """
@@ -40,7 +41,7 @@ class SbpPayoutDestination(BaseModel):
     recipient_checked: bool
 
 
-class YooMoneyPayoutDestination(BaseModel):
+class YooMoneyPayoutDestination(YooKassaModel):
     """
     YooMoney wallet payout destination
     """
@@ -55,7 +56,7 @@ PayoutDestination = Union[
 ]
 
 
-class PayoutReceipt(BaseModel):
+class PayoutReceipt(YooKassaModel):
     """
     Receipt data for self-employed payout
     """
@@ -66,7 +67,7 @@ class PayoutReceipt(BaseModel):
     amount: Optional[PaymentAmount] = None
 
 
-class SelfEmployedConfirmation(BaseModel):
+class SelfEmployedConfirmation(YooKassaModel):
     """
     Self-employed confirmation object
     """
@@ -75,7 +76,7 @@ class SelfEmployedConfirmation(BaseModel):
     confirmation_url: str
 
 
-class SelfEmployed(BaseModel):
+class SelfEmployed(YooKassaModel):
     """
     Self-employed person data
 
@@ -93,7 +94,7 @@ class SelfEmployed(BaseModel):
     test: Optional[bool] = None
 
 
-class Payout(BaseModel):
+class Payout(YooKassaModel):
     """
     Payout object
     """
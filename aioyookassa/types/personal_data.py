@@ -1,8 +1,7 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
+from .base import YooKassaModel
 from .enum import (
     PersonalDataCancellationParty,
     PersonalDataCancellationReason,
@@ -11,7 +10,7 @@ from .enum import (
 )
 
 
-class PersonalDataCancellationDetails(BaseModel):
+class PersonalDataCancellationDetails(YooKassaModel):
     """
     Cancellation details for personal data
     """
@@ -20,7 +19,7 @@ class PersonalDataCancellationDetails(BaseModel):
     reason: PersonalDataCancellationReason
 
 
-class PersonalData(BaseModel):
+class PersonalData(YooKassaModel):
     """
     Personal data object
     """
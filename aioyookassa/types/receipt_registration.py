@@ -2,8 +2,7 @@ import datetime
 from decimal import Decimal
 from typing import List, Optional, Union
 
-from pydantic import BaseModel
-
+from .base import YooKassaModel
 from .enum import ReceiptStatus, ReceiptType
 from .payment import (
     IndustryDetails,
@@ -15,7 +14,7 @@ from .payment import (
 )
 
 
-class Supplier(BaseModel):
+class Supplier(YooKassaModel):
     """
     Supplier information.
     """
@@ -25,7 +24,7 @@ class Supplier(BaseModel):
     inn: Optional[str] = None
 
 
-class ReceiptRegistrationItem(BaseModel):
+class ReceiptRegistrationItem(YooKassaModel):
     """
     Receipt registration item.
     """
@@ -50,7 +49,7 @@ class ReceiptRegistrationItem(BaseModel):
     mark_mode: Optional[str] = None
 
 
-class AdditionalUserProps(BaseModel):
+class AdditionalUserProps(YooKassaModel):
     """
     Additional user properties.
     """
@@ -59,7 +58,7 @@ class AdditionalUserProps(BaseModel):
     value: str
 
 
-class FiscalReceipt(BaseModel):
+class FiscalReceipt(YooKassaModel):
     """
     Fiscal receipt.
     """
@@ -84,7 +83,7 @@ class FiscalReceipt(BaseModel):
     receipt_operational_details: Optional[OperationDetails] = None
 
 
-class FiscalReceiptsList(BaseModel):
+class FiscalReceiptsList(YooKassaModel):
     """
     Fiscal receipts list.
     """
@@ -2,13 +2,14 @@ import datetime
 from decimal import Decimal
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import YooKassaModel
 from .enum import ReceiptRegistration
 from .payment import CancellationDetails, Deal, PaymentAmount, Receipt, Settlement
 
 
-class RefundSource(BaseModel):
+class RefundSource(YooKassaModel):
     """
     Refund source for split payments.
     """
@@ -18,7 +19,7 @@ class RefundSource(BaseModel):
     platform_fee_amount: Optional[PaymentAmount] = None
 
 
-class RefundDeal(BaseModel):
+class RefundDeal(YooKassaModel):
     """
     Refund deal - данные о сделке
     """
@@ -27,7 +28,7 @@ class RefundDeal(BaseModel):
     refund_settlements: List[Settlement]
 
 
-class RefundArticle(BaseModel):
+class RefundArticle(YooKassaModel):
     """
     Refund article for electronic certificate refund cart.
     """
@@ -38,7 +39,7 @@ class RefundArticle(BaseModel):
     quantity: Union[int, float, str, Decimal]
 
 
-class ElectronicCertificateData(BaseModel):
+class ElectronicCertificateData(YooKassaModel):
     """
     Electronic certificate data.
     """
@@ -47,7 +48,7 @@ class ElectronicCertificateData(BaseModel):
     basket_id: str
 
 
-class RefundMethod(BaseModel):
+class RefundMethod(YooKassaModel):
     """
     Refund method details.
     """
@@ -58,7 +59,7 @@ class RefundMethod(BaseModel):
     electronic_certificate: Optional[ElectronicCertificateData] = None
 
 
-class RefundAuthorizationDetails(BaseModel):
+class RefundAuthorizationDetails(YooKassaModel):
     """
     Refund authorization details.
     """
@@ -66,7 +67,7 @@ class RefundAuthorizationDetails(BaseModel):
     rrn: Optional[str] = None  # Retrieval Reference Number
 
 
-class Refund(BaseModel):
+class Refund(YooKassaModel):
     """
     Refund.
     """
@@ -85,7 +86,7 @@ class Refund(BaseModel):
     refund_authorization_details: Optional[RefundAuthorizationDetails] = None
 
 
-class RefundsList(BaseModel):
+class RefundsList(YooKassaModel):
     """
     Refunds list.
     """
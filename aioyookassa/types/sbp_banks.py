@@ -1,9 +1,11 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import YooKassaModel
 
-class SbpParticipantBank(BaseModel):
+
+class SbpParticipantBank(YooKassaModel):
     """
     SBP participant bank object
     """
@@ -13,7 +15,7 @@ class SbpParticipantBank(BaseModel):
     bic: str
 
 
-class SbpBanksList(BaseModel):
+class SbpBanksList(YooKassaModel):
     """
     SBP banks list
     """
@@ -1,7 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from .base import YooKassaModel
 from .payment import PaymentAmount
 
 
@@ -12,7 +11,7 @@ class AccountStatus:
     DISABLED = "disabled"
 
 
-class Fiscalization(BaseModel):
+class Fiscalization(YooKassaModel):
     """
     Fiscalization settings
     """
@@ -22,7 +21,7 @@ class Fiscalization(BaseModel):
     fiscalization_enabled: Optional[bool] = None
 
 
-class Settings(BaseModel):
+class Settings(YooKassaModel):
     """
     Settings object for shop or gateway (Me)
 
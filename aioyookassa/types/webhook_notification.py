@@ -4,10 +4,10 @@ Webhook notification types for YooKassa API.
 
 from typing import Literal
 
-from pydantic import BaseModel
+from .base import YooKassaModel
 
 
-class WebhookNotification(BaseModel):
+class WebhookNotification(YooKassaModel):
     """
     Webhook notification from YooKassa.
 
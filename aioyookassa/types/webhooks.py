@@ -4,10 +4,12 @@ Webhook types for YooKassa API.
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import YooKassaModel
 
-class Webhook(BaseModel):
+
+class Webhook(YooKassaModel):
     """
     Webhook object
 
@@ -19,7 +21,7 @@ class Webhook(BaseModel):
     url: str
 
 
-class WebhooksList(BaseModel):
+class WebhooksList(YooKassaModel):
     """
     List of webhooks
     """
@@ -0,0 +1,295 @@
+"""
+Cold-start benchmark of aioyookassa.
+
+Every measurement runs in a fresh interpreter, like a serverless handler or
+a CLI tool that starts for one request:
+
+- import time of ``import aioyookassa`` (``python -X importtime``);
+- import cost of every module of ``aioyookassa.types`` and
+  ``aioyookassa.core.api``;
+- latency of the first and of a warm validation of Payment and PaymentsList,
+  which includes building the deferred pydantic schemas;
+- time from interpreter start to the response of the first request of a
+  YooKassa client to a local stub server.
+
+Usage:
+    python benchmarks/cold_start.py                      # print results
+    python benchmarks/cold_start.py --check              # fail over budget
+    python benchmarks/cold_start.py --json results.json  # save results
+
+Budgets are in ``benchmarks/budgets.json``; medians of ``--runs`` runs are
+compared with them. Each budget is the measured median plus about 25-30%,
+tight enough to catch a regression of one lazy import or deferred schema.
+To re-baseline after an intended change, run
+``python benchmarks/cold_start.py --runs 7`` on an idle machine a few times,
+take the highest median of every value and set its budget 25-30% above.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budgets.json")
+MODULE_PACKAGES = ("aioyookassa.types", "aioyookassa.core.api")
+
+PAYMENT = {
+    "id": "2d1c8f2e-000f-5000-9000-1b68e7b15f3f",
+    "status": "succeeded",
+    "amount": {"value": "100.00", "currency": "RUB"},
+    "income_amount": {"value": "96.50", "currency": "RUB"},
+    "description": "Order 1",
+    "recipient": {"account_id": "100500", "gateway_id": "100700"},
+    "payment_method": {
+        "type": "bank_card",
+        "id": "2d1c8f2e-000f-5000-9000-1b68e7b15f3f",
+        "saved": False,
+        "status": "inactive",
+        "card": {
+            "first6": "555555",
+            "last4": "4444",
+            "expiry_year": "2030",
+            "expiry_month": "12",
+            "card_type": "MasterCard",
+        },
+    },
+    "captured_at": "2024-01-01T00:00:05.000Z",
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "test": True,
+    "refunded_amount": {"value": "0.00", "currency": "RUB"},
+    "paid": True,
+    "refundable": True,
+    "metadata": {"order_id": "1"},
+}
+
+IMPORT_MODULES = """
+import pkgutil, sys
+# __import__ is logged by -X importtime, importlib.import_module is not
+for name in {packages!r}:
+    __import__(name)
+    for module in pkgutil.iter_modules(sys.modules[name].__path__, name + "."):
+        __import__(module.name)
+"""
+
+VALIDATION = """
+import json, sys, time
+from aioyookassa.types.payment import Payment, PaymentsList
+
+payment = json.loads(sys.argv[1])
+page = {"items": [payment] * 100, "next_cursor": "cursor"}
+result = {}
+for name, model, data in (("payment", Payment, payment), ("list", PaymentsList, page)):
+    start = time.perf_counter()
+    model.model_validate(data)
+    result[name + "_first_ms"] = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    model.model_validate(data)
+    result[name + "_warm_ms"] = (time.perf_counter() - start) * 1000
+print(json.dumps(result))
+"""
+
+FIRST_REQUEST = """
+import time
+
+start = time.perf_counter()
+import asyncio, json, sys
+from aioyookassa import YooKassa
+
+async def main():
+    async with YooKassa(api_key="test", shop_id=1) as client:
+        client.BASE_URL = sys.argv[1]
+        await client.payments.get_payment("payment_id")
+
+asyncio.run(main())
+print(json.dumps({"first_request_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Stub API answering every request with a payment."""
+
+    body = json.dumps(PAYMENT).encode()
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _run(
+    code: str, args: Sequence[str] = (), options: Sequence[str] = ()
+) -> subprocess.CompletedProcess:
+    """
+    Run code in a fresh interpreter.
+
+    :param code: Code to run
+    :param args: Values of ``sys.argv[1:]``
+    :param options: Interpreter options
+    :return: Completed process with captured output
+    """
+    return subprocess.run(
+        [sys.executable, *options, "-c", code, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+    )
+
+
+def _parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    :param stderr: Standard error of the interpreter
+    :return: Self and cumulative microseconds by module
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        modules[name.strip()] = {
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        }
+    return modules
+
+
+def measure_import(runs: int) -> Dict[str, Any]:
+    """
+    Measure ``import aioyookassa`` and imports of the type and API modules.
+
+    :param runs: Number of runs
+    :return: Median import time and per-module costs
+    """
+    totals = []
+    modules: Dict[str, List[int]] = {}
+    code = IMPORT_MODULES.format(packages=MODULE_PACKAGES)
+    for _ in range(runs):
+        parsed = _parse_importtime(
+            _run("import aioyookassa", options=["-X", "importtime"]).stderr
+        )
+        totals.append(parsed["aioyookassa"]["cumulative_us"])
+        parsed = _parse_importtime(_run(code, options=["-X", "importtime"]).stderr)
+        for name, times in parsed.items():
+            if name.startswith(MODULE_PACKAGES):
+                modules.setdefault(name, []).append(times["self_us"])
+    return {
+        "import_ms": statistics.median(totals) / 1000,
+        "modules_self_ms": {
+            name: statistics.median(values) / 1000
+            for name, values in sorted(modules.items())
+        },
+    }
+
+
+def _median_of(results: List[Dict[str, float]]) -> Dict[str, float]:
+    return {key: statistics.median(r[key] for r in results) for key in results[0]}
+
+
+def measure_validation(runs: int) -> Dict[str, float]:
+    """
+    Measure first and warm validation of Payment and PaymentsList.
+
+    :param runs: Number of runs
+    :return: Median latencies in milliseconds
+    """
+    return _median_of(
+        [
+            json.loads(_run(VALIDATION, [json.dumps(PAYMENT)]).stdout)
+            for _ in range(runs)
+        ]
+    )
+
+
+def measure_first_request(runs: int) -> Dict[str, float]:
+    """
+    Measure time from interpreter start to the first response of a stub API.
+
+    :param runs: Number of runs
+    :return: Median latency in milliseconds
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        return _median_of(
+            [json.loads(_run(FIRST_REQUEST, [url]).stdout) for _ in range(runs)]
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def check_budgets(
+    results: Dict[str, Any], budgets: Dict[str, Any], prefix: str = ""
+) -> List[str]:
+    """
+    Compare results with budgets.
+
+    :param results: Benchmark results
+    :param budgets: Maximum milliseconds by result key, nested for modules
+    :param prefix: Prefix of the reported keys
+    :return: Descriptions of exceeded budgets
+    """
+    exceeded = []
+    for key, budget in budgets.items():
+        value = results.get(key)
+        if value is None:
+            continue
+        if isinstance(budget, dict):
+            exceeded.extend(check_budgets(value, budget, f"{prefix}{key}."))
+        elif value > budget:
+            exceeded.append(f"{prefix}{key}: {value:.1f} ms > {budget} ms")
+    return exceeded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    parser.add_argument("--check", action="store_true", help="fail over budget")
+    parser.add_argument("--budgets", default=BUDGETS, help="budgets file")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {}
+    results.update(measure_import(args.runs))
+    results.update(measure_validation(args.runs))
+    results.update(measure_first_request(args.runs))
+
+    for key, value in results.items():
+        if isinstance(value, dict):
+            print(f"{key}:")
+            for name, item in value.items():
+                print(f"  {name:<48} {item:8.2f}")
+        else:
+            print(f"{key:<50} {value:8.2f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.check:
+        with open(args.budgets, encoding="utf-8") as file:
+            exceeded = check_budgets(results, json.load(file))
+        for message in exceeded:
+            print(f"Over budget: {message}", file=sys.stderr)
+        return 1 if exceeded else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
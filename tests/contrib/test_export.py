@@ -0,0 +1,176 @@
+"""
+Tests for streaming export.
+"""
+
+import csv
+import json
+
+import pytest
+
+from aioyookassa.contrib.export import _FileWriter, _Writer, export, flatten
+from aioyookassa.exceptions import ServerError
+from aioyookassa.types.refund import RefundsList
+
+COLUMNS = ["id", "payment_id", "amount.value", "description"]
+
+
+def refund(index, **fields):
+    return {
+        "id": f"r{index}",
+        "payment_id": f"p{index}",
+        "status": "succeeded",
+        "created_at": "2024-01-01T00:00:00.000Z",
+        "amount": {"value": f"{index}.00", "currency": "RUB"},
+        **fields,
+    }
+
+
+PAGES = {
+    None: RefundsList(items=[refund(1), refund(2)], next_cursor="c1"),
+    "c1": RefundsList(items=[refund(3, description="Late")], next_cursor="c2"),
+    "c2": RefundsList(items=[refund(4)], next_cursor=None),
+}
+
+
+def make_list_method(fail_on="never"):
+    """Create list method over PAGES failing once on the given cursor."""
+    calls = []
+
+    async def get_refunds(params=None, **kwargs):
+        cursor = (params or {}).get("cursor")
+        calls.append(cursor)
+        if cursor == fail_on and calls.count(cursor) == 1:
+            raise ServerError("unavailable")
+        return PAGES[cursor]
+
+    get_refunds.calls = calls
+    return get_refunds
+
+
+class TestFlatten:
+    """Test flatten."""
+
+    def test_flatten(self):
+        """Test nested dicts become dotted columns and lists JSON strings."""
+        assert flatten({"a": {"b": {"c": 1}}, "d": [1, 2], "e": None}) == {
+            "a.b.c": 1,
+            "d": "[1, 2]",
+            "e": None,
+        }
+
+
+class TestExport:
+    """Test export."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, tmp_path):
+        """Test NDJSON export keeps nested objects with API field names."""
+        path = tmp_path / "refunds.ndjson"
+
+        rows = await export(make_list_method(), str(path), params={"limit": 2})
+
+        assert rows == 4
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["id"] for line in lines] == ["r1", "r2", "r3", "r4"]
+        assert lines[0]["amount"] == {"value": "1.00", "currency": "RUB"}
+
+    @pytest.mark.asyncio
+    async def test_csv_flattened(self, tmp_path):
+        """Test CSV export has flattened columns, also of later pages."""
+        path = tmp_path / "refunds.csv"
+
+        await export(make_list_method(), str(path), columns=COLUMNS)
+
+        with open(path, newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 4
+        assert rows[2]["amount.value"] == "3.00"
+        assert rows[2]["payment_id"] == "p3"
+        assert [row["description"] for row in rows] == ["", "", "Late", ""]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", ["refunds.csv", "refunds.parquet"])
+    async def test_columns_required(self, tmp_path, name):
+        """Test flattened exports need columns."""
+        with pytest.raises(ValueError, match="columns are required"):
+            await export(make_list_method(), str(tmp_path / name))
+
+    @pytest.mark.asyncio
+    async def test_csv_columns(self, tmp_path):
+        """Test explicit columns select CSV fields."""
+        path = tmp_path / "refunds.csv"
+
+        await export(make_list_method(), str(path), columns=["id", "amount.value"])
+
+        assert path.read_text().splitlines()[:2] == ["id,amount.value", "r1,1.00"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", ["refunds.csv", "refunds.jsonl"])
+    async def test_resume_from_checkpoint(self, tmp_path, name):
+        """Test interrupted export resumes without duplicates."""
+        path = tmp_path / name
+        checkpoint = str(tmp_path / "checkpoint.json")
+        method = make_list_method(fail_on="c2")
+
+        with pytest.raises(ServerError):
+            await export(method, str(path), checkpoint=checkpoint, columns=COLUMNS)
+        with open(checkpoint) as file:
+            assert json.load(file)["cursor"] == "c2"
+
+        rows = await export(method, str(path), checkpoint=checkpoint)
+
+        assert rows == 4
+        assert method.calls == [None, "c1", "c2", "c2"]
+        content = path.read_text()
+        for index in range(1, 5):
+            assert content.count(f"r{index}") == 1
+
+        # A finished export is not repeated
+        assert await export(method, str(path), checkpoint=checkpoint) == 4
+        assert len(method.calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_format(self, tmp_path):
+        """Test unknown format is rejected."""
+        with pytest.raises(ValueError):
+            await export(make_list_method(), str(tmp_path / "refunds.xml"))
+
+    @pytest.mark.asyncio
+    async def test_explicit_file_format(self, tmp_path):
+        """Test file_format overrides detection from the path extension."""
+        path = tmp_path / "refunds.out"
+
+        rows = await export(make_list_method(), str(path), file_format="ndjson")
+
+        assert rows == 4
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["r1", "r2", "r3", "r4"]
+
+    def test_writers_are_abstract(self, tmp_path):
+        """Test writer bases cannot be used without writing rows."""
+        with pytest.raises(TypeError):
+            _Writer(str(tmp_path / "out"), None)
+        with pytest.raises(TypeError):
+            _FileWriter(str(tmp_path / "out"), None)
+
+    @pytest.mark.asyncio
+    async def test_parquet(self, tmp_path):
+        """Test Parquet export writes part files of string columns."""
+        parquet = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "refunds"
+
+        rows = await export(
+            make_list_method(),
+            str(path),
+            file_format="parquet",
+            columns=COLUMNS,
+            batch_size=3,
+        )
+
+        assert rows == 4
+        table = parquet.read_table(str(path))
+        assert table.num_rows == 4
+        assert sorted(p.name for p in path.iterdir()) == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+        ]
@@ -0,0 +1,256 @@
+"""
+Tests for the transactional outbox.
+"""
+
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aioyookassa.contrib.outbox import PAYMENT, Outbox, OutboxDispatcher, OutboxStatus
+from aioyookassa.exceptions import InvalidRequestError, NetworkError
+from aioyookassa.types.params import CreatePaymentParams
+from aioyookassa.types.payment import Payment
+
+PARAMS = CreatePaymentParams(
+    amount={"value": "100.50", "currency": "RUB"}, description="Order 1"
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def client(sample_api_response):
+    client = MagicMock()
+    client.payments.create_payment = AsyncMock(
+        return_value=Payment(**sample_api_response)
+    )
+    return client
+
+
+class TestOutbox:
+    """Test Outbox."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue(self, clock):
+        """Test entries are stored once per operation ID."""
+        outbox = Outbox(clock=clock)
+
+        entry = await outbox.enqueue_payment(PARAMS, operation_id="order-1")
+        again = await outbox.enqueue_payment(
+            {"amount": {"value": "1.00", "currency": "RUB"}}, operation_id="order-1"
+        )
+
+        assert entry.kind == PAYMENT
+        assert entry.status == OutboxStatus.PENDING
+        assert entry.params["amount"] == {"value": "100.50", "currency": "RUB"}
+        assert entry.params["description"] == "Order 1"
+        assert entry.get_params() == PARAMS
+        assert again.id == entry.id
+        assert again.params == entry.params
+        assert (
+            await outbox.enqueue_refund(
+                {"payment_id": "p1", "amount": {"value": "1.00", "currency": "RUB"}}
+            )
+        ).operation_id
+        await outbox.close()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_invalid(self):
+        """Test unknown kinds and invalid parameters are rejected."""
+        outbox = Outbox()
+        with pytest.raises(ValueError, match="Unknown operation kind"):
+            await outbox.enqueue("invoice", {})
+        with pytest.raises(ValueError):
+            await outbox.enqueue_payment({"description": "no amount"})
+
+    @pytest.mark.asyncio
+    async def test_enqueue_in_application_transaction(self):
+        """Test entries are rolled back with the application transaction."""
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE orders (id TEXT)")
+        outbox = Outbox(connection)
+
+        try:
+            with connection:
+                connection.execute("INSERT INTO orders VALUES ('1')")
+                await outbox.enqueue_payment(PARAMS, "order-1", commit=False)
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        assert await outbox.get("order-1") is None
+
+        with connection:
+            connection.execute("INSERT INTO orders VALUES ('2')")
+            await outbox.enqueue_payment(PARAMS, "order-2", commit=False)
+        assert await outbox.get("order-2") is not None
+        await outbox.close()
+        connection.execute("SELECT 1")  # Connection of the application stays open
+
+    @pytest.mark.asyncio
+    async def test_claim_during_application_transaction(self, tmp_path):
+        """Test claims never commit an open transaction of the application."""
+        connection = sqlite3.connect(str(tmp_path / "app.sqlite3"))
+        connection.execute("CREATE TABLE orders (id TEXT)")
+        outbox = Outbox(connection)
+        await outbox.enqueue_payment(PARAMS, "order-1")
+
+        connection.execute("INSERT INTO orders VALUES ('2')")
+        await outbox.enqueue_payment(PARAMS, "order-2", commit=False)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            await outbox.claim(5, lease=60)
+        connection.rollback()
+
+        assert connection.execute("SELECT * FROM orders").fetchall() == []
+        assert await outbox.get("order-2") is None
+        claimed = await outbox.claim(5, lease=60)
+        assert [entry.operation_id for entry in claimed] == ["order-1"]
+        await outbox.mark_succeeded(claimed[0], {"id": "payment_1"})
+        assert connection.in_transaction is False
+        assert (await outbox.get("order-1")).status == OutboxStatus.SUCCEEDED
+        await outbox.close()
+        connection.close()
+
+    @pytest.mark.asyncio
+    async def test_claim_leases_entries(self, clock):
+        """Test claimed entries are not claimed again until the lease expires."""
+        outbox = Outbox(clock=clock)
+        for index in range(3):
+            await outbox.enqueue_payment(PARAMS, f"order-{index}")
+
+        first = await outbox.claim(2, lease=60)
+        assert [entry.operation_id for entry in first] == ["order-0", "order-1"]
+        assert [entry.attempts for entry in first] == [1, 1]
+        assert [e.operation_id for e in await outbox.claim(5, lease=60)] == ["order-2"]
+        assert await outbox.claim(5, lease=60) == []
+
+        clock.now += 60
+        again = await outbox.claim(5, lease=60)
+        assert len(again) == 3
+        assert again[0].attempts == 2
+
+
+class TestOutboxDispatcher:
+    """Test OutboxDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_success(self, client, clock):
+        """Test created objects are stored and reported."""
+        outbox = Outbox(clock=clock)
+        await outbox.enqueue_payment(PARAMS, "order-1")
+        succeeded = []
+        dispatcher = OutboxDispatcher(client, outbox, on_success=succeeded.append)
+
+        assert await dispatcher.dispatch_once() == 1
+
+        client.payments.create_payment.assert_awaited_once_with(
+            PARAMS, operation_id="order-1"
+        )
+        entry = await outbox.get("order-1")
+        assert entry.status == OutboxStatus.SUCCEEDED
+        assert entry.result["id"] == "payment_123456789"
+        assert [e.operation_id for e in succeeded] == ["order-1"]
+        assert await dispatcher.dispatch_once() == 0
+
+    @pytest.mark.asyncio
+    async def test_retryable_errors(self, client, clock):
+        """Test retryable errors are retried with backoff until max_attempts."""
+        outbox = Outbox(clock=clock)
+        await outbox.enqueue_payment(PARAMS, "order-1")
+        client.payments.create_payment.side_effect = NetworkError("down")
+        failed = AsyncMock()
+        dispatcher = OutboxDispatcher(
+            client, outbox, max_attempts=2, backoff=5, on_failure=failed
+        )
+
+        await dispatcher.dispatch_once()
+        entry = await outbox.get("order-1")
+        assert entry.status == OutboxStatus.PENDING
+        assert entry.next_attempt_at == clock.now + 5
+        assert "down" in entry.error
+        assert await dispatcher.dispatch_once() == 0
+
+        clock.now += 5
+        await dispatcher.dispatch_once()
+        entry = await outbox.get("order-1")
+        assert entry.status == OutboxStatus.FAILED
+        assert entry.attempts == 2
+        failed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors(self, client, clock):
+        """Test rejected requests fail at once."""
+        outbox = Outbox(clock=clock)
+        await outbox.enqueue_payment(PARAMS, "order-1")
+        client.payments.create_payment.side_effect = InvalidRequestError("bad")
+        dispatcher = OutboxDispatcher(client, outbox)
+
+        await dispatcher.dispatch_once()
+
+        entry = await outbox.get("order-1")
+        assert entry.status == OutboxStatus.FAILED
+        assert entry.attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_run(self, client):
+        """Test background dispatching with bounded concurrency."""
+        outbox = Outbox()
+        in_flight = []
+        peak = 0
+
+        async def create_payment(params, operation_id):
+            nonlocal peak
+            in_flight.append(operation_id)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(operation_id)
+            return client.payments.create_payment.return_value
+
+        client.payments.create_payment.side_effect = create_payment
+        for index in range(7):
+            await outbox.enqueue_payment(PARAMS, f"order-{index}")
+        done = asyncio.Event()
+        succeeded = []
+
+        def on_success(entry):
+            succeeded.append(entry.operation_id)
+            if len(succeeded) == 7:
+                done.set()
+
+        dispatcher = OutboxDispatcher(
+            client, outbox, concurrency=3, poll_interval=0.01, on_success=on_success
+        )
+        dispatcher.start()
+        try:
+            await asyncio.wait_for(done.wait(), timeout=5)
+        finally:
+            dispatcher.stop()
+
+        assert sorted(succeeded) == [f"order-{index}" for index in range(7)]
+        assert peak == 3
+
+    def test_invalid_settings(self, client):
+        """Test concurrency and attempts must be positive."""
+        with pytest.raises(ValueError):
+            OutboxDispatcher(client, Outbox(), concurrency=0)
+        with pytest.raises(ValueError):
+            OutboxDispatcher(client, Outbox(), max_attempts=0)
+
+    def test_in_memory_application_database(self, client):
+        """Test an in-memory database of the application is not dispatched."""
+        outbox = Outbox(sqlite3.connect(":memory:"))
+
+        with pytest.raises(ValueError, match="in-memory database"):
+            OutboxDispatcher(client, outbox)
@@ -0,0 +1,140 @@
+"""
+Tests for reconciliation.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from aioyookassa.contrib.reconciliation import MismatchType, reconcile
+from aioyookassa.types.refund import Refund
+
+
+def refund(index, value="10.00", status="succeeded"):
+    return Refund(
+        id=f"r{index}",
+        payment_id=f"p{index}",
+        status=status,
+        amount={"value": value, "currency": "RUB"},
+        created_at="2024-01-01T00:00:00Z",
+    )
+
+
+async def aiter(items):
+    for item in items:
+        yield item
+
+
+REMOTE = [
+    refund(1),
+    refund(2, value="9.99"),
+    refund(3, status="canceled"),
+    refund(4),
+]
+EXPECTED = [
+    {"id": "r1", "amount": Decimal("10.00"), "status": "succeeded"},
+    {"id": "r2", "amount": "10", "status": "succeeded"},
+    {"id": "r3", "amount": 10, "status": "succeeded"},
+    {"id": "r5", "amount": "10.00"},
+]
+
+
+async def collect(**kwargs):
+    return sorted(
+        [
+            (mismatch.type, mismatch.key)
+            async for mismatch in reconcile(aiter(REMOTE), aiter(EXPECTED), **kwargs)
+        ]
+    )
+
+
+class TestReconcile:
+    """Test reconcile."""
+
+    RESULT = sorted(
+        [
+            (MismatchType.AMOUNT_DIFFERS, "r2"),
+            (MismatchType.STATUS_DIFFERS, "r3"),
+            (MismatchType.UNEXPECTED, "r4"),
+            (MismatchType.MISSING, "r5"),
+        ]
+    )
+
+    @pytest.mark.asyncio
+    async def test_in_memory(self):
+        """Test mismatches of an in-memory join."""
+        assert await collect() == self.RESULT
+
+    @pytest.mark.asyncio
+    async def test_spill_to_disk(self, tmp_path):
+        """Test partitioned join gives the same mismatches."""
+        result = await collect(
+            max_memory_records=1, partitions=3, spill_dir=str(tmp_path)
+        )
+
+        assert result == self.RESULT
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_mismatch_details_and_metadata_key(self):
+        """Test join by a dotted key and mismatch contents."""
+        remote = [
+            {
+                "id": "p1",
+                "status": "succeeded",
+                "amount": {"value": "5.00", "currency": "RUB"},
+                "metadata": {"order_id": 7},
+            }
+        ]
+        expected = [{"order_id": 7, "amount": "5.50"}]
+
+        mismatches = [
+            mismatch
+            async for mismatch in reconcile(
+                aiter(remote),
+                aiter(expected),
+                key="metadata.order_id",
+                expected_key="order_id",
+            )
+        ]
+
+        assert len(mismatches) == 1
+        mismatch = mismatches[0]
+        assert mismatch.type == MismatchType.AMOUNT_DIFFERS
+        assert mismatch.key == "7"
+        assert mismatch.expected == {"order_id": 7, "amount": "5.50"}
+        assert mismatch.actual == {
+            "id": "p1",
+            "status": "succeeded",
+            "amount": "5.00",
+            "currency": "RUB",
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_memory_records", [100000, 0])
+    async def test_several_objects_per_key(self, tmp_path, max_memory_records):
+        """Test every object sharing the key of a record is compared with it."""
+        remote = [
+            {
+                "id": f"p{index}",
+                "status": status,
+                "amount": {"value": "5.00", "currency": "RUB"},
+                "metadata": {"order_id": "7"},
+            }
+            for index, status in enumerate(["canceled", "succeeded"])
+        ]
+        expected = [{"order_id": "7", "amount": "5.00", "status": "succeeded"}]
+
+        mismatches = [
+            (mismatch.type, mismatch.actual["id"])
+            async for mismatch in reconcile(
+                aiter(remote),
+                aiter(expected),
+                key="metadata.order_id",
+                expected_key="order_id",
+                max_memory_records=max_memory_records,
+                spill_dir=str(tmp_path),
+            )
+        ]
+
+        assert mismatches == [(MismatchType.STATUS_DIFFERS, "p0")]
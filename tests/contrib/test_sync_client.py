@@ -0,0 +1,112 @@
+"""
+Tests for SyncYooKassa.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aioyookassa.contrib import SyncYooKassa
+from aioyookassa.core.transport import InProcessTransport, Response
+from aioyookassa.exceptions import NotFound
+
+REFUND = {
+    "id": "123",
+    "payment_id": "456",
+    "status": "succeeded",
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "amount": {"value": "10.00", "currency": "RUB"},
+}
+
+
+class LoopRecordingTransport(InProcessTransport):
+    """In-process transport remembering loops and threads serving requests."""
+
+    def __init__(self, handler):
+        super().__init__(handler)
+        self.loops = set()
+        self.threads = set()
+
+    async def request(self, method, url, **kwargs):
+        self.loops.add(asyncio.get_running_loop())
+        self.threads.add(threading.current_thread())
+        return await super().request(method, url, **kwargs)
+
+
+def refund_handler(request):
+    if request.url.endswith("/missing"):
+        return Response(404, {}, b'{"code": "not_found", "description": "Nope"}')
+    return Response(200, {}, json.dumps(REFUND).encode())
+
+
+@pytest.fixture
+def transport():
+    return LoopRecordingTransport(refund_handler)
+
+
+@pytest.fixture
+def client(transport):
+    client = SyncYooKassa(api_key="key", shop_id=1, transport=transport)
+    yield client
+    client.close()
+
+
+class TestSyncYooKassa:
+    """Test SyncYooKassa."""
+
+    def test_blocking_api_methods(self, client, transport):
+        """Test API module methods block and return results."""
+        refund = client.refunds.get_refund("123")
+
+        assert refund.id == "123"
+        assert transport.requests[0].url.endswith("/refunds/123")
+        assert client.refunds.get_refund is client.refunds.get_refund
+
+    def test_with_priority(self, client, transport):
+        """Test module copies with another priority stay blocking."""
+        bulk_refunds = client.refunds.with_priority("bulk")
+
+        assert bulk_refunds.get_refund("123").id == "123"
+        assert bulk_refunds._api._priority == "bulk"
+        assert client.refunds._api._priority is None
+
+    def test_errors_are_propagated(self, client):
+        """Test API errors are raised in the calling thread."""
+        with pytest.raises(NotFound):
+            client.refunds.get_refund("missing")
+
+    def test_calls_share_one_loop(self, client, transport):
+        """Test calls from many threads run on the same background loop."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            refunds = list(
+                executor.map(lambda _: client.refunds.get_refund("123"), range(32))
+            )
+
+        assert len(refunds) == 32
+        assert transport.loops == {client.loop}
+        assert len(transport.threads) == 1
+        assert threading.current_thread() not in transport.threads
+
+    def test_call_and_unknown_attribute(self, client):
+        """Test running custom coroutines and missing attributes."""
+
+        async def get_shop_id():
+            return client.client.shop_id
+
+        assert client.call(get_shop_id) == "1"
+        with pytest.raises(AttributeError):
+            client.unknown
+
+    def test_close(self, transport):
+        """Test close stops the loop thread and rejects new calls."""
+        with SyncYooKassa(api_key="key", shop_id=1, transport=transport) as client:
+            client.refunds.get_refund("123")
+
+        assert not client._thread.is_alive()
+        assert client.loop.is_closed()
+        with pytest.raises(RuntimeError):
+            client.refunds.get_refund("123")
+        client.close()
@@ -2,13 +2,19 @@
 Tests for BaseAPIClient.
 """
 
+import asyncio
+import gc
+import os
+import warnings
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from aiohttp import ClientError
+from aiohttp import ClientError, TCPConnector
 
 from aioyookassa.core.abc.client import BaseAPIClient
-from aioyookassa.core.methods.base import APIMethod
+from aioyookassa.core.methods.base import APIMethod, BaseAPIMethod, PathTemplate
+from aioyookassa.core.methods.payments import GetPayment
 from aioyookassa.exceptions import APIError
 
 
@@ -166,6 +172,128 @@ class TestBaseAPIClient:
         # Session should remain as is since it was already closed
         assert client._session is mock_session
 
+    def test_get_session_rebuilt_in_new_loop(self):
+        """Test session is rebuilt when the client is used from another loop."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        async def get_session():
+            return client._get_session(), client._connector
+
+        first_session, first_connector = asyncio.run(get_session())
+        second_session, second_connector = asyncio.run(get_session())
+
+        assert second_session is not first_session
+        assert second_connector is not first_connector
+        asyncio.run(client.close())
+
+    def test_sessions_of_finished_loops_are_closed(self):
+        """Test sessions are closed when clients are used with asyncio.run."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+        sessions = []
+
+        async def get_session():
+            sessions.append(client._get_session())
+
+        # Objects left by other tests must not be collected below
+        gc.collect()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            asyncio.run(get_session())
+            asyncio.run(get_session())
+            asyncio.run(client.close())
+            del sessions[:]
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    def test_sessions_of_closed_loops_are_closed_by_close(self):
+        """Test close() closes sessions of loops closed without shutdown."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        async def get_session():
+            return client._get_session()
+
+        loop = asyncio.new_event_loop()
+        old_session = loop.run_until_complete(get_session())
+        loop.close()
+        asyncio.run(get_session())
+        assert not old_session.closed
+
+        asyncio.run(client.close())
+
+        assert old_session.closed
+        assert client._stale_sessions == []
+
+    def test_passed_connector_is_not_reused_in_another_loop(self):
+        """Test a connector bound to another loop is rejected."""
+
+        async def create_client():
+            return BaseAPIClient(
+                api_key="test_api_key", shop_id=123456, connector=TCPConnector()
+            )
+
+        async def get_session():
+            return client._get_session()
+
+        loop = asyncio.new_event_loop()
+        client = loop.run_until_complete(create_client())
+        loop.run_until_complete(get_session())
+
+        with pytest.raises(RuntimeError, match="another event loop"):
+            asyncio.run(get_session())
+
+        loop.run_until_complete(client.close())
+        loop.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_session_closed_in_its_running_loop(self):
+        """Test stale session is closed in its own loop if it is still running."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+        old_session = MagicMock(closed=False)
+        old_loop = MagicMock()
+        old_loop.is_running.return_value = True
+        old_loop.is_closed.return_value = False
+        client._session = old_session
+        client._session_loop = old_loop
+        client._session_pid = os.getpid()
+
+        with patch(
+            "aioyookassa.core.abc.client.ClientSession"
+        ) as mock_session_class, patch(
+            "aioyookassa.core.abc.client.TCPConnector"
+        ), patch(
+            "asyncio.run_coroutine_threadsafe"
+        ) as mock_threadsafe:
+            session = client._get_session()
+
+        assert session is mock_session_class.return_value
+        assert client._session_loop is asyncio.get_running_loop()
+        mock_threadsafe.assert_called_once_with(
+            old_session.close.return_value, old_loop
+        )
+
+    @pytest.mark.asyncio
+    async def test_session_inherited_after_fork_is_dropped(self):
+        """Test session of the parent process is replaced, not closed."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+        old_session = AsyncMock()
+        old_session.closed = False
+        client._session = old_session
+        client._session_loop = asyncio.get_running_loop()
+        client._session_pid = os.getpid() + 1
+
+        with patch(
+            "aioyookassa.core.abc.client.ClientSession"
+        ) as mock_session_class, patch("aioyookassa.core.abc.client.TCPConnector"):
+            assert client._get_session() is mock_session_class.return_value
+
+        assert client._session_pid == os.getpid()
+        old_session.close.assert_not_called()
+
+        client._session_pid = os.getpid() + 1
+        await client.close()
+        assert client._session is None
+
     def test_get_request_url(self):
         """Test _get_request_url method."""
         client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
@@ -174,6 +302,34 @@ class TestBaseAPIClient:
 
         assert url == "https://api.yookassa.ru/v3/test"
 
+    def test_get_request_url_of_built_methods(self):
+        """Test _get_request_url joins built paths through the template."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+        client.BASE_URL = "https://example.test/v3"
+
+        method = GetPayment.build(payment_id="a/b")
+        with patch.object(
+            PathTemplate, "format", autospec=True, side_effect=PathTemplate.format
+        ) as format_mock:
+            url = client._get_request_url(method)
+
+        assert url == "https://example.test/v3/payments/a%2Fb"
+        format_mock.assert_called_once_with(
+            GetPayment._template, {"payment_id": "a/b"}, "https://example.test/v3"
+        )
+        assert (
+            client._get_request_url(BaseAPIMethod(path="/custom"))
+            == "https://example.test/v3/custom"
+        )
+
+        class TemplatedMethod(BaseAPIMethod):
+            path = "/test/{test_id}"
+
+        assert (
+            client._get_request_url(TemplatedMethod.build())
+            == "https://example.test/v3/test/{test_id}"
+        )
+
     def test_remove_none_values_with_none_values(self):
         """Test _remove_none_values method with None values."""
         client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
@@ -236,6 +392,16 @@ class TestBaseAPIClient:
         assert "key3" in data
         assert data["key3"] is None
 
+    def test_remove_none_values_with_decimals(self):
+        """Test _remove_none_values converts Decimal amounts to strings."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        data = {"amount": {"value": Decimal("100.50")}, "values": [Decimal("1.00")]}
+
+        result = client._remove_none_values(data)
+
+        assert result == {"amount": {"value": "100.50"}, "values": ["1.00"]}
+
     def test_remove_none_values_with_empty_dict(self):
         """Test _remove_none_values method with empty dictionary."""
         client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
@@ -413,3 +579,186 @@ class TestBaseAPIClient:
             assert ctx is client
             assert ctx.api_key == "test_api_key"
             assert ctx.shop_id == "123456"
+
+    @pytest.mark.asyncio
+    async def test_send_request_maps_status_to_exception(self):
+        """Test _send_request raises typed errors for HTTP statuses."""
+        from aioyookassa.exceptions import ServerError, TooManyRequests
+
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        mock_session = AsyncMock()
+        mock_response = self._create_mock_response(
+            status=429,
+            json_data={"type": "error", "id": "req-429", "code": "too_many_requests"},
+        )
+        mock_response.headers = {"Retry-After": "5"}
+        mock_session.request = AsyncMock(return_value=mock_response)
+
+        with patch.object(client, "_get_session", return_value=mock_session):
+            with pytest.raises(TooManyRequests) as exc_info:
+                await client._send_request(TestAPIMethod)
+
+        assert exc_info.value.status == 429
+        assert exc_info.value.retry_after == 5
+        assert exc_info.value.request_id == "req-429"
+
+        mock_response = self._create_mock_response(status=503, text_data="Down")
+        mock_response.json.side_effect = ValueError("Not JSON")
+        mock_session.request = AsyncMock(return_value=mock_response)
+
+        with patch.object(client, "_get_session", return_value=mock_session):
+            with pytest.raises(ServerError) as exc_info:
+                await client._send_request(TestAPIMethod)
+
+        assert exc_info.value.status == 503
+        assert "HTTP 503: Down" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_send_request_timeout_and_network_errors_are_typed(self):
+        """Test timeouts and connection failures raise typed errors."""
+        import asyncio
+
+        from aioyookassa.exceptions import NetworkError, RequestTimeout
+
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+        mock_session = AsyncMock()
+
+        mock_session.request.side_effect = asyncio.TimeoutError()
+        with patch.object(client, "_get_session", return_value=mock_session):
+            with pytest.raises(RequestTimeout):
+                await client._send_request(TestAPIMethod)
+
+        mock_session.request.side_effect = ClientError("Connection reset")
+        with patch.object(client, "_get_session", return_value=mock_session):
+            with pytest.raises(NetworkError):
+                await client._send_request(TestAPIMethod)
+
+    def test_resolve_timeout_defaults_to_client_timeout(self):
+        """Test client timeout is used when no per-call options are given."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        assert client._resolve_timeout(None, None) is client._timeout
+
+    def test_resolve_timeout_per_call(self):
+        """Test per-call timeout overrides total timeout."""
+        from aiohttp import ClientTimeout
+
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        resolved = client._resolve_timeout(3, None)
+        assert resolved.total == 3
+        assert resolved.connect == client._timeout.connect
+
+        custom = ClientTimeout(total=60)
+        assert client._resolve_timeout(custom, None) is custom
+
+    def test_resolve_timeout_with_deadline(self):
+        """Test deadline caps the effective timeout."""
+        import time
+
+        from aioyookassa.exceptions import RequestTimeout
+
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        resolved = client._resolve_timeout(60, time.monotonic() + 2)
+        assert 0 < resolved.total <= 2
+
+        resolved = client._resolve_timeout(1, time.monotonic() + 30)
+        assert resolved.total == 1
+
+        with pytest.raises(RequestTimeout):
+            client._resolve_timeout(None, time.monotonic() - 1)
+
+    @pytest.mark.asyncio
+    async def test_send_request_uses_per_call_timeout(self):
+        """Test _send_request passes per-call timeout to aiohttp."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        mock_session = AsyncMock()
+        mock_response = self._create_mock_response(
+            status=200, json_data={"success": True}
+        )
+        mock_session.request = AsyncMock(return_value=mock_response)
+
+        with patch.object(client, "_get_session", return_value=mock_session):
+            await client._send_request(TestAPIMethod, timeout=3)
+
+        assert mock_session.request.call_args[1]["timeout"].total == 3
+
+    @pytest.mark.asyncio
+    async def test_warmup_opens_concurrent_connections(self):
+        """Test warmup sends concurrent unauthenticated pings."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        mock_session = AsyncMock()
+        mock_response = self._create_mock_response(status=401)
+        mock_session.request = AsyncMock(
+            side_effect=[mock_response, mock_response, ClientError("refused")]
+        )
+
+        with patch.object(client, "_get_session", return_value=mock_session):
+            opened = await client.warmup(3)
+
+        assert opened == 2
+        assert mock_session.request.call_count == 3
+        call_args = mock_session.request.call_args
+        assert call_args[0] == ("HEAD", client.BASE_URL)
+        assert call_args[1]["auth"] is None
+
+    @pytest.mark.asyncio
+    async def test_warmup_starts_keepalive_refresh(self):
+        """Test keep-alive refresh repeats warmup until close."""
+        import asyncio
+
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        with patch.object(
+            client, "_open_connections", AsyncMock(return_value=2)
+        ) as mock_open:
+            assert await client.warmup(2, keepalive_interval=0.01) == 2
+            task = client._keepalive_task
+            await asyncio.sleep(0.05)
+            await client.close()
+            await asyncio.sleep(0)
+
+        assert mock_open.await_count >= 2
+        assert task.cancelled()
+        assert client._keepalive_task is None
+
+    @pytest.mark.asyncio
+    async def test_keepalive_refresh_survives_errors(self):
+        """Test unexpected refresh errors are logged and do not stop refresh."""
+        logger = MagicMock()
+        client = BaseAPIClient(
+            api_key="test_api_key",
+            shop_id=123456,
+            enable_logging=True,
+            logger=logger,
+        )
+        # Warmup succeeds, every refresh fails
+        mock_open = AsyncMock(return_value=2)
+
+        with patch.object(client, "_open_connections", mock_open):
+            assert await client.warmup(2, keepalive_interval=0) == 2
+            task = client._keepalive_task
+            mock_open.side_effect = RuntimeError("boom")
+            while mock_open.await_count < 3 and not task.done():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            assert not task.done()
+            assert logger.warning.call_count >= 2
+            assert logger.warning.call_args.kwargs["exc_info"] is True
+            await client.close()
+            await asyncio.sleep(0)
+
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_warmup_rejects_invalid_connection_count(self):
+        """Test warmup requires at least one connection."""
+        client = BaseAPIClient(api_key="test_api_key", shop_id=123456)
+
+        with pytest.raises(ValueError):
+            await client.warmup(0)
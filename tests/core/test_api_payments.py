@@ -211,6 +211,33 @@ class TestPaymentsAPI:
         # Should be called with GetPayment method instance
         assert hasattr(call_args[0][0], "path")
 
+    @pytest.mark.asyncio
+    async def test_get_payment_passes_timeout_and_deadline(
+        self, payments_api, mock_client, sample_payment_data
+    ):
+        """Test per-call timeout and deadline are passed to the client."""
+        mock_client._send_request.return_value = sample_payment_data
+
+        await payments_api.get_payment("payment_123456789", timeout=3, deadline=100.0)
+
+        call_kwargs = mock_client._send_request.call_args[1]
+        assert call_kwargs["timeout"] == 3
+        assert call_kwargs["deadline"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_get_payments_timeout_is_not_a_filter(
+        self, payments_api, mock_client, sample_payment_list_data
+    ):
+        """Test per-call timeout is not sent as a query parameter."""
+        mock_client._send_request.return_value = sample_payment_list_data
+
+        await payments_api.get_payments(limit=10, timeout=60)
+
+        call_kwargs = mock_client._send_request.call_args[1]
+        assert call_kwargs["timeout"] == 60
+        assert "timeout" not in call_kwargs["params"]
+        assert call_kwargs["params"]["limit"] == 10
+
     @pytest.mark.asyncio
     async def test_capture_payment_minimal(
         self, payments_api, mock_client, sample_payment_data
@@ -0,0 +1,176 @@
+"""
+Tests for CircuitBreaker.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.circuit_breaker import CircuitBreaker, CircuitState
+from aioyookassa.core.methods.payments import GetPayment
+from aioyookassa.exceptions import CircuitOpenError, NotFound, ServerError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state machine."""
+
+    def test_get_family(self):
+        """Test endpoint family extraction."""
+        assert CircuitBreaker.get_family("/payments/123/capture") == "/payments"
+        assert CircuitBreaker.get_family("/refunds") == "/refunds"
+        assert CircuitBreaker.get_family("/payments/{payment_id}") == "/payments"
+
+    def test_opens_after_threshold(self):
+        """Test circuit opens after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.before_request("/payments")
+        breaker.record_failure("/payments")
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
+
+        breaker.record_failure("/payments")
+        assert breaker.get_state("/payments") == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request("/payments")
+        assert exc_info.value.family == "/payments"
+        assert exc_info.value.retry_after == 30.0
+
+        # Other families are not affected
+        breaker.before_request("/refunds")
+
+    def test_success_resets_failures(self):
+        """Test success resets consecutive failure counter."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure("/payments")
+        breaker.record_success("/payments")
+        breaker.record_failure("/payments")
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
+
+    def test_half_open_probe_closes_circuit(self):
+        """Test a successful probe closes the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure("/payments")
+
+        clock.now = 10
+        assert breaker.get_state("/payments") == CircuitState.HALF_OPEN
+        breaker.before_request("/payments")
+        # Only one probe is allowed at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("/payments")
+
+        breaker.record_success("/payments")
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
+        breaker.before_request("/payments")
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe opens the circuit again."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+        for _ in range(3):
+            breaker.record_failure("/payments")
+
+        clock.now = 15
+        breaker.before_request("/payments")
+        breaker.record_failure("/payments")
+        assert breaker.get_state("/payments") == CircuitState.OPEN
+
+        clock.now = 20
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("/payments")
+
+    def test_release_frees_probe_slot(self):
+        """Test released probes can be taken again."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, clock=clock)
+        breaker.record_failure("/payments")
+        clock.now = 1
+
+        breaker.before_request("/payments")
+        breaker.release("/payments")
+        breaker.before_request("/payments")
+
+    def test_slow_calls_count_as_failures(self):
+        """Test slow successful calls count as failures."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, slow_call_threshold=2.0, clock=FakeClock()
+        )
+        breaker.record_success("/payments", duration=1.0)
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
+        breaker.record_success("/payments", duration=3.0)
+        assert breaker.get_state("/payments") == CircuitState.OPEN
+
+    def test_record_error_classification(self):
+        """Test only retryable errors count as failures."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+
+        breaker.record_error("/payments", NotFound("not found"))
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
+
+        breaker.record_error("/payments", ServerError("server error"))
+        assert breaker.get_state("/payments") == CircuitState.OPEN
+
+        breaker.reset()
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
+
+    def test_invalid_configuration(self):
+        """Test invalid thresholds are rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(half_open_max_calls=0)
+
+
+class TestClientCircuitBreaker:
+    """Test circuit breaker integration in BaseAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_send_request_fails_fast_when_open(self):
+        """Test requests fail fast without touching the network."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        client = BaseAPIClient(
+            api_key="test_api_key", shop_id=123456, circuit_breaker=breaker
+        )
+
+        with patch.object(
+            client,
+            "_execute_request",
+            AsyncMock(side_effect=ServerError("HTTP 500")),
+        ) as mock_execute:
+            with pytest.raises(ServerError):
+                await client._send_request(GetPayment.build("123"))
+            with pytest.raises(CircuitOpenError):
+                await client._send_request(GetPayment.build("456"))
+
+        assert mock_execute.await_count == 1
+        assert breaker.get_state("/payments") == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_send_request_records_success(self):
+        """Test successful requests keep the circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure("/payments")
+        client = BaseAPIClient(
+            api_key="test_api_key", shop_id=123456, circuit_breaker=breaker
+        )
+
+        mock_execute = AsyncMock(return_value={"id": "123"})
+        with patch.object(client, "_execute_request", mock_execute):
+            result = await client._send_request(GetPayment.build("123"))
+
+        assert result == {"id": "123"}
+        assert mock_execute.call_args[0][4] is client._timeout
+        breaker.record_failure("/payments")
+        assert breaker.get_state("/payments") == CircuitState.CLOSED
@@ -172,6 +172,16 @@ class TestYooKassa:
         assert client.refunds._client is client
         assert client.receipts._client is client
 
+    def test_yookassa_api_modules_are_lazy(self):
+        """Test API modules are created on first access and then reused."""
+        client = YooKassa(api_key="test_api_key", shop_id=123456)
+
+        assert "refunds" not in vars(client)
+        refunds = client.refunds
+        assert vars(client)["refunds"] is refunds
+        assert client.refunds is refunds
+        assert YooKassa(api_key="test_api_key", shop_id=1).refunds is not refunds
+
     @pytest.mark.asyncio
     async def test_get_me(self):
         """Test get_me method."""
@@ -207,7 +217,9 @@ class TestYooKassa:
         # Verify the request was made correctly
         from aioyookassa.core.methods.me import GetMe
 
-        client._send_request.assert_called_once_with(GetMe, params={})
+        client._send_request.assert_called_once_with(
+            GetMe, params={}, timeout=None, deadline=None, priority=None
+        )
 
     @pytest.mark.asyncio
     async def test_get_me_with_on_behalf_of(self):
@@ -234,5 +246,9 @@ class TestYooKassa:
         from aioyookassa.core.methods.me import GetMe
 
         client._send_request.assert_called_once_with(
-            GetMe, params={"on_behalf_of": "789012"}
+            GetMe,
+            params={"on_behalf_of": "789012"},
+            timeout=None,
+            deadline=None,
+            priority=None,
         )
@@ -0,0 +1,170 @@
+"""
+Tests for HedgingPolicy and hedged requests.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.hedging import HedgingPolicy
+from aioyookassa.core.methods.payments import CreatePayment, GetPayment, GetPayments
+from aioyookassa.core.methods.refunds import GetRefund
+from aioyookassa.exceptions import NetworkError, NotFound
+
+
+class TestHedgingPolicy:
+    """Test HedgingPolicy."""
+
+    def test_is_hedgeable(self):
+        """Test only configured GET methods are hedgeable."""
+        policy = HedgingPolicy()
+
+        assert policy.is_hedgeable(GetPayment.build("123")) is True
+        assert policy.is_hedgeable(GetRefund.build("123")) is True
+        assert policy.is_hedgeable(GetPayments()) is False
+        assert policy.is_hedgeable(CreatePayment()) is False
+
+    def test_fixed_delay(self):
+        """Test fixed delay is used as is."""
+        assert HedgingPolicy(delay=0.2).get_delay() == 0.2
+
+    def test_delay_from_percentile(self):
+        """Test delay is derived from the latency percentile."""
+        policy = HedgingPolicy(percentile=0.9, min_samples=10)
+        for i in range(1, 10):
+            policy.record_latency(i / 10)
+        assert policy.get_delay() is None
+
+        policy.record_latency(1.0)
+        assert policy.get_delay() == pytest.approx(0.9)
+
+    def test_budget(self):
+        """Test hedges are limited by the token budget."""
+        policy = HedgingPolicy(max_hedge_ratio=0.5, burst=1)
+
+        assert policy.try_acquire() is True
+        assert policy.try_acquire() is False
+        policy.on_request()
+        assert policy.try_acquire() is False
+        policy.on_request()
+        assert policy.try_acquire() is True
+
+    def test_invalid_configuration(self):
+        """Test invalid parameters are rejected."""
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=1.5)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_hedge_ratio=2)
+
+
+class TestHedgedRequests:
+    """Test hedged requests in BaseAPIClient."""
+
+    @staticmethod
+    def _client(policy):
+        return BaseAPIClient(api_key="test_api_key", shop_id=123456, hedging=policy)
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged(self):
+        """Test a duplicate is sent and the first response wins."""
+        client = self._client(HedgingPolicy(delay=0.01))
+        calls = []
+        cancelled = []
+
+        async def execute(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return {"id": "slow"}
+            return {"id": "fast"}
+
+        with patch.object(client, "_execute_request", side_effect=execute):
+            result = await client._send_request(GetPayment.build("123"))
+            await asyncio.sleep(0)
+
+        assert result == {"id": "fast"}
+        assert len(calls) == 2
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_fast_request_is_not_hedged(self):
+        """Test requests faster than the delay are sent once."""
+        client = self._client(HedgingPolicy(delay=1))
+        calls = []
+
+        async def execute(*args):
+            calls.append(args)
+            return {"id": "123"}
+
+        with patch.object(client, "_execute_request", side_effect=execute):
+            result = await client._send_request(GetPayment.build("123"))
+
+        assert result == {"id": "123"}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_request_falls_back_to_other(self):
+        """Test a failed request does not hide the other response."""
+        client = self._client(HedgingPolicy(delay=0.01))
+        calls = []
+
+        async def execute(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise NetworkError("Network error: reset")
+            await asyncio.sleep(0.1)
+            return {"id": "123"}
+
+        with patch.object(client, "_execute_request", side_effect=execute):
+            result = await client._send_request(GetPayment.build("123"))
+
+        assert result == {"id": "123"}
+
+    @pytest.mark.asyncio
+    async def test_error_raised_when_all_fail(self):
+        """Test error is raised when every request fails."""
+        client = self._client(HedgingPolicy(delay=0.01))
+
+        async def execute(*args):
+            await asyncio.sleep(0.02)
+            raise NotFound("not found")
+
+        with patch.object(client, "_execute_request", side_effect=execute):
+            with pytest.raises(NotFound):
+                await client._send_request(GetPayment.build("123"))
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_disables_hedging(self):
+        """Test no hedge is sent without budget."""
+        client = self._client(HedgingPolicy(delay=0.01, burst=0))
+        calls = []
+
+        async def execute(*args):
+            calls.append(args)
+            await asyncio.sleep(0.03)
+            return {"id": "123"}
+
+        with patch.object(client, "_execute_request", side_effect=execute):
+            await client._send_request(GetPayment.build("123"))
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_non_hedgeable_method_bypasses_policy(self):
+        """Test non-hedgeable methods are sent directly."""
+        policy = HedgingPolicy(delay=0)
+        client = self._client(policy)
+
+        with patch.object(
+            client, "_execute_hedged", side_effect=AssertionError
+        ), patch.object(client, "_execute_request", return_value={}) as mock_execute:
+            await client._send_request(GetPayments)
+
+        mock_execute.assert_called_once()
@@ -0,0 +1,255 @@
+"""
+Tests for idempotency keys and stored results.
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.api.payments import PaymentsAPI
+from aioyookassa.core.idempotency import (
+    IDEMPOTENCE_KEY_TTL,
+    IdempotencyManager,
+    MemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+)
+from aioyookassa.core.methods.payments import CapturePayment, CreatePayment
+from aioyookassa.exceptions import NetworkError
+from aioyookassa.types.params import CreatePaymentParams
+from aioyookassa.types.payment import Payment
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    if request.param == "memory":
+        return MemoryIdempotencyStore()
+    return SQLiteIdempotencyStore()
+
+
+class TestIdempotencyStore:
+    """Test memory and SQLite stores."""
+
+    @pytest.mark.asyncio
+    async def test_set_get_purge(self, store):
+        """Test results are stored by key and purged by age."""
+        assert await store.get("a") is None
+
+        await store.set("a", {"id": "1", "amount": {"value": "1.00"}}, 10.0)
+        await store.set("b", {"id": "2"}, 20.0)
+
+        assert await store.get("a") == (10.0, {"id": "1", "amount": {"value": "1.00"}})
+        assert await store.purge(15.0) == 1
+        assert await store.get("a") is None
+        assert await store.get("b") == (20.0, {"id": "2"})
+        await store.close()
+
+
+class TestIdempotencyManager:
+    """Test key derivation and result caching."""
+
+    def test_keys_from_operation_ids(self):
+        """Test keys are stable UUIDs scoped by shop, endpoint and operation."""
+        manager = IdempotencyManager()
+        create = CreatePayment.shared()
+
+        key = manager.get_key("1", create, operation_id="order-1")
+
+        uuid.UUID(key)
+        assert key == IdempotencyManager().get_key("1", create, operation_id="order-1")
+        assert key != manager.get_key("1", create, operation_id="order-2")
+        assert key != manager.get_key("2", create, operation_id="order-1")
+        assert key != manager.get_key(
+            "1", CapturePayment.build(payment_id="p"), operation_id="order-1"
+        )
+
+    def test_keys_from_params(self):
+        """Test keys are derived from bodies only when enabled."""
+        create = CreatePayment.shared()
+        body = {"amount": {"value": Decimal("1.00"), "currency": "RUB"}, "x": None}
+
+        assert IdempotencyManager().get_key("1", create, body) is None
+
+        manager = IdempotencyManager(keys_from_params=True)
+        key = manager.get_key("1", create, body)
+        assert key == manager.get_key(
+            "1", create, {"amount": {"currency": "RUB", "value": "1.00"}}
+        )
+        assert key != manager.get_key("1", create, {"amount": {"value": "2.00"}})
+
+    @pytest.mark.asyncio
+    async def test_results_are_reused_within_ttl(self, store):
+        """Test repeated operations are answered from the store until expiry."""
+        clock = _Clock()
+        manager = IdempotencyManager(store, clock=clock)
+        send = AsyncMock(return_value={"id": "payment_1"})
+
+        assert await manager.execute("key", send) == {"id": "payment_1"}
+        clock.now += IDEMPOTENCE_KEY_TTL - 1
+        assert await manager.execute("key", send) == {"id": "payment_1"}
+        send.assert_awaited_once_with("key")
+
+        clock.now += 1
+        await manager.execute("key", send)
+        assert send.await_count == 2
+        assert await manager.purge() == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_stored(self):
+        """Test failed requests are sent again."""
+        manager = IdempotencyManager()
+        send = AsyncMock(side_effect=[NetworkError("down"), {"id": "payment_1"}])
+
+        with pytest.raises(NetworkError):
+            await manager.execute("key", send)
+        assert await manager.execute("key", send) == {"id": "payment_1"}
+
+    @pytest.mark.asyncio
+    async def test_store_errors_return_result(self, caplog):
+        """Test results are returned to all callers when storing them fails."""
+        store = MemoryIdempotencyStore()
+        store.set = AsyncMock(side_effect=OSError("disk full"))
+        manager = IdempotencyManager(store)
+        release = asyncio.Event()
+
+        async def send(key):
+            await release.wait()
+            return {"id": "payment_1"}
+
+        tasks = [asyncio.ensure_future(manager.execute("key", send)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [{"id": "payment_1"}] * 2
+        assert "disk full" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_concurrent_operations_share_request(self):
+        """Test concurrent requests with one key send one request."""
+        manager = IdempotencyManager()
+        release = asyncio.Event()
+        calls = []
+
+        async def send(key):
+            calls.append(key)
+            await release.wait()
+            return {"id": "payment_1"}
+
+        tasks = [asyncio.ensure_future(manager.execute("key", send)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [{"id": "payment_1"}] * 3
+        assert calls == ["key"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_sender_does_not_cancel_waiters(self):
+        """Test a waiter sends the request again when the sender is cancelled."""
+        manager = IdempotencyManager()
+        release = asyncio.Event()
+        calls = []
+
+        async def send(key):
+            calls.append(key)
+            await release.wait()
+            return {"id": "payment_1"}
+
+        tasks = [asyncio.ensure_future(manager.execute("key", send)) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks[1:]) == [{"id": "payment_1"}] * 2
+        assert tasks[0].cancelled()
+        assert calls == ["key", "key"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_sender(self):
+        """Test cancelling a waiting caller keeps the shared request."""
+        manager = IdempotencyManager()
+        release = asyncio.Event()
+
+        async def send(key):
+            await release.wait()
+            return {"id": "payment_1"}
+
+        tasks = [asyncio.ensure_future(manager.execute("key", send)) for _ in range(2)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await tasks[0] == {"id": "payment_1"}
+        assert tasks[1].cancelled()
+
+    def test_invalid_ttl(self):
+        """Test ttl must be positive."""
+        with pytest.raises(ValueError):
+            IdempotencyManager(ttl=0)
+
+
+class TestIdempotentAPI:
+    """Test idempotence keys of API requests."""
+
+    @staticmethod
+    def _create_api(manager=None):
+        client = MagicMock(spec=BaseAPIClient)
+        client.shop_id = "123"
+        client._idempotency = manager
+        client._send_request = AsyncMock()
+        return PaymentsAPI(client), client
+
+    @pytest.mark.asyncio
+    async def test_random_keys_by_default(self, sample_api_response):
+        """Test every request gets a new key without an operation ID."""
+        api, client = self._create_api()
+        client._send_request.return_value = sample_api_response
+        params = CreatePaymentParams(amount={"value": "100.50", "currency": "RUB"})
+
+        await api.create_payment(params)
+        await api.create_payment(params)
+
+        keys = [
+            call.kwargs["headers"]["Idempotence-Key"]
+            for call in client._send_request.await_args_list
+        ]
+        assert len(set(keys)) == 2
+
+    @pytest.mark.asyncio
+    async def test_operation_id_without_manager(self, sample_api_response):
+        """Test operation IDs give stable keys without a manager."""
+        api, client = self._create_api()
+        client._send_request.return_value = sample_api_response
+
+        await api.capture_payment("payment_1", operation_id="capture-1")
+        await api.capture_payment("payment_1", operation_id="capture-1")
+
+        first, second = client._send_request.await_args_list
+        assert first.kwargs["headers"] == second.kwargs["headers"]
+        assert client._send_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_operation_uses_stored_result(self, sample_api_response):
+        """Test repeated operations do not send requests with a manager."""
+        api, client = self._create_api(IdempotencyManager())
+        client._send_request.return_value = sample_api_response
+        params = CreatePaymentParams(amount={"value": "100.50", "currency": "RUB"})
+
+        first = await api.create_payment(params, operation_id="order-1")
+        second = await api.create_payment(params, operation_id="order-1")
+
+        assert isinstance(second, Payment)
+        assert first == second
+        client._send_request.assert_awaited_once()
@@ -4,7 +4,7 @@ Tests for base API methods.
 
 import pytest
 
-from aioyookassa.core.methods.base import APIMethod, BaseAPIMethod
+from aioyookassa.core.methods.base import APIMethod, BaseAPIMethod, PathTemplate
 
 
 class TestBaseAPIMethod:
@@ -61,6 +61,90 @@ class TestBaseAPIMethod:
         assert "Missing required parameter" in str(exc_info.value)
         assert "invalid" in str(exc_info.value)
 
+    def test_base_api_method_build_escapes_values(self):
+        """Test BaseAPIMethod build escapes parameter values."""
+
+        class TestMethod(BaseAPIMethod):
+            path = "/test/{test_id}/capture"
+
+        method = TestMethod.build(test_id="../me?x=1")
+        assert method.path == "/test/..%2Fme%3Fx%3D1/capture"
+
+    @pytest.mark.parametrize("value", ["", "  ", ".", ".."])
+    def test_base_api_method_build_invalid_value(self, value):
+        """Test BaseAPIMethod build rejects values that change the path."""
+
+        class TestMethod(BaseAPIMethod):
+            path = "/test/{test_id}"
+
+        with pytest.raises(ValueError, match="Invalid value"):
+            TestMethod.build(test_id=value)
+
+    def test_base_api_method_build_shares_static_path(self):
+        """Test methods without parameters reuse one instance."""
+
+        class TestMethod(BaseAPIMethod):
+            path = "/test"
+
+        method = TestMethod.build()
+        assert method is TestMethod.build() is TestMethod.shared()
+        assert method.path == "/test"
+
+    def test_base_api_method_build_without_kwargs_keeps_template(self):
+        """Test build without kwargs on a templated path keeps the class path."""
+
+        class TestMethod(BaseAPIMethod):
+            path = "/test/{test_id}"
+
+        method = TestMethod.build()
+        assert method is TestMethod.shared()
+        assert method.path == "/test/{test_id}"
+
+    def test_shared_api_method_is_immutable(self):
+        """Test the shared method instance cannot be changed."""
+
+        class TestMethod(BaseAPIMethod):
+            path = "/test"
+
+        method = TestMethod.shared()
+        with pytest.raises(AttributeError, match="immutable"):
+            method.path = "/other"
+        with pytest.raises(AttributeError, match="immutable"):
+            del method.http_method
+        assert TestMethod.shared().path == "/test"
+
+    def test_api_method_subclass_can_set_attributes(self):
+        """Test other method instances can still be changed."""
+
+        class TestMethod(BaseAPIMethod):
+            path = "/test/{test_id}"
+
+            def __init__(self, path=None, version=1):
+                super().__init__(path)
+                self.version = version
+
+        method = TestMethod(version=2)
+        assert method.version == 2
+
+        built = TestMethod.build(test_id="1")
+        built.path = "/other"
+        assert built.path == "/other"
+        assert built._params is None
+
+    def test_path_template(self):
+        """Test compiled path templates."""
+        template = PathTemplate("/a/{first}/b/{second}")
+        assert template.names == ("first", "second")
+        assert template.format({"first": 1, "second": "x", "extra": "y"}) == (
+            "/a/1/b/x"
+        )
+        assert PathTemplate("/a/{{b}}").format({}) == "/a/{b}"
+
+    def test_path_template_invalid_placeholder(self):
+        """Test placeholders with format specs are rejected."""
+        with pytest.raises(ValueError, match="Invalid placeholder"):
+            PathTemplate("/a/{first:>10}")
+
     def test_safe_model_dump_with_none(self):
         """Test _safe_model_dump with None."""
         result = APIMethod._safe_model_dump(None)
@@ -0,0 +1,193 @@
+"""
+Tests for cursor pagination helpers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.pagination import (
+    get_created_at_filters,
+    get_next_cursor,
+    get_page_items,
+    iter_items,
+    iter_pages,
+    scan_time_slices,
+    split_time_range,
+)
+from aioyookassa.exceptions import ServerError
+from aioyookassa.types.payment import PaymentsList
+from aioyookassa.types.receipt_registration import FiscalReceiptsList
+
+
+def make_list_method(pages):
+    """Create list method returning refunds pages by cursor."""
+    calls = []
+
+    async def get_list(params=None, **kwargs):
+        calls.append((dict(params or {}), kwargs))
+        return SimpleNamespace(**pages[(params or {}).get("cursor")])
+
+    get_list.calls = calls
+    return get_list
+
+
+class TestPageHelpers:
+    """Test page accessors."""
+
+    def test_list_and_items_models(self):
+        """Test items and cursor of differently shaped list models."""
+        payments = PaymentsList(items=[], next_cursor="abc")
+        receipts = FiscalReceiptsList(items=[], next_cursor=None)
+
+        assert get_page_items(payments) == []
+        assert get_next_cursor(payments) == "abc"
+        assert get_page_items(receipts) == []
+        assert get_next_cursor(receipts) is None
+        assert get_next_cursor(PaymentsList(items=[], cursor="old")) == "old"
+
+
+class TestIterPages:
+    """Test iter_pages and iter_items."""
+
+    @pytest.mark.asyncio
+    async def test_walks_cursor_chain(self):
+        """Test pages are requested by cursor until the last one."""
+        method = make_list_method(
+            {
+                None: {"list": [1, 2], "next_cursor": "c1"},
+                "c1": {"list": [3], "next_cursor": None},
+            }
+        )
+        pages = [page async for page in iter_pages(method, {"limit": 2}, timeout=5)]
+
+        assert pages == [([1, 2], "c1"), ([3], None)]
+        assert method.calls[0] == ({"limit": 2}, {"timeout": 5})
+        assert method.calls[1] == ({"limit": 2, "cursor": "c1"}, {"timeout": 5})
+
+    @pytest.mark.asyncio
+    async def test_iter_items_from_cursor(self):
+        """Test items iteration and starting cursor."""
+        method = make_list_method(
+            {
+                None: {"list": [1], "next_cursor": "c1"},
+                "c1": {"list": [2, 3], "next_cursor": None},
+            }
+        )
+
+        assert [item async for item in iter_items(method)] == [1, 2, 3]
+        assert [page async for page in iter_pages(method, cursor="c1")] == [
+            ([2, 3], None)
+        ]
+
+
+def make_time_list_method(created, page_size=2, fail_before=None):
+    """Create list method filtering timestamps by created_at_gte/lt."""
+    calls = []
+
+    async def get_list(params=None, created_at_gte=None, created_at_lt=None):
+        calls.append((created_at_gte, created_at_lt))
+        await asyncio.sleep(0)
+        if fail_before is not None and created_at_lt <= fail_before:
+            raise ServerError("unavailable")
+        items = sorted(
+            (t for t in created if created_at_gte <= t < created_at_lt), reverse=True
+        )
+        offset = int((params or {}).get("cursor") or 0)
+        page = items[offset : offset + page_size]
+        next_offset = offset + page_size
+        cursor = str(next_offset) if next_offset < len(items) else None
+        return SimpleNamespace(list=page, next_cursor=cursor)
+
+    get_list.calls = calls
+    return get_list
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 9, tzinfo=timezone.utc)
+# Includes timestamps exactly on slice boundaries
+CREATED = [START + timedelta(hours=6 * i) for i in range(32)]
+
+
+class TestSplitTimeRange:
+    """Test split_time_range."""
+
+    def test_half_open_slices(self):
+        """Test slices cover the range without overlap."""
+        bounds = split_time_range(START, END, 4)
+
+        assert bounds[0] == (START, START + timedelta(days=2))
+        assert bounds[-1][1] == END
+        assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+
+    def test_invalid(self):
+        """Test invalid ranges are rejected."""
+        with pytest.raises(ValueError):
+            split_time_range(END, START, 4)
+        with pytest.raises(ValueError):
+            split_time_range(START, END, 0)
+
+
+class TestScanTimeSlices:
+    """Test scan_time_slices."""
+
+    @pytest.mark.asyncio
+    async def test_unordered_without_duplicates(self):
+        """Test all items are returned once, including boundary ones."""
+        method = make_time_list_method(CREATED)
+
+        items = [
+            item
+            async for item in scan_time_slices(
+                method, START, END, slices=4, concurrency=3
+            )
+        ]
+
+        assert sorted(items) == CREATED
+        assert len({call for call in method.calls}) == 4
+
+    @pytest.mark.asyncio
+    async def test_ordered_matches_sequential_scan(self):
+        """Test ordered mode yields items like one sequential scan."""
+        method = make_time_list_method(CREATED)
+
+        items = [
+            item
+            async for item in scan_time_slices(
+                method,
+                START,
+                END,
+                slices=8,
+                concurrency=3,
+                ordered=True,
+                buffer_pages=1,
+            )
+        ]
+
+        assert items == sorted(CREATED, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised(self):
+        """Test failure of one slice stops the scan."""
+        method = make_time_list_method(CREATED, fail_before=START + timedelta(days=2))
+
+        with pytest.raises(ServerError):
+            async for _ in scan_time_slices(method, START, END, slices=4):
+                pass
+
+    def test_payments_filters_use_api_notation(self):
+        """Test payments get ISO filters in API notation."""
+        client = YooKassa(api_key="key", shop_id=1)
+
+        filters = get_created_at_filters(client.payments.get_payments, START, END)
+
+        assert filters == {
+            "created_at.gte": START.isoformat(),
+            "created_at.lt": END.isoformat(),
+        }
+        assert get_created_at_filters(client.refunds.get_refunds, START) == {
+            "created_at_gte": START
+        }
@@ -0,0 +1,113 @@
+"""
+Tests for YooKassaPool.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aioyookassa import YooKassa, YooKassaPool
+
+
+class TestYooKassaPool:
+    """Test YooKassaPool."""
+
+    def test_get_returns_cached_client(self):
+        """Test clients are cached per shop."""
+        pool = YooKassaPool()
+
+        client = pool.get(shop_id=1, api_key="key_1")
+
+        assert isinstance(client, YooKassa)
+        assert client.shop_id == "1"
+        assert client.api_key == "key_1"
+        assert pool.get(shop_id="1", api_key="key_1") is client
+        assert 1 in pool
+        assert len(pool) == 1
+
+    def test_get_replaces_client_on_key_change(self):
+        """Test a new client is created when the API key changes."""
+        pool = YooKassaPool()
+
+        old_client = pool.get(shop_id=1, api_key="old_key")
+        new_client = pool.get(shop_id=1, api_key="new_key")
+
+        assert new_client is not old_client
+        assert new_client.api_key == "new_key"
+        assert len(pool) == 1
+
+    def test_lru_eviction(self):
+        """Test least recently used clients are evicted."""
+        pool = YooKassaPool(max_clients=2)
+
+        pool.get(shop_id=1, api_key="key_1")
+        pool.get(shop_id=2, api_key="key_2")
+        pool.get(shop_id=1, api_key="key_1")
+        pool.get(shop_id=3, api_key="key_3")
+
+        assert 1 in pool
+        assert 2 not in pool
+        assert 3 in pool
+
+        pool.remove(1)
+        assert 1 not in pool
+
+    def test_invalid_max_clients(self):
+        """Test max_clients must be positive."""
+        with pytest.raises(ValueError):
+            YooKassaPool(max_clients=0)
+
+    @pytest.mark.asyncio
+    async def test_clients_share_session_and_use_own_credentials(self):
+        """Test pooled clients share one session with per-request auth."""
+        async with YooKassaPool() as pool:
+            client_1 = pool.get(shop_id=1, api_key="key_1")
+            client_2 = pool.get(shop_id=2, api_key="key_2")
+
+            assert client_1._get_session() is client_2._get_session()
+
+            response = AsyncMock()
+            response.status = 200
+            response.json = AsyncMock(
+                return_value={"account_id": "1", "status": "enabled", "test": True}
+            )
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            session = client_1._get_session()
+            with patch.object(
+                session, "request", AsyncMock(return_value=response)
+            ) as mock_request:
+                await client_1.get_me()
+                await client_2.get_me()
+
+            logins = [call[1]["auth"].login for call in mock_request.call_args_list]
+            assert logins == ["1", "2"]
+
+            # Closing a pooled client keeps the shared session open
+            await client_1.close()
+            assert not session.closed
+
+        assert session.closed
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_close_stops_keepalive_of_clients(self):
+        """Test closing a pooled client or the pool stops its keep-alive refresh."""
+        pool = YooKassaPool()
+        client_1 = pool.get(shop_id=1, api_key="key_1")
+        client_2 = pool.get(shop_id=2, api_key="key_2")
+        tasks = []
+        for client in (client_1, client_2):
+            with patch.object(client, "_open_connections", AsyncMock(return_value=1)):
+                await client.warmup(1, keepalive_interval=60)
+            tasks.append(client._keepalive_task)
+
+        await client_1.close()
+        await asyncio.sleep(0)
+        assert tasks[0].cancelled()
+        assert not tasks[1].done()
+
+        await pool.close()
+        await asyncio.sleep(0)
+        assert tasks[1].cancelled()
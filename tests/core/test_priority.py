@@ -0,0 +1,211 @@
+"""
+Tests for PriorityScheduler and prioritized requests.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.api.payments import PaymentsAPI
+from aioyookassa.core.methods.payments import GetPayment
+from aioyookassa.core.priority import Priority, PriorityScheduler
+from aioyookassa.exceptions import RequestTimeout
+
+
+class TestPriorityScheduler:
+    """Test PriorityScheduler."""
+
+    def test_capacity(self):
+        """Test reserved slots are kept for higher priorities."""
+        scheduler = PriorityScheduler(limit=30)
+
+        assert scheduler.get_capacity(Priority.INTERACTIVE) == 30
+        assert scheduler.get_capacity("default") == 20
+        assert scheduler.get_capacity(Priority.BULK) == 15
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"limit": 0},
+            {"limit": 5, "reserved": {"interactive": 3, "default": 2}},
+            {"limit": 5, "reserved": {"bulk": -1}},
+            {"limit": 5, "reserved": {"unknown": 1}},
+        ],
+    )
+    def test_invalid_settings(self, kwargs):
+        """Test invalid limits are rejected."""
+        with pytest.raises(ValueError):
+            PriorityScheduler(**kwargs)
+
+    def test_try_acquire(self):
+        """Test lower priorities cannot take reserved slots."""
+        scheduler = PriorityScheduler(limit=3, reserved={"interactive": 1})
+
+        assert scheduler.try_acquire(Priority.BULK) is True
+        assert scheduler.try_acquire(Priority.BULK) is True
+        assert scheduler.try_acquire(Priority.BULK) is False
+        assert scheduler.try_acquire(Priority.INTERACTIVE) is True
+        assert scheduler.try_acquire(Priority.INTERACTIVE) is False
+        assert scheduler.in_use == 3
+
+    @pytest.mark.asyncio
+    async def test_higher_priorities_are_dispatched_first(self):
+        """Test freed slots go to the highest priority waiting, FIFO within it."""
+        scheduler = PriorityScheduler(limit=1, reserved={})
+        await scheduler.acquire()
+        order = []
+
+        async def request(priority, name):
+            await scheduler.acquire(priority)
+            order.append(name)
+            scheduler.release()
+
+        tasks = [
+            asyncio.ensure_future(request(Priority.BULK, "bulk")),
+            asyncio.ensure_future(request(Priority.DEFAULT, "default")),
+            asyncio.ensure_future(request(Priority.INTERACTIVE, "first")),
+            asyncio.ensure_future(request(Priority.INTERACTIVE, "second")),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.get_waiting() == 4
+        assert scheduler.get_waiting(Priority.INTERACTIVE) == 2
+        # A free slot is not taken past the waiting requests
+        assert scheduler.try_acquire(Priority.BULK) is False
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["first", "second", "default", "bulk"]
+        assert scheduler.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiters(self):
+        """Test cancelled waiters neither keep nor lose slots."""
+        scheduler = PriorityScheduler(limit=1, reserved={})
+        await scheduler.acquire()
+
+        cancelled = asyncio.ensure_future(scheduler.acquire(Priority.INTERACTIVE))
+        waiting = asyncio.ensure_future(scheduler.acquire(Priority.BULK))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        scheduler.release()
+        await waiting
+
+        assert cancelled.cancelled()
+        assert scheduler.in_use == 1
+        assert scheduler.get_waiting() == 0
+
+        # The slot granted to a waiter cancelled right after is passed on
+        granted = asyncio.ensure_future(scheduler.acquire())
+        await asyncio.sleep(0)
+        scheduler.release()
+        granted.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await granted
+        assert scheduler.in_use == 0
+
+
+class TestPrioritizedRequests:
+    """Test requests of a client with a scheduler."""
+
+    @staticmethod
+    def _client(scheduler):
+        return BaseAPIClient(
+            api_key="test_api_key", shop_id=123456, scheduler=scheduler
+        )
+
+    @pytest.mark.asyncio
+    async def test_slots_are_held_during_requests(self):
+        """Test requests wait for slots and release them."""
+        scheduler = PriorityScheduler(limit=1, reserved={})
+        client = self._client(scheduler)
+        release = asyncio.Event()
+        in_use = []
+
+        async def execute(*args):
+            in_use.append(scheduler.in_use)
+            await release.wait()
+            return {"id": "123"}
+
+        with patch.object(client, "_execute_request", side_effect=execute):
+            first = asyncio.ensure_future(
+                client._send_request(GetPayment.build("1"), priority="bulk")
+            )
+            second = asyncio.ensure_future(
+                client._send_request(GetPayment.build("2"), priority="interactive")
+            )
+            await asyncio.sleep(0.01)
+            assert scheduler.get_waiting(Priority.INTERACTIVE) == 1
+            release.set()
+            assert await asyncio.gather(first, second) == [{"id": "123"}] * 2
+
+        assert in_use == [1, 1]
+        assert scheduler.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_waiting_counts_towards_timeout(self):
+        """Test requests time out waiting and get the rest of the timeout."""
+        scheduler = PriorityScheduler(limit=1, reserved={})
+        client = self._client(scheduler)
+        await scheduler.acquire()
+
+        with pytest.raises(RequestTimeout, match="no default request slot"):
+            await client._send_request(GetPayment.build("1"), timeout=0.01)
+        assert scheduler.get_waiting() == 0
+
+        mock_execute = AsyncMock(return_value={"id": "123"})
+        with patch.object(client, "_execute_request", mock_execute):
+            request = asyncio.ensure_future(
+                client._send_request(GetPayment.build("1"), timeout=5)
+            )
+            await asyncio.sleep(0.05)
+            scheduler.release()
+            await request
+
+        assert mock_execute.call_args[0][4].total < 5
+        assert scheduler.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_release_slots(self):
+        """Test slots are released when requests fail."""
+        scheduler = PriorityScheduler(limit=1, reserved={})
+        client = self._client(scheduler)
+
+        with patch.object(
+            client, "_execute_request", AsyncMock(side_effect=RequestTimeout("slow"))
+        ):
+            with pytest.raises(RequestTimeout):
+                await client._send_request(GetPayment.build("1"))
+
+        assert scheduler.in_use == 0
+
+
+class TestAPIPriority:
+    """Test priorities of API modules."""
+
+    @pytest.mark.asyncio
+    async def test_module_and_call_priorities(self, sample_api_response):
+        """Test per-call priorities override the priority of the module."""
+        client = MagicMock(spec=BaseAPIClient)
+        client._send_request = AsyncMock(return_value=sample_api_response)
+        api = PaymentsAPI(client)
+        bulk = api.with_priority("bulk")
+
+        await api.get_payment("payment_1")
+        await bulk.get_payment("payment_1")
+        await bulk.get_payment("payment_1", priority=Priority.INTERACTIVE)
+        await bulk.capture_payment("payment_1")
+
+        priorities = [
+            call.kwargs["priority"] for call in client._send_request.await_args_list
+        ]
+        assert priorities == [
+            None,
+            Priority.BULK,
+            Priority.INTERACTIVE,
+            Priority.BULK,
+        ]
+        assert bulk._client is client
+        assert api._priority is None
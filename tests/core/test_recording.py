@@ -0,0 +1,164 @@
+"""
+Tests for record-and-replay transports.
+"""
+
+import asyncio
+import gzip
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import ClientTimeout
+
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.recording import RecordingTransport, ReplayTransport
+from aioyookassa.core.transport import InProcessTransport, Response, TransportError
+from aioyookassa.exceptions import NetworkError
+from tests.fixtures.transports import check_empty_bodies
+
+SHOP_ID = "506751"
+API_KEY = "test_secret_key"
+
+REFUND = {
+    "id": "123",
+    "payment_id": "456",
+    "status": "succeeded",
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "amount": {"value": "506751.00", "currency": "RUB"},
+    "description": SHOP_ID,
+}
+
+
+def handler(request):
+    return Response(200, {"Retry-After": "1"}, json.dumps(REFUND).encode())
+
+
+async def record(path):
+    transport = RecordingTransport(path, InProcessTransport(handler))
+    client = YooKassa(api_key=API_KEY, shop_id=SHOP_ID, transport=transport)
+    refund = await client.refunds.get_refund("123")
+    await client.close()
+    return refund
+
+
+class TestRecordingTransport:
+    """Test RecordingTransport."""
+
+    @pytest.mark.asyncio
+    async def test_record_is_sanitized(self, tmp_path):
+        """Test cassette contains interactions without credentials."""
+        path = str(tmp_path / "cassette.jsonl")
+
+        refund = await record(path)
+
+        assert refund.description == SHOP_ID
+        with open(path, encoding="utf-8") as file:
+            content = file.read()
+        assert API_KEY not in content
+        assert f'"{SHOP_ID}"' not in content
+        interaction = json.loads(content)
+        assert interaction["method"] == "GET"
+        assert interaction["url"] == "https://api.yookassa.ru/v3/refunds/123"
+        assert interaction["status"] == 200
+        assert interaction["headers"] == {"Retry-After": "1"}
+        # Numbers containing the shop ID are left intact
+        assert '"506751.00"' in interaction["body"]
+        assert '"<shop_id>"' in interaction["body"]
+
+    @pytest.mark.asyncio
+    async def test_gzip_cassette(self, tmp_path):
+        """Test .gz cassettes are compressed."""
+        path = str(tmp_path / "cassette.jsonl.gz")
+
+        await record(path)
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            assert json.loads(file.readline())["status"] == 200
+
+
+class TestReplayTransport:
+    """Test ReplayTransport."""
+
+    @pytest.mark.asyncio
+    async def test_replay_restores_credentials(self, tmp_path):
+        """Test replayed responses use credentials of the replaying client."""
+        path = str(tmp_path / "cassette.jsonl")
+        await record(path)
+        client = YooKassa(
+            api_key="other", shop_id="42", transport=ReplayTransport(path, speed=None)
+        )
+
+        refund = await client.refunds.get_refund("123")
+
+        assert refund.description == "42"
+        assert refund.amount.value == Decimal("506751.00")
+
+    @pytest.mark.asyncio
+    async def test_scaled_timing(self, tmp_path):
+        """Test recorded latency is scaled by speed."""
+        path = tmp_path / "cassette.jsonl"
+        interaction = {
+            "method": "GET",
+            "url": "https://x/refunds/1",
+            "params": "",
+            "json": None,
+            "status": 200,
+            "headers": {},
+            "body": "{}",
+            "elapsed": 0.5,
+        }
+        path.write_text(json.dumps(interaction) + "\n")
+        transport = ReplayTransport(str(path), speed=2.0)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            response = await transport.request("GET", "https://x/refunds/1")
+
+        mock_sleep.assert_awaited_once_with(0.25)
+        assert await response.json() == {}
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(asyncio.TimeoutError):
+                await ReplayTransport(str(path), speed=0.1).request(
+                    "GET", "https://x/refunds/1", timeout=ClientTimeout(total=1)
+                )
+
+    @pytest.mark.asyncio
+    async def test_empty_bodies(self, tmp_path):
+        """Test replayed empty bodies map to errors or an empty result."""
+
+        def make_transport(status, headers):
+            path = tmp_path / f"cassette-{status}.jsonl"
+            interaction = {
+                "method": "GET",
+                "url": "https://api.yookassa.ru/v3/payments/123",
+                "params": "",
+                "json": None,
+                "status": status,
+                "headers": headers,
+                "body": "",
+                "elapsed": 0,
+            }
+            path.write_text(json.dumps(interaction) + "\n")
+            return ReplayTransport(str(path), speed=None)
+
+        await check_empty_bodies(make_transport)
+
+    @pytest.mark.asyncio
+    async def test_unknown_and_exhausted_requests(self, tmp_path):
+        """Test requests without recordings fail."""
+        path = str(tmp_path / "cassette.jsonl")
+        await record(path)
+        transport = ReplayTransport(path, speed=None, repeat=False)
+        client = YooKassa(api_key=API_KEY, shop_id=SHOP_ID, transport=transport)
+
+        await client.refunds.get_refund("123")
+        with pytest.raises(NetworkError):
+            await client.refunds.get_refund("123")
+        with pytest.raises(TransportError):
+            await transport.request("GET", "https://x/unknown")
+
+    def test_invalid_speed(self, tmp_path):
+        """Test speed must be positive."""
+        with pytest.raises(ValueError):
+            ReplayTransport(str(tmp_path / "missing.jsonl"), speed=0)
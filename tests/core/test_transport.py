@@ -0,0 +1,310 @@
+"""
+Tests for pluggable transports.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import BasicAuth, ClientConnectionError, ClientTimeout
+
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.transport import (
+    AiohttpTransport,
+    BaseTransport,
+    HttpxTransport,
+    InProcessTransport,
+    Response,
+    TransportError,
+)
+from aioyookassa.exceptions import NetworkError, NotFound, RequestTimeout
+from tests.fixtures.transports import check_empty_bodies
+
+REFUND = {
+    "id": "123",
+    "payment_id": "456",
+    "status": "succeeded",
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "amount": {"value": "10.00", "currency": "RUB"},
+}
+
+
+class RecordingTransport(BaseTransport):
+    """Transport returning a fixed response and recording requests."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.requests = []
+        self.closed = False
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    async def close(self):
+        self.closed = True
+
+
+class TestResponse:
+    """Test buffered Response."""
+
+    @pytest.mark.asyncio
+    async def test_read_text_json(self):
+        """Test body accessors."""
+        response = Response(200, {"Content-Type": "application/json"}, b'{"a": 1}')
+
+        assert await response.read() == b'{"a": 1}'
+        assert await response.text() == '{"a": 1}'
+        assert await response.json() == {"a": 1}
+        async with response as entered:
+            assert entered is response
+
+    @pytest.mark.asyncio
+    async def test_json_empty_and_invalid(self):
+        """Test empty bodies and invalid JSON raise ValueError."""
+        with pytest.raises(ValueError):
+            await Response(204, {}, b"").json()
+        with pytest.raises(ValueError):
+            await Response(200, {}, b"not json").json()
+
+
+class TestClientTransport:
+    """Test BaseAPIClient with a custom transport."""
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_transport(self):
+        """Test requests and auth are passed to the transport."""
+        transport = RecordingTransport(
+            Response(200, {}, b'{"account_id": "1", "status": "enabled", "test": true}')
+        )
+        client = YooKassa(api_key="key", shop_id=1, transport=transport)
+
+        settings = await client.get_me(timeout=3)
+
+        assert settings.account_id == "1"
+        method, url, kwargs = transport.requests[0]
+        assert method == "GET"
+        assert url == "https://api.yookassa.ru/v3/me"
+        assert kwargs["auth"] == BasicAuth("1", "key")
+        assert kwargs["timeout"].total == 3
+        assert kwargs["headers"]["User-Agent"].startswith("aioyookassa/")
+        assert client._session is None
+
+        await client.close()
+        assert transport.closed is True
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_mapped(self):
+        """Test HTTP errors from transports raise typed exceptions."""
+        transport = RecordingTransport(
+            Response(404, {}, b'{"code": "not_found", "description": "Not found"}')
+        )
+        client = YooKassa(api_key="key", shop_id=1, transport=transport)
+
+        with pytest.raises(NotFound):
+            await client.payments.get_payment("123")
+
+    @pytest.mark.asyncio
+    async def test_transport_failures_are_mapped(self):
+        """Test transport timeouts and errors raise typed exceptions."""
+        client = YooKassa(
+            api_key="key",
+            shop_id=1,
+            transport=RecordingTransport(error=asyncio.TimeoutError()),
+        )
+        with pytest.raises(RequestTimeout):
+            await client.payments.get_payment("123")
+
+        client = YooKassa(
+            api_key="key",
+            shop_id=1,
+            transport=RecordingTransport(error=TransportError("reset")),
+        )
+        with pytest.raises(NetworkError):
+            await client.payments.get_payment("123")
+
+
+class TestAiohttpTransport:
+    """Test default aiohttp transport."""
+
+    @pytest.mark.asyncio
+    async def test_client_uses_aiohttp_transport_by_default(self):
+        """Test default transport sends requests through the client session."""
+        client = YooKassa(api_key="key", shop_id=1)
+        session = MagicMock()
+        response = MagicMock()
+        session.request = AsyncMock(return_value=response)
+        client._get_session = MagicMock(return_value=session)
+
+        result = await client._request("GET", "https://x", timeout=client._timeout)
+
+        assert result is response
+        assert isinstance(client._get_transport(), AiohttpTransport)
+        assert session.request.call_args[1]["proxy"] is None
+        assert session.request.call_args[1]["headers"]["User-Agent"].startswith(
+            "aioyookassa/"
+        )
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_converted(self):
+        """Test aiohttp errors are raised as TransportError."""
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=ClientConnectionError("reset"))
+        transport = AiohttpTransport(session_factory=lambda: session)
+
+        with pytest.raises(TransportError):
+            await transport.request("GET", "https://x")
+
+    @pytest.mark.asyncio
+    async def test_owned_session(self):
+        """Test transport without a factory creates and closes its own session."""
+        transport = AiohttpTransport()
+
+        session = transport._get_session()
+        assert transport._get_session() is session
+
+        await transport.close()
+        assert session.closed
+        assert transport._session is None
+
+
+class TestInProcessTransport:
+    """Test InProcessTransport."""
+
+    @pytest.mark.asyncio
+    async def test_sync_handler(self):
+        """Test sync handler serves client requests."""
+        transport = InProcessTransport(
+            lambda request: Response(200, {}, json.dumps(REFUND).encode())
+        )
+        client = YooKassa(api_key="key", shop_id=1, transport=transport)
+
+        refund = await client.refunds.get_refund("123")
+
+        assert refund.id == "123"
+        request = transport.requests[0]
+        assert request.method == "GET"
+        assert request.url.endswith("/refunds/123")
+        assert request.auth == BasicAuth("1", "key")
+
+    @pytest.mark.asyncio
+    async def test_empty_bodies(self):
+        """Test empty bodies map to errors of the status or an empty result."""
+        await check_empty_bodies(
+            lambda status, headers: InProcessTransport(
+                lambda request: Response(status, headers, b"")
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_recorded_requests_are_bounded(self):
+        """Test only the latest requests are recorded."""
+        response = Response(200, {}, b"{}")
+        transport = InProcessTransport(lambda request: response, max_recorded=2)
+        silent = InProcessTransport(lambda request: response, max_recorded=0)
+
+        for index in range(3):
+            await transport.request("GET", f"https://x/{index}")
+            await silent.request("GET", "https://x")
+
+        assert [request.url for request in transport.requests] == [
+            "https://x/1",
+            "https://x/2",
+        ]
+        assert len(silent.requests) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_handler_timeout(self):
+        """Test async handler is limited by the request timeout."""
+
+        async def handler(request):
+            await asyncio.sleep(1)
+
+        transport = InProcessTransport(handler)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await transport.request("GET", "https://x", timeout=ClientTimeout(0.01))
+
+
+class TestHttpxTransport:
+    """Test HttpxTransport."""
+
+    @pytest.fixture
+    def httpx(self):
+        return pytest.importorskip("httpx")
+
+    @staticmethod
+    def _transport(httpx, handler):
+        transport = HttpxTransport(http2=False)
+        transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return transport
+
+    @pytest.mark.asyncio
+    async def test_request(self, httpx):
+        """Test request is converted to httpx and response is buffered."""
+        seen = {}
+
+        def handler(request):
+            seen["request"] = request
+            return httpx.Response(200, json={"id": "123"}, headers={"X-Test": "1"})
+
+        transport = self._transport(httpx, handler)
+        response = await transport.request(
+            "POST",
+            "https://api.yookassa.ru/v3/payments",
+            json={"amount": 1},
+            params={"limit": 1},
+            headers={"Idempotence-Key": "key"},
+            auth=BasicAuth("shop", "secret"),
+            timeout=ClientTimeout(total=5),
+        )
+
+        assert response.status == 200
+        assert response.headers["x-test"] == "1"
+        assert await response.json() == {"id": "123"}
+        request = seen["request"]
+        assert request.url.params["limit"] == "1"
+        assert request.headers["Idempotence-Key"] == "key"
+        assert request.headers["Authorization"] == BasicAuth("shop", "secret").encode()
+        await transport.close()
+        assert transport._client is None
+
+    @pytest.mark.asyncio
+    async def test_empty_bodies(self, httpx):
+        """Test empty bodies map to errors of the status or an empty result."""
+        await check_empty_bodies(
+            lambda status, headers: self._transport(
+                httpx, lambda request: httpx.Response(status, headers=headers)
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_errors(self, httpx):
+        """Test httpx errors are converted."""
+
+        def timeout_handler(request):
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        def error_handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await self._transport(httpx, timeout_handler).request("GET", "https://x")
+        with pytest.raises(TransportError):
+            await self._transport(httpx, error_handler).request("GET", "https://x")
+
+    def test_timeout_conversion(self, httpx):
+        """Test aiohttp timeout is converted to httpx timeout."""
+        transport = HttpxTransport()
+
+        timeout = transport._get_timeout(
+            ClientTimeout(total=30, connect=5, sock_read=25)
+        )
+
+        assert timeout.connect == 5
+        assert timeout.read == 25
+        assert transport._get_timeout(None).read is None
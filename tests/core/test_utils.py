@@ -3,10 +3,16 @@ Tests for core utilities.
 """
 
 import uuid
+from decimal import Decimal
 
 import pytest
 
-from aioyookassa.core.utils import generate_idempotence_key
+from aioyookassa.core.utils import (
+    CleanDict,
+    clean_request_data,
+    generate_idempotence_key,
+    remove_none_values,
+)
 
 
 class TestGenerateIdempotenceKey:
@@ -48,3 +54,52 @@ class TestGenerateIdempotenceKey:
 
         # All keys should be different
         assert len(set(keys)) == 10
+
+
+class TestCleanRequestData:
+    """Test clean_request_data and remove_none_values functions."""
+
+    def test_clean_data_is_copied_once(self):
+        """Test data without values to remove is copied at the top level only."""
+        data = {"a": "1", "b": {"c": [1, {"d": True}]}, "e": [[None]]}
+
+        result = clean_request_data(data)
+
+        assert isinstance(result, CleanDict)
+        assert result == data
+        assert result is not data
+        assert result["b"] is data["b"]
+        assert clean_request_data(result) is result
+
+    def test_nested_values_are_cleaned(self):
+        """Test None values, empty containers and Decimals at any depth."""
+        data = {
+            "amount": {"value": Decimal("1.50"), "currency": "RUB"},
+            "receipt": {
+                "items": [
+                    {"description": "a", "vat_code": None},
+                    {"extra": None},
+                    None,
+                    Decimal("2"),
+                ],
+                "customer": {"email": None},
+            },
+            "empty": [],
+            "nested": [[None]],
+        }
+
+        result = clean_request_data(data)
+
+        assert result == {
+            "amount": {"value": "1.50", "currency": "RUB"},
+            "receipt": {"items": [{"description": "a"}, "2"]},
+            "nested": [[None]],
+        }
+        assert data["receipt"]["customer"] == {"email": None}
+
+    def test_remove_none_values_marks_plain_values(self):
+        """Test flat results are marked clean and nested ones are not."""
+        assert isinstance(remove_none_values({"a": 1, "b": None}), CleanDict)
+        result = remove_none_values({"a": {"b": None}})
+        assert not isinstance(result, CleanDict)
+        assert clean_request_data(result) == {}
@@ -172,3 +172,50 @@ class TestMatchErrorMixin:
         error_message = str(exc_info.value)
         assert "Too many requests" in error_message
         assert "Retry after: 60" in error_message
+
+    def test_detect_exposes_structured_error_fields(self):
+        """Test that detected errors carry structured fields from the API."""
+        from aioyookassa.exceptions.authorization import InvalidRequestError
+
+        error_details = {
+            "type": "error",
+            "id": "ab5a11cd-13cc-4e33-af8b-75a74e18dd09",
+            "code": "invalid_request",
+            "description": "Invalid parameter value",
+            "parameter": "amount.value",
+            "retry_after": 1800,
+        }
+        with pytest.raises(InvalidRequestError) as exc_info:
+            APIError.detect("invalid_request", "Invalid parameter value", error_details)
+        error = exc_info.value
+        assert error.code == "invalid_request"
+        assert error.parameter == "amount.value"
+        assert error.error_type == "error"
+        assert error.retry_after == 1800
+        assert error.id == "ab5a11cd-13cc-4e33-af8b-75a74e18dd09"
+        assert error.error_details is error_details
+        assert error.args == ("Invalid parameter value",)
+        assert "Parameter: amount.value" in str(error)
+
+    def test_errors_without_details_have_empty_fields(self):
+        """Test that errors created directly have no structured fields."""
+        error = APIError("Plain error")
+        assert error.code is None
+        assert error.retry_after is None
+        assert error.error_details is None
+        assert str(error) == "Plain error"
+
+    def test_exact_code_uses_index_before_substring_scan(self):
+        """Test that exact codes resolve through the code index."""
+
+        class BroadError(APIError):
+            match = "indexed"
+
+        class ExactError(APIError):
+            match = "indexed_code"
+
+        # Substring scan alone would pick the first registered BroadError
+        with pytest.raises(ExactError):
+            APIError.detect("indexed_code", "Some message")
+        with pytest.raises(BroadError):
+            APIError.detect("other_indexed_value", "Some message")
@@ -0,0 +1,77 @@
+"""
+Tests for transport-level and server-side exceptions.
+"""
+
+import pytest
+
+from aioyookassa.exceptions import (
+    APIError,
+    Forbidden,
+    InvalidRequestError,
+    NetworkError,
+    NotFound,
+    RequestTimeout,
+    ServerError,
+    TooManyRequests,
+)
+
+
+class TestStatusMapping:
+    """Test mapping of HTTP statuses to exception classes."""
+
+    @pytest.mark.parametrize(
+        "status, expected",
+        [
+            (400, InvalidRequestError),
+            (403, Forbidden),
+            (404, NotFound),
+            (429, TooManyRequests),
+            (500, ServerError),
+            (503, ServerError),
+            (418, APIError),
+        ],
+    )
+    def test_for_status(self, status, expected):
+        """Test exception class lookup by HTTP status."""
+        assert APIError.for_status(status) is expected
+
+    def test_detect_falls_back_to_status(self):
+        """Test that unknown codes are classified by HTTP status."""
+        with pytest.raises(ServerError) as exc_info:
+            APIError.detect(
+                "unexpected_code",
+                "Something went wrong",
+                error_details={"code": "unexpected_code", "id": "req-1"},
+                status=502,
+            )
+        error = exc_info.value
+        assert error.status == 502
+        assert error.request_id == "req-1"
+        assert error.retryable is True
+
+    def test_detect_prefers_error_code(self):
+        """Test that a known error code wins over the HTTP status."""
+        with pytest.raises(TooManyRequests) as exc_info:
+            APIError.detect(
+                "too_many_requests",
+                "Too many requests",
+                error_details={"code": "too_many_requests", "retry_after": 30},
+                status=500,
+            )
+        assert exc_info.value.retry_after == 30
+        assert exc_info.value.status == 500
+
+
+class TestRetryable:
+    """Test retryable classification."""
+
+    def test_retryable_errors(self):
+        """Test errors that may succeed on retry."""
+        for error_cls in (TooManyRequests, ServerError, RequestTimeout, NetworkError):
+            assert error_cls("message").retryable is True
+            assert issubclass(error_cls, APIError)
+
+    def test_non_retryable_errors(self):
+        """Test client errors are not retryable."""
+        for error_cls in (APIError, InvalidRequestError, Forbidden, NotFound):
+            assert error_cls("message").retryable is False
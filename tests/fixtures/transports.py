@@ -0,0 +1,31 @@
+"""
+Shared checks of transports.
+"""
+
+import pytest
+
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.methods.payments import GetPayment
+from aioyookassa.exceptions import ServerError, TooManyRequests
+
+
+async def check_empty_bodies(make_transport):
+    """
+    Check responses with empty bodies through a client.
+
+    :param make_transport: Creates a transport answering every request with
+        the given status and headers and an empty body
+    """
+    client = YooKassa(
+        api_key="key", shop_id=1, transport=make_transport(429, {"Retry-After": "5"})
+    )
+    with pytest.raises(TooManyRequests) as error:
+        await client.payments.get_payment("123")
+    assert error.value.retry_after == 5
+
+    client = YooKassa(api_key="key", shop_id=1, transport=make_transport(502, {}))
+    with pytest.raises(ServerError):
+        await client.payments.get_payment("123")
+
+    client = YooKassa(api_key="key", shop_id=1, transport=make_transport(200, {}))
+    assert await client._send_request(GetPayment.build("123")) == {}
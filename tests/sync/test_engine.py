@@ -0,0 +1,163 @@
+"""
+Tests for SyncEngine.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aioyookassa.core.client import YooKassa
+from aioyookassa.core.transport import InProcessTransport, Response
+from aioyookassa.core.webhook_handler import WebhookHandler
+from aioyookassa.sync import SQLiteStore, SyncEngine
+from aioyookassa.types.payment import Payment
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def payment_data(index, status="succeeded", **extra):
+    return {
+        "id": f"p{index}",
+        "status": status,
+        "amount": {"value": "10.00", "currency": "RUB"},
+        "recipient": {"account_id": "1", "gateway_id": "2"},
+        "created_at": (START + timedelta(hours=index)).isoformat(),
+        "test": True,
+        "paid": True,
+        "refundable": True,
+        **extra,
+    }
+
+
+def refund_data(index):
+    return {
+        "id": f"r{index}",
+        "payment_id": f"p{index}",
+        "status": "succeeded",
+        "amount": {"value": "10.00", "currency": "RUB"},
+        "created_at": (START + timedelta(hours=index)).isoformat(),
+    }
+
+
+class FakeYooKassa:
+    """In-process YooKassa serving payments and refunds lists."""
+
+    def __init__(self):
+        self.payments = [payment_data(1, metadata={"order_id": "1"}), payment_data(2)]
+        self.refunds = [refund_data(1)]
+        self.transport = InProcessTransport(self.handle)
+
+    def handle(self, request):
+        path = request.url.split("/v3", 1)[1]
+        params = request.params or {}
+        if path in ("/payments", "/refunds"):
+            gte = params.get("created_at.gte") or params.get("created_at_gte")
+            objects = self.payments if path == "/payments" else self.refunds
+            items = [
+                obj
+                for obj in objects
+                if gte is None
+                or datetime.fromisoformat(obj["created_at"])
+                >= datetime.fromisoformat(gte)
+            ]
+            return self.json({"type": "list", "items": items, "next_cursor": None})
+        if path.startswith("/payments/"):
+            payment_id = path.rsplit("/", 1)[1]
+            for payment in self.payments:
+                if payment["id"] == payment_id:
+                    return self.json(payment)
+        return Response(404, {}, b'{"code": "not_found", "description": "Not found"}')
+
+    @staticmethod
+    def json(data):
+        return Response(200, {}, json.dumps(data).encode())
+
+
+@pytest.fixture
+def api():
+    return FakeYooKassa()
+
+
+@pytest.fixture
+def engine(api):
+    client = YooKassa(api_key="key", shop_id=1, transport=api.transport)
+    return SyncEngine(client, SQLiteStore(), overlap=timedelta(0))
+
+
+class TestSyncEngine:
+    """Test SyncEngine."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_scans(self, engine, api):
+        """Test scans store objects and continue from the high-water mark."""
+        assert await engine.sync_once() == 3
+        assert (
+            await engine.store.get_high_water_mark("payments")
+            == (START + timedelta(hours=2)).isoformat()
+        )
+
+        api.payments.append(payment_data(3))
+        assert await engine.sync_once() == 3
+
+        payment_requests = [
+            r for r in api.transport.requests if r.url.endswith("/payments")
+        ]
+        assert "created_at.gte" not in payment_requests[0].params
+        assert (
+            payment_requests[1].params["created_at.gte"]
+            == (START + timedelta(hours=2)).isoformat()
+        )
+        assert [p.id for p in await engine.find_payments()] == ["p3", "p2", "p1"]
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_local(self, engine, api):
+        """Test mirrored objects are served without requests."""
+        await engine.sync_once()
+        requests = len(api.transport.requests)
+
+        payment = await engine.get_payment("p1")
+        found = await engine.find_payments(
+            status="succeeded", metadata={"order_id": "1"}
+        )
+        refunds = await engine.find_refunds(status="succeeded")
+
+        assert isinstance(payment, Payment)
+        assert payment.metadata == {"order_id": "1"}
+        assert [p.id for p in found] == ["p1"]
+        assert [r.id for r in refunds] == ["r1"]
+        assert len(api.transport.requests) == requests
+
+    @pytest.mark.asyncio
+    async def test_missing_objects_are_fetched(self, engine, api):
+        """Test lookup misses fall back to the API and are stored."""
+        assert await engine.get_payment("p2", fetch=False) is None
+
+        payment = await engine.get_payment("p2")
+
+        assert payment.id == "p2"
+        assert await engine.store.get("payments", "p2") is not None
+
+    @pytest.mark.asyncio
+    async def test_webhooks_update_mirror(self, engine):
+        """Test notifications of the attached handler are stored."""
+        handler = WebhookHandler()
+        engine.attach(handler)
+        notification = handler.parse_notification(
+            {
+                "type": "notification",
+                "event": "payment.canceled",
+                "object": payment_data(5, status="canceled", merchant_customer_id="c1"),
+            }
+        )
+
+        await handler.handle_notification(notification)
+
+        payments = await engine.find_payments(merchant_customer_id="c1")
+        assert [(p.id, p.status) for p in payments] == [("p5", "canceled")]
+
+    def test_payouts_cannot_be_scanned(self, api):
+        """Test only listable kinds are scanned."""
+        client = YooKassa(api_key="key", shop_id=1, transport=api.transport)
+        with pytest.raises(ValueError):
+            SyncEngine(client, kinds=["payouts"])
@@ -0,0 +1,165 @@
+"""
+Tests for mirror stores.
+"""
+
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+from aioyookassa.sync.store import SQLiteStore
+
+
+def payment(index, status="succeeded", metadata=None, customer=None):
+    return {
+        "id": f"p{index}",
+        "status": status,
+        "created_at": f"2024-01-0{index}T00:00:00Z",
+        "metadata": metadata,
+        "merchant_customer_id": customer,
+    }
+
+
+@pytest_asyncio.fixture
+async def store():
+    store = SQLiteStore()
+    await store.upsert(
+        "payments",
+        [
+            payment(1, metadata={"order_id": "1", "shop": "a"}, customer="c1"),
+            payment(2, status="canceled", metadata={"order_id": "2", "shop": "a"}),
+            payment(3, metadata={"order_id": 3, "shop": "b"}, customer="c1"),
+        ],
+    )
+    yield store
+    await store.close()
+
+
+class TestSQLiteStore:
+    """Test SQLiteStore."""
+
+    @pytest.mark.asyncio
+    async def test_get(self, store):
+        """Test lookup by id within a kind."""
+        assert (await store.get("payments", "p1"))["metadata"]["shop"] == "a"
+        assert await store.get("payments", "missing") is None
+        assert await store.get("refunds", "p1") is None
+
+    @pytest.mark.asyncio
+    async def test_find(self, store):
+        """Test lookups by indexed fields, newest first."""
+        ids = lambda rows: [row["id"] for row in rows]  # noqa: E731
+
+        assert ids(await store.find("payments")) == ["p3", "p2", "p1"]
+        assert ids(await store.find("payments", status="succeeded")) == ["p3", "p1"]
+        assert ids(await store.find("payments", metadata={"shop": "a"})) == [
+            "p2",
+            "p1",
+        ]
+        assert ids(
+            await store.find("payments", metadata={"shop": "b", "order_id": "3"})
+        ) == ["p3"]
+        assert ids(await store.find("payments", merchant_customer_id="c1")) == [
+            "p3",
+            "p1",
+        ]
+        assert ids(await store.find("payments", status="succeeded", limit=1)) == ["p3"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_replaces_object_and_metadata(self, store):
+        """Test upsert replaces the stored object and its metadata index."""
+        await store.upsert("payments", [payment(1, metadata={"shop": "c"})])
+
+        assert await store.find("payments", metadata={"shop": "a"}) != []
+        assert [
+            row["id"] for row in await store.find("payments", metadata={"shop": "c"})
+        ] == ["p1"]
+        assert await store.find("payments", metadata={"order_id": "1"}) == []
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshots_are_skipped(self, store):
+        """Test snapshots with an earlier status do not replace newer ones."""
+        await store.upsert("payments", [payment(4, status="pending")])
+        await store.upsert(
+            "payments", [payment(4, status="succeeded", metadata={"shop": "d"})]
+        )
+        await store.upsert(
+            "payments",
+            [
+                payment(4, status="waiting_for_capture", metadata={"shop": "e"}),
+                payment(2, status="pending"),
+            ],
+        )
+
+        stored = await store.get("payments", "p4")
+        assert stored["status"] == "succeeded"
+        assert stored["metadata"] == {"shop": "d"}
+        assert await store.find("payments", metadata={"shop": "e"}) == []
+        assert (await store.get("payments", "p2"))["status"] == "canceled"
+
+        # Snapshots of the same status still update the object
+        refunded = payment(4, status="succeeded", metadata={"shop": "f"})
+        await store.upsert("payments", [refunded])
+        assert await store.get("payments", "p4") == refunded
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshots_of_same_status_are_skipped(self, store):
+        """Test a snapshot from before a refund does not replace a newer one."""
+        refunded = {
+            **payment(4, metadata={"shop": "d"}),
+            "refunded_amount": {"value": "10.50", "currency": "RUB"},
+        }
+        await store.upsert("payments", [refunded])
+        await store.upsert(
+            "payments",
+            [
+                {
+                    **payment(4, metadata={"shop": "e"}),
+                    "refunded_amount": {"value": "0.00", "currency": "RUB"},
+                }
+            ],
+        )
+
+        assert await store.get("payments", "p4") == refunded
+        assert await store.find("payments", metadata={"shop": "e"}) == []
+
+        # A later refund replaces the object again
+        refunded_again = {
+            **refunded,
+            "refunded_amount": {"value": "20.00", "currency": "RUB"},
+        }
+        await store.upsert("payments", [refunded_again])
+        assert await store.get("payments", "p4") == refunded_again
+
+    @pytest.mark.asyncio
+    async def test_adds_refunded_value_to_existing_database(self, tmp_path):
+        """Test databases created without the refunded_value column still work."""
+        path = str(tmp_path / "mirror.sqlite3")
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            SQLiteStore._SCHEMA.replace("refunded_value REAL NOT NULL DEFAULT 0,", "")
+        )
+        connection.close()
+
+        store = SQLiteStore(path)
+        columns = [
+            row[1] for row in store._connection.execute("PRAGMA table_info(objects)")
+        ]
+        await store.upsert("payments", [payment(1)])
+        stored = await store.get("payments", "p1")
+        await store.close()
+
+        assert columns[-1] == "refunded_value"
+        assert stored == payment(1)
+
+    @pytest.mark.asyncio
+    async def test_high_water_mark(self, store):
+        """Test high-water mark is stored per kind."""
+        assert await store.get_high_water_mark("payments") is None
+
+        await store.set_high_water_mark("payments", "2024-01-03T00:00:00+00:00")
+
+        assert (
+            await store.get_high_water_mark("payments") == "2024-01-03T00:00:00+00:00"
+        )
+        assert await store.get_high_water_mark("refunds") is None
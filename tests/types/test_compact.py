@@ -0,0 +1,139 @@
+"""
+Tests for compact read-only objects.
+"""
+
+import pickle
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aioyookassa.core.abc.client import BaseAPIClient
+from aioyookassa.core.api.payments import PaymentsAPI
+from aioyookassa.core.webhook_handler import WebhookHandler
+from aioyookassa.types.compact import CompactModel, compact_class, to_compact
+from aioyookassa.types.payment import CardInfo, Payment, PaymentsList
+from aioyookassa.types.refund import Refund
+from aioyookassa.types.webhook_notification import WebhookNotification
+
+
+class TestCompactModel:
+    """Test compact classes and objects."""
+
+    def test_classes_are_cached_and_slotted(self):
+        """Test compact classes are generated once per model."""
+        cls = compact_class(Payment)
+        assert compact_class(Payment) is cls
+        assert cls.__name__ == "CompactPayment"
+        assert cls.model is Payment
+        assert set(cls.__slots__) == set(Payment.model_fields)
+
+    def test_from_data(self, sample_api_response):
+        """Test values, nested objects and aliases."""
+        payment = to_compact(Payment, sample_api_response)
+
+        assert not hasattr(payment, "__dict__")
+        assert payment.id == "payment_123456789"
+        assert payment.status == "succeeded"
+        assert payment.created_at == "2023-01-01T00:00:00.000Z"
+        assert payment.captured_at is None
+        assert isinstance(
+            payment.amount, compact_class(Payment.model_fields["amount"].annotation)
+        )
+        assert payment.amount.value == 100.50
+        card = payment.payment_method.card
+        assert isinstance(card, compact_class(CardInfo))
+        # Attributes are named like the model fields, not the API keys
+        assert card.last_four == "1234"
+
+    def test_nested_lists(self):
+        """Test lists of nested objects."""
+        refund = to_compact(
+            Refund,
+            {
+                "id": "refund_1",
+                "payment_id": "payment_1",
+                "status": "succeeded",
+                "amount": {"value": "10.00", "currency": "RUB"},
+                "created_at": "2024-01-01T00:00:00.000Z",
+                "sources": [
+                    {"account_id": "1", "amount": {"value": "5.00", "currency": "RUB"}}
+                ],
+            },
+        )
+        assert refund.sources[0].account_id == "1"
+        assert refund.sources[0].amount.value == "5.00"
+
+    def test_enum_values_are_interned(self, sample_api_response):
+        """Test repeated enum values share one string."""
+        first = to_compact(Payment, sample_api_response)
+        second = to_compact(
+            Payment, dict(sample_api_response, status="".join("succeeded"))
+        )
+        assert first.status is second.status is sys.intern("succeeded")
+
+    def test_read_only(self, sample_api_response):
+        """Test compact objects cannot be changed."""
+        payment = to_compact(Payment, sample_api_response)
+        with pytest.raises(AttributeError):
+            payment.status = "canceled"
+        with pytest.raises(AttributeError):
+            del payment.status
+        with pytest.raises(AttributeError):
+            payment.unknown = 1
+
+    def test_to_model(self, sample_api_response):
+        """Test conversion to the full model."""
+        payment = to_compact(Payment, sample_api_response)
+        model = payment.to_model()
+        assert model == Payment(**sample_api_response)
+
+    def test_to_dict(self, sample_api_response):
+        """Test conversion to API notation."""
+        payment = to_compact(Payment, sample_api_response)
+        assert payment.to_dict() == sample_api_response
+
+    def test_equality_and_pickle(self, sample_api_response):
+        """Test compact objects compare by value and can be pickled."""
+        payment = to_compact(Payment, sample_api_response)
+        assert payment == to_compact(Payment, sample_api_response)
+        assert payment != to_compact(Payment, dict(sample_api_response, id="other"))
+        restored = pickle.loads(pickle.dumps(payment))
+        assert restored == payment
+        assert "id='payment_123456789'" in repr(payment)
+
+
+class TestCompactResults:
+    """Test compact results of list methods and webhooks."""
+
+    @pytest.mark.asyncio
+    async def test_list_method(self, sample_api_response):
+        """Test list methods return compact items on request."""
+        client = MagicMock(spec=BaseAPIClient)
+        client._send_request = AsyncMock(
+            return_value={"items": [sample_api_response], "next_cursor": "abc"}
+        )
+        api = PaymentsAPI(client)
+
+        result = await api.get_payments({"limit": 1}, compact=True)
+
+        assert isinstance(result, PaymentsList)
+        assert result.next_cursor == "abc"
+        assert isinstance(result.list[0], CompactModel)
+        assert result.list[0].id == "payment_123456789"
+        assert isinstance((await api.get_payments()).list[0], Payment)
+
+    @pytest.mark.asyncio
+    async def test_webhook_handler(self, sample_api_response):
+        """Test webhook handler passes compact objects to callbacks."""
+        handler = WebhookHandler(compact=True)
+        received = []
+        handler.add_callback("payment.succeeded", received.append)
+        notification = WebhookNotification(
+            type="notification", event="payment.succeeded", object=sample_api_response
+        )
+
+        result = await handler.handle_notification(notification)
+
+        assert received == [result]
+        assert isinstance(result, compact_class(Payment))
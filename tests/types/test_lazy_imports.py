@@ -0,0 +1,59 @@
+"""
+Tests for lazy imports of packages.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import aioyookassa.core.api
+import aioyookassa.core.methods
+import aioyookassa.types
+from aioyookassa.types.base import YooKassaModel
+from aioyookassa.types.payment import Payment
+
+
+class TestLazyImports:
+    """Test PEP 562 exports of the packages."""
+
+    @pytest.mark.parametrize(
+        "package", [aioyookassa.types, aioyookassa.core.api, aioyookassa.core.methods]
+    )
+    def test_exports(self, package):
+        """Test every exported name resolves and is listed by dir()."""
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+        with pytest.raises(AttributeError):
+            package.Unknown
+
+    def test_exports_are_cached(self):
+        """Test a resolved name is stored in the package namespace."""
+        value = aioyookassa.core.methods.GetMe
+        assert vars(aioyookassa.core.methods)["GetMe"] is value
+
+    def test_aliases(self):
+        """Test exports under another name."""
+        from aioyookassa.types import SafeDeal
+        from aioyookassa.types.deals import Deal
+
+        assert SafeDeal is Deal
+
+    def test_import_does_not_load_api_modules(self):
+        """Test importing the client does not import APIs and most types."""
+        code = (
+            "import sys, aioyookassa; "
+            "print(sorted(m for m in sys.modules if m.startswith('aioyookassa.')))"
+        )
+        modules = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert "aioyookassa.core.api.payments" not in modules
+        assert "aioyookassa.types.params" not in modules
+        assert "aioyookassa.core.methods.payouts" not in modules
+
+    def test_models_defer_schema_building(self):
+        """Test model schemas are built on first validation."""
+        assert YooKassaModel.model_config["defer_build"] is True
+        assert issubclass(Payment, YooKassaModel)
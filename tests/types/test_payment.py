@@ -64,7 +64,7 @@ class TestPaymentAmount:
     def test_payment_amount_with_string(self):
         """Test PaymentAmount with string value."""
         amount = PaymentAmount(value="100.00", currency=Currency.EUR)
-        assert amount.value == "100.00"
+        assert amount.value == Decimal("100.00")
         assert amount.currency == Currency.EUR
 
     def test_payment_amount_with_decimal(self):
@@ -85,6 +85,45 @@ class TestPaymentAmount:
         assert amount.value == 100
         assert amount.currency == "USD"
 
+    def test_payment_amount_is_quantized(self):
+        """Test values are Decimals with the digits of the currency."""
+        assert str(PaymentAmount(value=100).value) == "100.00"
+        assert str(PaymentAmount(value="1e2").value) == "100.00"
+        # Floats are rounded, exact values must fit the currency
+        assert str(PaymentAmount(value=0.1 + 0.2).value) == "0.30"
+        assert str(PaymentAmount(value=1.005).value) == "1.01"
+        with pytest.raises(ValidationError):
+            PaymentAmount(value="1.005")
+
+    def test_payment_amount_serialization(self):
+        """Test values are serialized to JSON as canonical strings."""
+        amount = PaymentAmount(value=100.5)
+        assert amount.model_dump(mode="json") == {"value": "100.50", "currency": "RUB"}
+        assert amount.model_dump()["value"] == Decimal("100.50")
+
+    def test_payment_amount_arithmetic(self):
+        """Test adding, subtracting and comparing amounts."""
+        first = PaymentAmount(value="10.50")
+        second = PaymentAmount(value="0.25")
+        assert first + second == PaymentAmount(value="10.75")
+        assert first - second == PaymentAmount(value="10.25")
+        assert sum([first, second]) == PaymentAmount(value="10.75")
+        assert second < first <= first
+        assert first > second >= second
+        with pytest.raises(ValueError):
+            first + PaymentAmount(value=1, currency=Currency.USD)
+        with pytest.raises(ValueError):
+            first < PaymentAmount(value=1, currency=Currency.USD)
+
+    def test_payment_amount_sum(self):
+        """Test summing amounts."""
+        amounts = [PaymentAmount(value="0.10"), None, PaymentAmount(value="0.20")]
+        assert PaymentAmount.sum(amounts) == PaymentAmount(value="0.30")
+        assert PaymentAmount.sum([]) == PaymentAmount(value=0)
+        assert PaymentAmount.sum([], currency=Currency.USD).currency == Currency.USD
+        with pytest.raises(ValueError):
+            PaymentAmount.sum(amounts, currency=Currency.USD)
+
 
 class TestCardInfo:
     """Test CardInfo model."""
@@ -397,7 +436,7 @@ class TestTransfer:
             "platform_fee_amount": {"value": "5.00", "currency": "RUB"},
         }
         transfer = Transfer(**transfer_data)
-        assert transfer.fee_amount.value == "5.00"
+        assert transfer.fee_amount.value == Decimal("5.00")
 
 
 class TestSettlement: